@@ -0,0 +1,76 @@
+"""
+Allocation benchmark for encrypting and decrypting secret values.
+
+Compares the copying implementation (`_pad` + `encrypt_aes`, `_decrypt_aes`) with
+the buffer based one (`encrypt_into`, `decrypt_into` into a reused buffer) and
+reports the bytes allocated per value as measured by tracemalloc.
+
+Usage:
+    python benchmarks/bench_decrypt.py [--runs N]
+"""
+
+import argparse
+import os
+import tracemalloc
+from collections.abc import Callable
+
+from bws_sdk.crypto import EncryptedValue, SymmetricCryptoKey
+
+SIZES = [64, 4 * 1024, 256 * 1024, 1024 * 1024]
+
+
+def allocated(func: Callable[[], object], runs: int) -> tuple[float, float]:
+    """Return the mean bytes allocated and the peak per call of func."""
+    func()  # warm up imports and caches
+    tracemalloc.start()
+    total = 0
+    peak = 0
+    for _ in range(runs):
+        tracemalloc.reset_peak()
+        before = tracemalloc.get_traced_memory()[0]
+        result = func()
+        current, run_peak = tracemalloc.get_traced_memory()
+        total += current - before
+        peak = max(peak, run_peak - before)
+        del result
+    tracemalloc.stop()
+    return total / runs, peak
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=20)
+    args = parser.parse_args()
+
+    key = SymmetricCryptoKey(os.urandom(64))
+    iv = os.urandom(16)
+
+    print(f"{'operation':<28} {'size':>9} {'retained':>12} {'peak':>12}")
+    for size in SIZES:
+        plaintext = os.urandom(size)
+        value = EncryptedValue.from_str(
+            EncryptedValue.from_data(key, "x" * size).to_str()
+        )
+        buffer = bytearray(EncryptedValue.buffer_size(size + 16))
+
+        def decrypt_into() -> None:
+            with value.decrypt_into(key, buffer):
+                pass
+
+        cases = {
+            "encrypt (copying)": lambda: EncryptedValue.encrypt_aes(
+                key.key, EncryptedValue._pad(plaintext), iv
+            ),
+            "encrypt_into": lambda: EncryptedValue.encrypt_into(
+                key.key, plaintext, iv, buffer
+            ),
+            "decrypt (copying)": lambda: value._decrypt_aes(key.key),
+            "decrypt_into (reused)": decrypt_into,
+        }
+        for label, func in cases.items():
+            retained, peak = allocated(func, args.runs)
+            print(f"{label:<28} {size:>9} {retained:>12.0f} {peak:>12}")
+
+
+if __name__ == "__main__":
+    main()
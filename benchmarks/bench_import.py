@@ -0,0 +1,62 @@
+"""
+Import time benchmark for the BWS SDK.
+
+Measures the wall time of importing the package and of resolving the client in a
+fresh interpreter, and reports which heavy dependencies each step loads.
+
+Usage:
+    python benchmarks/bench_import.py [--runs N]
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+
+HEAVY_MODULES = ["cryptography", "jwt", "pydantic", "requests"]
+
+STATEMENTS = {
+    "python (baseline)": "pass",
+    "import bws_sdk": "import bws_sdk",
+    "from bws_sdk import BWSSDKError": "from bws_sdk import BWSSDKError",
+    "from bws_sdk import Region": "from bws_sdk import Region",
+    "from bws_sdk import BWSecretClient": "from bws_sdk import BWSecretClient",
+}
+
+
+def measure(statement: str) -> tuple[float, list[str]]:
+    code = (
+        "import json, sys, time\n"
+        "start = time.perf_counter()\n"
+        f"{statement}\n"
+        "elapsed = time.perf_counter() - start\n"
+        f"loaded = [m for m in {HEAVY_MODULES!r} if m in sys.modules]\n"
+        "print(json.dumps([elapsed, loaded]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    elapsed, loaded = json.loads(result.stdout)
+    return elapsed, loaded
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    print(f"{'statement':<40} {'median ms':>10}  heavy modules loaded")
+    for label, statement in STATEMENTS.items():
+        timings = []
+        loaded: list[str] = []
+        for _ in range(args.runs):
+            elapsed, loaded = measure(statement)
+            timings.append(elapsed * 1000)
+        print(
+            f"{label:<40} {statistics.median(timings):>10.1f}  {', '.join(loaded) or '-'}"
+        )
+
+
+if __name__ == "__main__":
+    main()
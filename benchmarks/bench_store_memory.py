@@ -0,0 +1,80 @@
+"""
+Memory benchmark for holding many decrypted secrets.
+
+Compares the memory per secret of a dict of `BitwardenSecret` models, as held by
+`SecretStore`, with a `CompactSecretTable`, as measured by tracemalloc. Secrets
+have UUID ids, one project and a short key and value, like a typical organization.
+
+Usage:
+    python benchmarks/bench_store_memory.py [--count N] [--value-size BYTES]
+"""
+
+import argparse
+import tracemalloc
+import uuid
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+
+from bws_sdk.bws_types import BitwardenSecret
+from bws_sdk.compact import CompactSecretTable
+
+
+def make_secrets(count: int, value_size: int) -> list[BitwardenSecret]:
+    org_id = str(uuid.uuid4())
+    projects = [str(uuid.uuid4()) for _ in range(10)]
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    # Built from JSON-like data, as the client does, so no strings are shared
+    return [
+        BitwardenSecret.model_validate(
+            {
+                "id": str(uuid.uuid4()),
+                "organizationId": "".join(org_id),
+                "key": f"SERVICE_{i}_PASSWORD",
+                "value": uuid.uuid4().hex * (value_size // 32 + 1),
+                "creationDate": start + timedelta(seconds=i),
+                "revisionDate": start + timedelta(seconds=2 * i),
+                "projects": [{"id": "".join(projects[i % 10])}],
+            }
+        )
+        for i in range(count)
+    ]
+
+
+def measure(build: Callable[[], object]) -> int:
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    held = build()
+    size = tracemalloc.get_traced_memory()[0] - before
+    tracemalloc.stop()
+    del held
+    return size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--count", type=int, default=100_000)
+    parser.add_argument("--value-size", type=int, default=32)
+    args = parser.parse_args()
+
+    data = {}
+
+    def models() -> dict[str, BitwardenSecret]:
+        data["secrets"] = make_secrets(args.count, args.value_size)
+        return {secret.id: secret for secret in data["secrets"]}
+
+    model_bytes = measure(models)
+    secrets = data.pop("secrets")
+    table_bytes = measure(lambda: CompactSecretTable(secrets))
+
+    print(f"{args.count} secrets, values of {args.value_size} bytes")
+    for label, size in (
+        ("dict of BitwardenSecret", model_bytes),
+        ("CompactSecretTable", table_bytes),
+    ):
+        print(
+            f"{label:<26} {size / 2**20:>8.1f} MiB {size / args.count:>8.0f} B/secret"
+        )
+
+
+if __name__ == "__main__":
+    main()
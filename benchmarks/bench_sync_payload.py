@@ -0,0 +1,98 @@
+"""
+Compression and JSON decoding benchmark for sync response bodies.
+
+Builds the body of a sync response for an organization of N secrets with really
+encrypted keys and values, and reports its size uncompressed, with gzip and with
+brotli (if the brotli package is installed) at the levels commonly used by web
+servers, followed by the time taken to parse it with the stdlib decoder and with
+orjson (if installed).
+
+Usage:
+    python benchmarks/bench_sync_payload.py [--secrets N] [--value-size N] [--runs N]
+"""
+
+import argparse
+import gzip
+import json
+import os
+import time
+import uuid
+from collections.abc import Callable
+from typing import Any
+
+from bws_sdk.crypto import EncryptedValue, SymmetricCryptoKey
+
+
+def sync_body(count: int, value_size: int) -> bytes:
+    """Build a sync response body of count secrets with value_size byte values."""
+    key = SymmetricCryptoKey(os.urandom(64))
+    org_id = str(uuid.uuid4())
+    project_id = str(uuid.uuid4())
+    secrets = [
+        {
+            "id": str(uuid.uuid4()),
+            "organizationId": org_id,
+            "projectId": project_id,
+            "key": EncryptedValue.from_data(key, f"SECRET_KEY_{i}").to_str(),
+            "value": EncryptedValue.from_data(
+                key, os.urandom(value_size // 2).hex()
+            ).to_str(),
+            "note": EncryptedValue.from_data(key, "").to_str(),
+            "creationDate": "2024-01-01T00:00:00.000000Z",
+            "revisionDate": "2024-05-01T12:30:00.000000Z",
+            "projects": [{"id": project_id}],
+        }
+        for i in range(count)
+    ]
+    return json.dumps({"hasChanges": True, "secrets": {"data": secrets}}).encode()
+
+
+def best_of(func: Callable[[], Any], runs: int) -> float:
+    """Return the fastest of runs calls of func in seconds."""
+    best = float("inf")
+    for _ in range(runs):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--secrets", type=int, default=1000)
+    parser.add_argument("--value-size", type=int, default=64)
+    parser.add_argument("--runs", type=int, default=10)
+    args = parser.parse_args()
+
+    body = sync_body(args.secrets, args.value_size)
+    encodings = {"identity": body, "gzip (level 6)": gzip.compress(body, 6)}
+    try:
+        import brotli
+    except ImportError:
+        print("brotli is not installed, skipping br")
+    else:
+        encodings["br (quality 4)"] = brotli.compress(body, quality=4)
+        encodings["br (quality 11)"] = brotli.compress(body, quality=11)
+
+    print(f"{args.secrets} secrets, {args.value_size} byte values")
+    print(f"{'encoding':<18} {'bytes':>10} {'saved':>8}")
+    for label, data in encodings.items():
+        saved = 1 - len(data) / len(body)
+        print(f"{label:<18} {len(data):>10} {saved:>8.1%}")
+
+    decoders: dict[str, Callable[[bytes], Any]] = {"json": json.loads}
+    try:
+        import orjson
+    except ImportError:
+        print("orjson is not installed, skipping orjson")
+    else:
+        decoders["orjson"] = orjson.loads
+
+    print(f"{'decoder':<18} {'ms':>10}")
+    for label, loads in decoders.items():
+        seconds = best_of(lambda: loads(body), args.runs)
+        print(f"{label:<18} {seconds * 1000:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,257 @@
+"""
+Throughput and connection benchmark for the HTTP transports.
+
+Starts a local TLS stub server that answers `GET /secrets/<id>` like the BWS API,
+over HTTP/1.1 and over HTTP/2, and fetches secrets from it concurrently through a
+`requests.Session` (the default transport) and through `HTTP2Transport`. Reports the
+wall time, the requests per second and the number of TLS connections the server
+accepted. Every run starts with a fresh transport, so handshakes are included.
+
+Requires `pip install "httpx[http2]"`.
+
+Usage:
+    python benchmarks/bench_transport.py [--requests N] [--concurrency N] [--latency S]
+"""
+
+import argparse
+import datetime
+import heapq
+import json
+import select
+import socket
+import ssl
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Any
+
+import h2.config
+import h2.connection
+import h2.events
+import requests
+from cryptography import x509
+from cryptography.hazmat.primitives import hashes, serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+from cryptography.x509.oid import NameOID
+
+from bws_sdk.transport import HTTP2Transport
+
+BODY = json.dumps(
+    {
+        "id": "00000000-0000-0000-0000-000000000000",
+        "organizationId": "00000000-0000-0000-0000-000000000000",
+        "key": "2.AAAAAAAAAAAAAAAAAAAAAA==|" + "A" * 24 + "|" + "A" * 43 + "=",
+        "value": "2.AAAAAAAAAAAAAAAAAAAAAA==|" + "A" * 64 + "|" + "A" * 43 + "=",
+        "creationDate": "2024-01-01T00:00:00Z",
+        "revisionDate": "2024-01-01T00:00:00Z",
+        "projects": [],
+    }
+).encode()
+
+
+def make_certificate(directory: Path) -> tuple[Path, Path]:
+    """Write a self-signed certificate for localhost and its key."""
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(days=1))
+        .not_valid_after(now + datetime.timedelta(days=1))
+        .add_extension(
+            x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False
+        )
+        .add_extension(x509.BasicConstraints(ca=True, path_length=None), critical=True)
+        .sign(key, hashes.SHA256())
+    )
+    cert_path, key_path = directory / "cert.pem", directory / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(
+        key.private_bytes(
+            serialization.Encoding.PEM,
+            serialization.PrivateFormat.PKCS8,
+            serialization.NoEncryption(),
+        )
+    )
+    return cert_path, key_path
+
+
+def server_context(cert: Path, key: Path, protocol: str) -> ssl.SSLContext:
+    context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+    context.load_cert_chain(cert, key)
+    context.set_alpn_protocols([protocol])
+    return context
+
+
+class HTTP1Stub(ThreadingHTTPServer):
+    """HTTP/1.1 stub server with keep-alive, one thread per connection."""
+
+    daemon_threads = True
+
+    def __init__(self, context: ssl.SSLContext, latency: float):
+        self.context = context
+        self.latency = latency
+        self.connections = 0
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self) -> None:
+                time.sleep(stub.latency)
+                self.send_response(200)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(BODY)))
+                self.end_headers()
+                self.wfile.write(BODY)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        super().__init__(("localhost", 0), Handler)
+
+    def get_request(self) -> tuple[socket.socket, object]:
+        sock, address = super().get_request()
+        self.connections += 1
+        # The handshake happens on first read, in the connection's own thread
+        wrapped = self.context.wrap_socket(
+            sock, server_side=True, do_handshake_on_connect=False
+        )
+        return wrapped, address
+
+
+class HTTP2Stub:
+    """HTTP/2 stub server answering the streams of a connection concurrently."""
+
+    def __init__(self, context: ssl.SSLContext, latency: float):
+        self.context = context
+        self.latency = latency
+        self.connections = 0
+        self.socket = socket.create_server(("localhost", 0))
+        self.server_address = self.socket.getsockname()
+
+    def serve_forever(self) -> None:
+        while True:
+            try:
+                sock, _ = self.socket.accept()
+            except OSError:
+                return
+            self.connections += 1
+            threading.Thread(target=self._serve, args=(sock,), daemon=True).start()
+
+    def shutdown(self) -> None:
+        self.socket.close()
+
+    def _serve(self, raw: socket.socket) -> None:
+        # One thread per connection reads and writes the TLS socket, which must not
+        # be used from several threads at once; responses are delayed by a timer
+        try:
+            sock = self.context.wrap_socket(raw, server_side=True)
+        except (OSError, ssl.SSLError):
+            return
+        conn = h2.connection.H2Connection(h2.config.H2Configuration(client_side=False))
+        conn.initiate_connection()
+        sock.sendall(conn.data_to_send())
+        due: list[tuple[float, int]] = []
+        while True:
+            timeout = max(0.0, due[0][0] - time.monotonic()) if due else None
+            if sock.pending() or select.select([sock], [], [], timeout)[0]:
+                try:
+                    data = sock.recv(65536)
+                except OSError:
+                    return
+                if not data:
+                    return
+                for event in conn.receive_data(data):
+                    if isinstance(event, h2.events.RequestReceived):
+                        ready = time.monotonic() + self.latency
+                        heapq.heappush(due, (ready, event.stream_id))
+                    elif isinstance(event, h2.events.ConnectionTerminated):
+                        return
+            blocked = []
+            while due and due[0][0] <= time.monotonic():
+                ready, stream_id = heapq.heappop(due)
+                if conn.local_flow_control_window(stream_id) < len(BODY):
+                    # Wait for the client to open its flow control window
+                    blocked.append((ready, stream_id))
+                    continue
+                conn.send_headers(
+                    stream_id,
+                    [
+                        (":status", "200"),
+                        ("content-type", "application/json"),
+                        ("content-length", str(len(BODY))),
+                    ],
+                )
+                conn.send_data(stream_id, BODY, end_stream=True)
+            for item in blocked:
+                heapq.heappush(due, item)
+            sock.sendall(conn.data_to_send())
+            if blocked:
+                time.sleep(0.0005)
+
+
+def run(transport, url: str, count: int, concurrency: int) -> float:
+    """Fetch the URL count times from concurrency threads, return the seconds taken."""
+
+    def fetch(i: int) -> None:
+        response = transport.get(f"{url}/secrets/{i}")
+        response.raise_for_status()
+        response.json()
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(concurrency) as pool:
+        list(pool.map(fetch, range(count)))
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.005)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        cert, key = make_certificate(Path(directory))
+        servers = {
+            "requests (HTTP/1.1)": HTTP1Stub(
+                server_context(cert, key, "http/1.1"), args.latency
+            ),
+            "HTTP2Transport": HTTP2Stub(server_context(cert, key, "h2"), args.latency),
+        }
+        transports = {
+            "requests (HTTP/1.1)": requests.Session,
+            "HTTP2Transport": lambda: HTTP2Transport(verify=str(cert)),
+        }
+        print(
+            f"{args.requests} requests, concurrency {args.concurrency}, "
+            f"server latency {args.latency * 1000:.1f} ms"
+        )
+        print(f"{'transport':<22} {'seconds':>8} {'req/s':>8} {'connections':>12}")
+        for label, server in servers.items():
+            threading.Thread(target=server.serve_forever, daemon=True).start()
+            url = f"https://localhost:{server.server_address[1]}"
+            transport = transports[label]()
+            if isinstance(transport, requests.Session):
+                # Keep REQUESTS_CA_BUNDLE from overriding the stub's certificate
+                transport.trust_env = False
+                transport.verify = str(cert)
+            seconds = run(transport, url, args.requests, args.concurrency)
+            transport.close()
+            server.shutdown()
+            print(
+                f"{label:<22} {seconds:>8.2f} {args.requests / seconds:>8.0f} "
+                f"{server.connections:>12}"
+            )
+
+
+if __name__ == "__main__":
+    main()
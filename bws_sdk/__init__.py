@@ -10,12 +10,29 @@ for accessing secrets stored in Bitwarden's Secrets Manager.
 Classes:
     BWSecretClient: Main client for interacting with the BWS API
     BitwardenSecret: Data model representing a Bitwarden secret
+    BitwardenSyncDiff: Changes between two synchronised views of the secrets
+    CircuitBreaker: Fails requests fast while the BWS API is unavailable
+    ClientPool: Per access token client cache sharing connections per region
+    CompactSecretTable: Columnar, memory efficient mapping of secret ids to secrets
+    HTTP2Transport: Optional transport multiplexing requests over HTTP/2
+    HedgePolicy: Policy for hedging slow get_by_id requests
+    LoggingHooks: Instrumentation hooks that log every event
+    PrometheusHooks: Instrumentation hooks exposing Prometheus text format metrics
     Region: Configuration for BWS API regions
+    RegionMirror: Additional endpoint of a region used for failover
+    SDKHooks: Base class for instrumentation hooks
+    SecretCache: get_by_id cache revalidated with one sync request per interval
+    SecretProjection: Renders secrets into environment variables and files
+    SecretStore: Sync-driven in-memory secret store with change callbacks
+    SyncScheduler: Adaptive background poller for a SecretStore
 
 Exceptions:
     ApiError: Base class for API-related errors
     APIRateLimitError: Raised when API rate limits are exceeded
+    BatchError: Raised when a batch of secrets fails part way through
+    CircuitOpenError: Raised when a request is rejected by an open circuit breaker
     InvalidTokenError: Raised when authentication tokens are invalid
+    ProjectionError: Raised when secrets cannot be projected
     SecretNotFoundError: Raised when requested secrets are not found
     SecretParseError: Raised when secret data cannot be parsed
     SendRequestError: Raised when network requests fail
@@ -35,15 +52,19 @@ Example:
     ```
 """
 
-from .bws_types import BitwardenSecret, Region
-from .client import BWSecretClient
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from .errors import (
     ApiError,
     APIRateLimitError,
     AuthError,
+    BatchError,
     BWSSDKError,
+    CircuitOpenError,
     InvalidIdentityResponseError,
     InvalidTokenError,
+    ProjectionError,
     SecretNotFoundError,
     SecretParseError,
     SendRequestError,
@@ -51,19 +72,86 @@ from .errors import (
     UnauthorisedTokenError,
 )
 
+if TYPE_CHECKING:
+    from .breaker import CircuitBreaker
+    from .bws_types import BitwardenSecret, BitwardenSyncDiff, Region, RegionMirror
+    from .cache import SecretCache
+    from .client import BWSecretClient
+    from .compact import CompactSecretTable
+    from .hedging import HedgePolicy
+    from .hooks import LoggingHooks, PrometheusHooks, SDKHooks
+    from .pool import ClientPool
+    from .projection import SecretProjection
+    from .scheduler import SyncScheduler
+    from .store import SecretStore
+    from .transport import HTTP2Transport
+
+# Public names whose modules pull in heavy dependencies (pydantic, requests, ...)
+# are only imported when first accessed, keeping `import bws_sdk` cheap.
+_LAZY_ATTRS = {
+    "BWSecretClient": ".client",
+    "BitwardenSecret": ".bws_types",
+    "BitwardenSyncDiff": ".bws_types",
+    "CircuitBreaker": ".breaker",
+    "ClientPool": ".pool",
+    "CompactSecretTable": ".compact",
+    "HTTP2Transport": ".transport",
+    "HedgePolicy": ".hedging",
+    "LoggingHooks": ".hooks",
+    "PrometheusHooks": ".hooks",
+    "Region": ".bws_types",
+    "RegionMirror": ".bws_types",
+    "SDKHooks": ".hooks",
+    "SecretCache": ".cache",
+    "SecretProjection": ".projection",
+    "SecretStore": ".store",
+    "SyncScheduler": ".scheduler",
+}
+
+
+def __getattr__(name: str) -> Any:
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted([*globals(), *_LAZY_ATTRS])
+
+
 __all__ = [
     "APIRateLimitError",
     "ApiError",
     "AuthError",
     "BWSSDKError",
     "BWSecretClient",
+    "BatchError",
     "BitwardenSecret",
+    "BitwardenSyncDiff",
+    "CircuitBreaker",
+    "CircuitOpenError",
+    "ClientPool",
+    "CompactSecretTable",
+    "HTTP2Transport",
+    "HedgePolicy",
     "InvalidIdentityResponseError",
     "InvalidTokenError",
+    "LoggingHooks",
+    "ProjectionError",
+    "PrometheusHooks",
     "Region",
+    "RegionMirror",
+    "SDKHooks",
+    "SecretCache",
     "SecretNotFoundError",
     "SecretParseError",
+    "SecretProjection",
+    "SecretStore",
     "SendRequestError",
+    "SyncScheduler",
     "UnauthorisedError",
     "UnauthorisedTokenError",
 ]
@@ -0,0 +1,156 @@
+"""
+Circuit breaker for requests to the BWS API.
+
+This module provides a circuit breaker that `BWSecretClient` consults before every
+request. When the API keeps failing, the breaker opens and requests fail
+immediately with `CircuitOpenError` instead of waiting for network timeouts. After a
+cooldown a limited number of probe requests are let through to find out whether the
+API has recovered.
+
+Classes:
+    CircuitBreaker: Thread-safe closed / open / half-open circuit breaker
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+
+from .errors import CircuitOpenError
+
+logger = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """
+    Fail fast while the BWS API is unavailable.
+
+    The breaker starts closed. Every network error or 5xx response counts as a
+    failure and any other response resets the count. After `failure_threshold`
+    consecutive failures the breaker opens and rejects requests for `cooldown`
+    seconds. It then becomes half-open and lets up to `half_open_probes` concurrent
+    requests through. A successful probe closes the breaker, a failed one opens it
+    for another cooldown.
+
+    A breaker can be shared by several clients talking to the same region.
+
+    Attributes:
+        failure_threshold (int): Consecutive failures that open the breaker
+        cooldown (float): Seconds the breaker stays open before probing
+        half_open_probes (int): Concurrent probe requests allowed while half-open
+
+    Example:
+        ```python
+        breaker = CircuitBreaker(failure_threshold=5, cooldown=30)
+        client = BWSecretClient(region, access_token, circuit_breaker=breaker, serve_stale=True)
+        ```
+    """
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        cooldown: float = 30.0,
+        half_open_probes: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the CircuitBreaker.
+
+        Args:
+            failure_threshold (int): Consecutive failures that open the breaker
+            cooldown (float): Seconds the breaker stays open before probing
+            half_open_probes (int): Concurrent probe requests allowed while half-open
+            clock (Callable[[], float]): Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If any of the input parameters are out of range
+        """
+        if failure_threshold < 1:
+            raise ValueError("Failure threshold must be at least 1")
+        if cooldown <= 0:
+            raise ValueError("Cooldown must be positive")
+        if half_open_probes < 1:
+            raise ValueError("Half-open probes must be at least 1")
+
+        self.failure_threshold = failure_threshold
+        self.cooldown = cooldown
+        self.half_open_probes = half_open_probes
+        self._clock = clock
+        self._state = self.CLOSED
+        self._failures = 0
+        self._opened_at = 0.0
+        self._probes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def state(self) -> str:
+        """
+        Get the current state of the breaker.
+
+        Returns:
+            str: One of CLOSED, OPEN or HALF_OPEN
+        """
+        with self._lock:
+            if self._state == self.OPEN and self._cooled_down():
+                return self.HALF_OPEN
+            return self._state
+
+    def _cooled_down(self) -> bool:
+        return self._clock() - self._opened_at >= self.cooldown
+
+    def before_request(self) -> None:
+        """
+        Admit a request or reject it while the breaker is open.
+
+        Every admitted request must be followed by a call to `record_success`
+        or `record_failure`.
+
+        Raises:
+            CircuitOpenError: If the breaker is open, or half-open with all probes in use
+        """
+        with self._lock:
+            if self._state == self.CLOSED:
+                return
+            if self._state == self.OPEN:
+                if not self._cooled_down():
+                    raise CircuitOpenError(
+                        "Circuit breaker is open, the BWS API is failing"
+                    )
+                self._state = self.HALF_OPEN
+                self._probes = 0
+            if self._probes >= self.half_open_probes:
+                raise CircuitOpenError(
+                    "Circuit breaker is half-open, probe in progress"
+                )
+            self._probes += 1
+
+    def record_success(self) -> None:
+        """
+        Record a request that reached the API and was not a server error.
+        """
+        with self._lock:
+            if self._state != self.CLOSED:
+                logger.info("BWS API recovered, closing circuit breaker")
+            self._state = self.CLOSED
+            self._failures = 0
+            self._probes = 0
+
+    def record_failure(self) -> None:
+        """
+        Record a request that failed with a network error or a server error.
+        """
+        with self._lock:
+            self._failures += 1
+            if self._state == self.HALF_OPEN or (
+                self._state == self.CLOSED and self._failures >= self.failure_threshold
+            ):
+                logger.warning(
+                    "BWS API failing, opening circuit breaker for %.1fs", self.cooldown
+                )
+                self._state = self.OPEN
+                self._opened_at = self._clock()
+                self._probes = 0
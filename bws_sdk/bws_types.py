@@ -5,13 +5,30 @@ This module defines the core data structures used throughout the BWS SDK,
 including region configurations and secret representations.
 
 Classes:
+    RegionMirror: Additional API and identity endpoint of a region
     Region: Configuration for BWS API endpoints
+    BitwardenProject: Reference to the project a secret belongs to
     BitwardenSecret: Model representing a Bitwarden secret
+    BitwardenSyncDiff: Model describing how a set of secrets changed between syncs
 """
 
 from datetime import datetime
+from typing import Any
 
-from pydantic import BaseModel
+from pydantic import BaseModel, field_validator
+
+
+class RegionMirror(BaseModel):
+    """
+    Additional endpoint serving the same region, e.g. a replica of a self-hosted instance.
+
+    Attributes:
+        api_url (str): The base URL of the mirror's API endpoint
+        identity_url (str): The URL of the mirror's identity service
+    """
+
+    api_url: str
+    identity_url: str
 
 
 class Region(BaseModel):
@@ -21,9 +38,14 @@ class Region(BaseModel):
     This class defines the endpoints for a specific Bitwarden region,
     including the main API URL and the identity service URL used for authentication.
 
+    When mirrors are configured, the client sends API requests to the healthy
+    endpoint with the lowest measured latency and fails over to the other endpoints
+    on connection errors. Identity requests try the primary identity service first.
+
     Attributes:
         api_url (str): The base URL for the region's API endpoint
         identity_url (str): The URL for the region's identity service
+        mirrors (list[RegionMirror]): Additional endpoints serving the same region
 
     Example:
         ```python
@@ -36,6 +58,27 @@ class Region(BaseModel):
 
     api_url: str
     identity_url: str
+    mirrors: list[RegionMirror] = []
+
+    @property
+    def api_urls(self) -> list[str]:
+        """
+        Get the API URLs of the region, the primary first.
+
+        Returns:
+            list[str]: The base URLs of all API endpoints
+        """
+        return [self.api_url, *(mirror.api_url for mirror in self.mirrors)]
+
+    @property
+    def identity_urls(self) -> list[str]:
+        """
+        Get the identity service URLs of the region, the primary first.
+
+        Returns:
+            list[str]: The URLs of all identity services
+        """
+        return [self.identity_url, *(mirror.identity_url for mirror in self.mirrors)]
 
 
 class RatelimitInfo(BaseModel):
@@ -54,6 +97,17 @@ class RatelimitInfo(BaseModel):
     reset: datetime
 
 
+class BitwardenProject(BaseModel):
+    """
+    Model representing a reference to the project a secret belongs to.
+
+    Attributes:
+        id (str): Unique identifier for the project
+    """
+
+    id: str
+
+
 class BitwardenSecret(BaseModel):
     """
     Model representing a Bitwarden secret.
@@ -68,6 +122,8 @@ class BitwardenSecret(BaseModel):
         value (str): The secret's value (encrypted when retrieved, decrypted after processing)
         creationDate (datetime): When the secret was created
         revisionDate (datetime): When the secret was last modified
+        projects (list[BitwardenProject]): The projects the secret is associated with,
+            empty when the API returns none or null
 
     Note:
         The `key` and `value` fields are typically encrypted when first retrieved from the API
@@ -80,15 +136,61 @@ class BitwardenSecret(BaseModel):
     value: str
     creationDate: datetime
     revisionDate: datetime
+    projects: list[BitwardenProject] = []
+
+    @field_validator("projects", mode="before")
+    @classmethod
+    def _null_projects(cls, value: Any) -> Any:
+        # The API reports secrets without a project as "projects": null
+        return [] if value is None else value
 
 
 class BitwardenSecretRT(BitwardenSecret):
     ratelimit: RatelimitInfo
+    # True when served from the last known good copy because the API was unavailable
+    stale: bool = False
 
 
 class BitwardenSync(BaseModel):
+    """
+    Model describing the result of a sync.
+
+    Attributes:
+        secrets (list[BitwardenSecret] | None): The decrypted secrets, None if the
+            server reported no changes. For an incremental sync only the new and
+            revised secrets.
+        ratelimit (RatelimitInfo): Rate limit information from the response
+        unchanged (list[str]): For an incremental sync, ids of held secrets that
+            were returned with the same revision and were not decrypted again
+        removed (list[str]): For an incremental sync, ids of held secrets that are
+            no longer returned
+    """
+
     secrets: list[BitwardenSecret] | None
     ratelimit: RatelimitInfo
+    unchanged: list[str] = []
+    removed: list[str] = []
+
+
+class BitwardenSyncDiff(BaseModel):
+    """
+    Model describing the changes between two synchronised views of the secrets.
+
+    Secrets are matched by `id`; a secret is considered modified when its
+    `revisionDate` differs from the previously held copy.
+
+    Attributes:
+        added (list[BitwardenSecret]): Secrets that were not previously held
+        modified (list[BitwardenSecret]): Secrets whose revision changed, in their new state
+        removed (list[BitwardenSecret]): Secrets no longer returned, in their last known state
+    """
+
+    added: list[BitwardenSecret] = []
+    modified: list[BitwardenSecret] = []
+    removed: list[BitwardenSecret] = []
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.modified or self.removed)
 
 
 class BitwardenSecretCreate(BaseModel):
@@ -0,0 +1,240 @@
+"""
+Time-bounded caching of secrets looked up by id.
+
+This module provides a cache around `BWSecretClient.get_by_id` for services that
+read the same handful of secrets over and over. Cached entries can be revalidated
+either one by one, with a `get_by_id` request per expired entry, or all at once
+with a single `sync` request per interval that refreshes revised secrets and evicts
+deleted ones.
+
+Classes:
+    SecretCache: Cache of get_by_id results with per-entry or sync-based revalidation
+"""
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from typing import Literal
+
+from .bws_types import BitwardenSecret, BitwardenSyncDiff
+from .client import BWSecretClient
+from .errors import BWSSDKError
+
+logger = logging.getLogger(__name__)
+
+Revalidation = Literal["fetch", "sync"]
+
+
+class SecretCache:
+    """
+    Cache secrets looked up by id and keep them fresh with as few requests as possible.
+
+    With `revalidation="fetch"` every entry expires `ttl` seconds after it was
+    fetched and is fetched again with its own `get_by_id` request, so a cache of N
+    hot secrets sends up to N requests per interval.
+
+    With `revalidation="sync"` (the default) entries do not expire individually.
+    Instead, the first lookup after `ttl` seconds sends one `sync` request since the
+    previous revalidation, restricted to the cached ids. Secrets whose
+    `revisionDate` changed are replaced, secrets that no longer exist are evicted and
+    unchanged secrets are neither re-validated nor decrypted. If nothing changed on
+    the server, the response carries no secrets at all. A cache of N hot secrets
+    therefore needs one request per interval instead of N. If the sync request
+    fails, the cached secrets are served as they are and revalidation is retried
+    after another `ttl` seconds.
+
+    Attributes:
+        client (BWSecretClient): The client secrets are fetched with
+        ttl (float): Seconds after which cached secrets are revalidated
+        revalidation (str): "sync" or "fetch"
+        last_synced (datetime | None): Start of the last revalidation, or of the
+            first fetch if the cache was not revalidated yet
+
+    Example:
+        ```python
+        cache = SecretCache(client, ttl=30)
+        password = cache.get("550e8400-e29b-41d4-a716-446655440000").value
+        ```
+    """
+
+    def __init__(
+        self,
+        client: BWSecretClient,
+        ttl: float = 60.0,
+        revalidation: Revalidation = "sync",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the SecretCache.
+
+        Args:
+            client (BWSecretClient): The client secrets are fetched with
+            ttl (float): Seconds after which cached secrets are revalidated
+            revalidation (str): "sync" to revalidate all entries with one sync request,
+                "fetch" to fetch every expired entry again with get_by_id
+            clock (Callable[[], float]): Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If any of the input parameters are of incorrect type or out of range
+        """
+        if not isinstance(client, BWSecretClient):
+            raise ValueError("Client must be an instance of BWSecretClient")
+        if ttl <= 0:
+            raise ValueError("TTL must be positive")
+        if revalidation not in ("sync", "fetch"):
+            raise ValueError("Revalidation must be 'sync' or 'fetch'")
+
+        self.client = client
+        self.ttl = ttl
+        self.revalidation = revalidation
+        self.last_synced: datetime | None = None
+        self._clock = clock
+        self._entries: dict[str, tuple[float, BitwardenSecret]] = {}
+        self._revalidated_at = 0.0
+        self._lock = threading.Lock()
+        self._revalidate_lock = threading.Lock()
+
+    def get(self, secret_id: str) -> BitwardenSecret | None:
+        """
+        Get a secret from the cache, fetching or revalidating it if needed.
+
+        Secrets that are not found are not cached.
+
+        Args:
+            secret_id (str): The unique identifier (UUID) of the secret
+
+        Returns:
+            BitwardenSecret | None: The secret, or None if it does not exist
+
+        Raises:
+            ValueError: If the provided secret_id is not a string
+            SendRequestError: If the network request fails
+            UnauthorisedError: If the server returns a 401 Unauthorized response
+            ApiError: If the API returns a non-200 status code
+            SecretParseError: If a secret cannot be parsed or decrypted
+        """
+        if not isinstance(secret_id, str):
+            raise ValueError("Secret ID must be a string")
+
+        if self.revalidation == "sync" and self._is_due():
+            try:
+                self.revalidate()
+            except BWSSDKError as e:
+                with self._lock:
+                    self._revalidated_at = self._clock()
+                logger.warning(
+                    "Secret cache revalidation failed, retrying in %.1fs: %s",
+                    self.ttl,
+                    e,
+                )
+        with self._lock:
+            entry = self._entries.get(secret_id)
+        hit = entry is not None and (
+            self.revalidation == "sync" or self._clock() - entry[0] < self.ttl
+        )
+        hooks = self.client.hooks
+        if hooks is not None:
+            hooks.on_cache("get_by_id", hit)
+        if entry is not None and hit:
+            return entry[1]
+
+        started = datetime.now(timezone.utc)
+        fetched_at = self._clock()
+        secret = self.client.get_by_id(secret_id)
+        with self._lock:
+            if secret is None:
+                self._entries.pop(secret_id, None)
+                return None
+            self._entries[secret_id] = (fetched_at, secret)
+            if self.last_synced is None:
+                self._revalidated_at = fetched_at
+            if self.last_synced is None or started < self.last_synced:
+                # Changes made while this fetch raced a revalidation must be synced
+                self.last_synced = started
+        return secret
+
+    def _is_due(self) -> bool:
+        with self._lock:
+            return (
+                self.last_synced is not None
+                and self._clock() - self._revalidated_at >= self.ttl
+            )
+
+    def revalidate(self) -> BitwardenSyncDiff:
+        """
+        Refresh and evict cached secrets with one sync request.
+
+        Called automatically by `get` in "sync" mode, but can also be called directly,
+        e.g. from a background thread, to keep lookups off the network entirely.
+        Concurrent calls share a single request.
+
+        Returns:
+            BitwardenSyncDiff: The cached secrets that were replaced (`modified`) and
+                evicted (`removed`)
+
+        Raises:
+            SendRequestError: If the network request fails
+            UnauthorisedError: If the server returns a 401 Unauthorized response
+            ApiError: If the API returns a non-200 status code
+            SecretParseError: If a secret cannot be parsed or decrypted
+        """
+        if not self._revalidate_lock.acquire(blocking=False):
+            # Another thread is revalidating, wait for it to finish instead
+            with self._revalidate_lock:
+                return BitwardenSyncDiff()
+        try:
+            with self._lock:
+                since = self.last_synced
+                revisions = {
+                    sid: secret.revisionDate
+                    for sid, (_, secret) in self._entries.items()
+                }
+            if since is None or not revisions:
+                return BitwardenSyncDiff()
+            started = datetime.now(timezone.utc)
+            revalidated_at = self._clock()
+            sync = self.client.sync(
+                since, revisions=revisions, secret_ids=revisions.keys()
+            )
+
+            diff = BitwardenSyncDiff()
+            with self._lock:
+                self.last_synced = started
+                self._revalidated_at = revalidated_at
+                if sync.secrets is None:
+                    return diff
+                for secret in sync.secrets:
+                    if secret.id in self._entries:
+                        self._entries[secret.id] = (revalidated_at, secret)
+                        diff.modified.append(secret)
+                for sid in sync.removed:
+                    entry = self._entries.pop(sid, None)
+                    if entry is not None:
+                        diff.removed.append(entry[1])
+            return diff
+        finally:
+            self._revalidate_lock.release()
+
+    def invalidate(self, secret_id: str | None = None) -> None:
+        """
+        Drop one or all secrets from the cache.
+
+        Args:
+            secret_id (str | None): The secret to drop, or None to clear the cache
+        """
+        with self._lock:
+            if secret_id is None:
+                self._entries.clear()
+                self.last_synced = None
+            else:
+                self._entries.pop(secret_id, None)
+
+    def __contains__(self, secret_id: object) -> bool:
+        with self._lock:
+            return secret_id in self._entries
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
@@ -0,0 +1,484 @@
+"""
+Command-line interface for the BWS SDK.
+
+Credentials and region are taken from options or from the environment:
+
+- `BWS_ACCESS_TOKEN`: The machine account access token
+- `BWS_API_URL`, `BWS_IDENTITY_URL`: The region endpoints, defaulting to bitwarden.com
+- `BWS_STATE_FILE`: Optional state file, so that repeated invocations reuse the token
+- `BWS_CACHE_DIR`: Optional directory for the state file and an encrypted cache of
+  the synced secrets, so that repeated invocations only ask the server for changes
+
+Commands:
+    get: Print the value of a secret
+    list: Print the secrets of the organization or a project as JSON
+    sync: Print the secrets changed since a date as JSON
+    run: Run a command with secrets injected into its environment
+    project: Render secrets into environment variables and files with one request
+
+Functions:
+    main: Entry point of the command-line interface
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shlex
+import sys
+from collections.abc import Sequence
+from datetime import datetime, timezone
+from pathlib import Path
+
+from .bws_types import BitwardenSecret, Region
+from .client import BWSecretClient
+from .crypto import EncryptedValue
+from .errors import BWSSDKError, InvalidTokenError, ProjectionError
+from .projection import SecretProjection, write_atomic
+
+DEFAULT_API_URL = "https://api.bitwarden.com"
+DEFAULT_IDENTITY_URL = "https://identity.bitwarden.com"
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+_ENV_NAME = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _pair(value: str) -> tuple[str, str]:
+    reference, sep, target = value.partition("=")
+    if not sep or not reference or not target:
+        raise argparse.ArgumentTypeError(f"expected SECRET=TARGET, got {value!r}")
+    return reference, target
+
+
+def _date(value: str) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected an ISO 8601 date, got {value!r}")
+
+
+def _format_env(env: dict[str, str], fmt: str) -> str:
+    """
+    Format environment variables for output.
+
+    Args:
+        env (dict[str, str]): Variable names and values
+        fmt (str): "shell" for export statements, "dotenv" for a dotenv file,
+            "json" for a JSON object
+
+    Returns:
+        str: The formatted variables
+    """
+    if fmt == "json":
+        return json.dumps(env, indent=2, sort_keys=True) + "\n"
+    if fmt == "dotenv":
+        lines = [f"{name}={json.dumps(value)}" for name, value in sorted(env.items())]
+    else:
+        lines = [
+            f"export {name}={shlex.quote(value)}" for name, value in sorted(env.items())
+        ]
+    return "".join(f"{line}\n" for line in lines)
+
+
+def _build_client(args: argparse.Namespace) -> BWSecretClient:
+    """
+    Create an authenticated client from the common options.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments
+
+    Returns:
+        BWSecretClient: The client
+
+    Raises:
+        BWSSDKError: If no access token is configured or authentication fails
+        InvalidTokenError: If the access token is malformed
+    """
+    if not args.access_token:
+        raise BWSSDKError("No access token given, set BWS_ACCESS_TOKEN")
+    region = Region(api_url=args.api_url, identity_url=args.identity_url)
+    state_file = args.state_file
+    cache_dir = _cache_dir(args)
+    if state_file is None and cache_dir is not None:
+        cache_dir.mkdir(mode=0o700, parents=True, exist_ok=True)
+        state_file = str(cache_dir / f"{_fingerprint(args.access_token)}.state")
+    try:
+        return BWSecretClient(region, args.access_token, state_file)
+    except ValueError as e:
+        # Malformed tokens fail to unpack while being parsed
+        raise InvalidTokenError(f"Invalid access token: {e}") from e
+
+
+def _fingerprint(access_token: str) -> str:
+    return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+
+def _cache_dir(args: argparse.Namespace) -> Path | None:
+    return Path(args.cache_dir) if args.cache_dir else None
+
+
+def _read_cache(
+    path: Path, client: BWSecretClient
+) -> tuple[datetime, list[BitwardenSecret]] | None:
+    """
+    Read the synced secrets from the on-disk cache.
+
+    Args:
+        path (Path): The cache file
+        client (BWSecretClient): The client whose organization key encrypts the cache
+
+    Returns:
+        tuple[datetime, list[BitwardenSecret]] | None: When the cached secrets were
+            synced and the secrets, or None if there is no usable cache
+    """
+    try:
+        data = json.loads(
+            EncryptedValue.from_str(path.read_text()).decrypt(client.auth.org_enc_key)
+        )
+        return (
+            datetime.fromisoformat(data["last_synced"]),
+            [BitwardenSecret.model_validate(item) for item in data["secrets"]],
+        )
+    except (OSError, ValueError, KeyError, TypeError, BWSSDKError):
+        return None
+
+
+def _load_secrets(
+    args: argparse.Namespace, client: BWSecretClient
+) -> list[BitwardenSecret]:
+    """
+    Get all secrets of the organization, using the on-disk cache if configured.
+
+    With a cache, only the changes since the cached sync are requested, or no
+    request is sent at all while the cache is younger than `--max-age` seconds.
+    The cache is encrypted with the organization key, like the secrets on the server.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments
+        client (BWSecretClient): The client used to sync
+
+    Returns:
+        list[BitwardenSecret]: The decrypted secrets
+    """
+    cache_dir = _cache_dir(args)
+    if cache_dir is None:
+        return client.sync(_EPOCH).secrets or []
+
+    path = cache_dir / f"{_fingerprint(args.access_token)}.secrets"
+    cached = _read_cache(path, client)
+    started = datetime.now(timezone.utc)
+    if cached is not None and args.max_age is not None:
+        if (started - cached[0]).total_seconds() < args.max_age:
+            return cached[1]
+    sync = client.sync(cached[0] if cached is not None else _EPOCH)
+    if sync.secrets is not None:
+        secrets = sync.secrets
+    else:
+        secrets = cached[1] if cached is not None else []
+    payload = json.dumps(
+        {
+            "last_synced": started.isoformat(),
+            "secrets": _to_json(secrets),
+        }
+    )
+    write_atomic(
+        path,
+        EncryptedValue.from_data(client.auth.org_enc_key, payload).to_str().encode(),
+    )
+    return secrets
+
+
+def _filter_projects(
+    secrets: list[BitwardenSecret], project_ids: list[str]
+) -> list[BitwardenSecret]:
+    if not project_ids:
+        return secrets
+    return [
+        secret
+        for secret in secrets
+        if any(project.id in project_ids for project in secret.projects)
+    ]
+
+
+def _to_json(secrets: list[BitwardenSecret]) -> list[dict]:
+    return [secret.model_dump(mode="json") for secret in secrets]
+
+
+def _cmd_get(args: argparse.Namespace) -> int:
+    client = _build_client(args)
+    if _cache_dir(args) is None:
+        secret = client.get_by_id(args.secret_id)
+    else:
+        secret = next(
+            (s for s in _load_secrets(args, client) if s.id == args.secret_id), None
+        )
+    if secret is None:
+        print(f"bws-sdk: secret {args.secret_id} not found", file=sys.stderr)
+        return 1
+    if args.json:
+        print(secret.model_dump_json(indent=2, exclude={"ratelimit", "stale"}))
+    else:
+        print(secret.value)
+    return 0
+
+
+def _cmd_list(args: argparse.Namespace) -> int:
+    client = _build_client(args)
+    if len(args.project_id) == 1 and _cache_dir(args) is None:
+        secrets = client.list_by_project(args.project_id[0])
+    else:
+        secrets = _filter_projects(_load_secrets(args, client), args.project_id)
+    print(json.dumps(_to_json(secrets), indent=2))
+    return 0
+
+
+def _cmd_sync(args: argparse.Namespace) -> int:
+    client = _build_client(args)
+    since = args.since or _EPOCH
+    sync = client.sync(since, args.project_id or None)
+    print(
+        json.dumps(
+            {
+                "hasChanges": sync.secrets is not None,
+                "secrets": _to_json(sync.secrets or []),
+            },
+            indent=2,
+        )
+    )
+    return 0
+
+
+def _run_env(args: argparse.Namespace, client: BWSecretClient) -> dict[str, str]:
+    """
+    Build the environment variables injected by the run command.
+
+    Without --env mappings every secret of the selected projects is injected
+    under its key name; keys that are not valid variable names are skipped.
+
+    Args:
+        args (argparse.Namespace): The parsed command-line arguments
+        client (BWSecretClient): The client used to fetch the secrets
+
+    Returns:
+        dict[str, str]: Variable names and values
+
+    Raises:
+        ProjectionError: If a reference matches no secret, or a key name several
+    """
+    secrets = _filter_projects(_load_secrets(args, client), args.project_id)
+    if args.env:
+        return {
+            name: SecretProjection.resolve(reference, secrets).value
+            for reference, name in args.env
+        }
+    env: dict[str, str] = {}
+    for secret in secrets:
+        if not _ENV_NAME.fullmatch(secret.key):
+            print(f"bws-sdk: skipping secret key {secret.key!r}", file=sys.stderr)
+            continue
+        if secret.key in env:
+            raise ProjectionError(
+                f"Key {secret.key!r} is used by several secrets, map it with --env"
+            )
+        env[secret.key] = secret.value
+    return env
+
+
+def _cmd_run(args: argparse.Namespace) -> int:
+    command = args.cmd[1:] if args.cmd[:1] == ["--"] else args.cmd
+    if not command:
+        print("bws-sdk: no command given", file=sys.stderr)
+        return 2
+    injected = _run_env(args, _build_client(args))
+    env = dict(os.environ)
+    if args.no_overwrite:
+        injected = {k: v for k, v in injected.items() if k not in env}
+    env.update(injected)
+    # Replace this process so that signals reach the command directly
+    os.execvpe(command[0], command, env)
+
+
+def _cmd_project(args: argparse.Namespace) -> int:
+    env = dict(args.env)
+    files = dict(args.file)
+    project_ids = list(args.project_id)
+    if args.mapping:
+        with open(args.mapping) as f:
+            mapping = json.load(f)
+        env.update(mapping.get("env", {}))
+        files.update(mapping.get("files", {}))
+        project_ids.extend(mapping.get("project_ids", []))
+
+    projection = SecretProjection(env, files, project_ids or None)
+    result = projection.apply(_build_client(args))
+    output = _format_env(result.env, args.format)
+    if args.env_file:
+        write_atomic(args.env_file, output.encode("utf-8"))
+    elif result.env:
+        sys.stdout.write(output)
+    for path in result.written:
+        print(f"wrote {path}", file=sys.stderr)
+    return 0
+
+
+def _parser() -> argparse.ArgumentParser:
+    parser = argparse.ArgumentParser(
+        prog="bws-sdk", description="Access Bitwarden Secrets Manager secrets."
+    )
+    parser.add_argument(
+        "--access-token",
+        default=os.environ.get("BWS_ACCESS_TOKEN"),
+        help="machine account access token (default: $BWS_ACCESS_TOKEN)",
+    )
+    parser.add_argument(
+        "--api-url",
+        default=os.environ.get("BWS_API_URL", DEFAULT_API_URL),
+        help="API URL of the region (default: $BWS_API_URL or bitwarden.com)",
+    )
+    parser.add_argument(
+        "--identity-url",
+        default=os.environ.get("BWS_IDENTITY_URL", DEFAULT_IDENTITY_URL),
+        help="identity URL of the region (default: $BWS_IDENTITY_URL or bitwarden.com)",
+    )
+    parser.add_argument(
+        "--state-file",
+        default=os.environ.get("BWS_STATE_FILE"),
+        help="file the authentication state is kept in (default: $BWS_STATE_FILE)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        default=os.environ.get("BWS_CACHE_DIR"),
+        help="directory for the state file and an encrypted secrets cache "
+        "(default: $BWS_CACHE_DIR)",
+    )
+    parser.add_argument(
+        "--max-age",
+        type=float,
+        help="seconds the cached secrets are used without asking the server for changes",
+    )
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    get = commands.add_parser("get", help="print the value of a secret")
+    get.add_argument("secret_id", help="id of the secret")
+    get.add_argument(
+        "--json", action="store_true", help="print the whole secret as JSON"
+    )
+    get.set_defaults(handler=_cmd_get)
+
+    list_ = commands.add_parser("list", help="print secrets as JSON")
+    list_.add_argument(
+        "--project-id",
+        action="append",
+        default=[],
+        help="only list secrets of this project",
+    )
+    list_.set_defaults(handler=_cmd_list)
+
+    sync = commands.add_parser(
+        "sync", help="print secrets changed since a date as JSON"
+    )
+    sync.add_argument(
+        "--since", type=_date, help="ISO 8601 date of the last sync (default: all)"
+    )
+    sync.add_argument(
+        "--project-id",
+        action="append",
+        default=[],
+        help="only include secrets of this project",
+    )
+    sync.set_defaults(handler=_cmd_sync)
+
+    run = commands.add_parser(
+        "run",
+        help="run a command with secrets in its environment",
+        description=(
+            "Run a command with secrets injected into its environment, by default "
+            "every secret under its key name. Example: bws-sdk run -- ./server"
+        ),
+    )
+    run.add_argument(
+        "--env",
+        action="append",
+        type=_pair,
+        default=[],
+        metavar="SECRET=VAR",
+        help="only inject this secret, by id or key name, as this variable",
+    )
+    run.add_argument(
+        "--project-id",
+        action="append",
+        default=[],
+        help="only inject secrets of this project",
+    )
+    run.add_argument(
+        "--no-overwrite",
+        action="store_true",
+        help="keep variables that are already set in the environment",
+    )
+    run.add_argument("cmd", nargs=argparse.REMAINDER, help="-- command and arguments")
+    run.set_defaults(handler=_cmd_run)
+
+    project = commands.add_parser(
+        "project",
+        help="render secrets into environment variables and files",
+        description=(
+            "Fetch all referenced secrets with one request, write files atomically "
+            "if their contents changed and print the environment variables."
+        ),
+    )
+    project.add_argument(
+        "--env",
+        action="append",
+        type=_pair,
+        default=[],
+        metavar="SECRET=VAR",
+        help="project a secret, by id or key name, into an environment variable",
+    )
+    project.add_argument(
+        "--file",
+        action="append",
+        type=_pair,
+        default=[],
+        metavar="SECRET=PATH",
+        help="project a secret, by id or key name, into a file",
+    )
+    project.add_argument(
+        "--mapping",
+        help='JSON file of the form {"env": {...}, "files": {...}, "project_ids": [...]}',
+    )
+    project.add_argument(
+        "--project-id",
+        action="append",
+        default=[],
+        help="only look secrets up in this project",
+    )
+    project.add_argument(
+        "--format",
+        choices=["shell", "dotenv", "json"],
+        default="shell",
+        help="format of the environment variables (default: shell)",
+    )
+    project.add_argument(
+        "--env-file", help="write the environment variables to this file"
+    )
+    project.set_defaults(handler=_cmd_project)
+    return parser
+
+
+def main(argv: Sequence[str] | None = None) -> int:
+    """
+    Run the command-line interface.
+
+    Args:
+        argv (Sequence[str] | None): The arguments, defaults to `sys.argv[1:]`
+
+    Returns:
+        int: The exit status, 0 on success and 1 if an error occurred
+    """
+    args = _parser().parse_args(argv)
+    try:
+        return args.handler(args)
+    except (BWSSDKError, OSError, ValueError) as e:
+        print(f"bws-sdk: {e}", file=sys.stderr)
+        return 1
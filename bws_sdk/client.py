@@ -9,8 +9,20 @@ Classes:
     BWSecretClient: Main client for BWS API interactions
 """
 
-from datetime import datetime
-from typing import Any
+import contextvars
+import functools
+import importlib
+import importlib.util
+import os
+import threading
+import weakref
+from collections import OrderedDict
+from collections.abc import Callable, Collection, Iterable, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait
+from contextlib import AbstractContextManager, nullcontext
+from datetime import datetime, timedelta
+from time import perf_counter
+from typing import TYPE_CHECKING, Any
 
 import requests
 
@@ -28,14 +40,61 @@ from .crypto import (
 from .errors import (
     ApiError,
     APIRateLimitError,
+    BatchError,
     CryptographyError,
     SecretNotFoundError,
     SecretParseError,
     SendRequestError,
     UnauthorisedError,
 )
+from .hooks import DecryptMetrics, RequestMetrics, SDKHooks
 from .token import Auth
 
+if TYPE_CHECKING:
+    from .breaker import CircuitBreaker
+    from .endpoints import EndpointSelector
+    from .hedging import HedgePolicy
+    from .tracing import Span, Tracer, Tracing
+    from .transport import Transport
+
+_NO_SPAN = nullcontext()
+
+# Operations whose requests must not be repeated on another endpoint, as the
+# first attempt may have reached the server before the connection failed
+_NO_FAILOVER = frozenset({"create"})
+
+# Per-thread scratch buffer secrets are decrypted into before being decoded
+_decrypt_buffers = threading.local()
+
+# Live clients, whose transport is reset in the child after a fork
+_CLIENTS: "weakref.WeakSet[BWSecretClient]" = weakref.WeakSet()
+
+
+def _reset_clients_after_fork() -> None:
+    for client in list(_CLIENTS):
+        client._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_clients_after_fork)
+
+
+@functools.cache
+def _accept_encoding() -> str:
+    """
+    Build the Accept-Encoding header from the content codings that can be decoded.
+
+    gzip is always decoded. Brotli is only requested when the brotli or brotlicffi
+    package is installed, as requests and httpx both decode it with those.
+
+    Returns:
+        str: The header value
+    """
+    for module in ("brotli", "brotlicffi"):
+        if importlib.util.find_spec(module) is not None:
+            return "br, gzip"
+    return "gzip"
+
 
 class BWSecretClient:
     """
@@ -45,14 +104,41 @@ class BWSecretClient:
     Bitwarden Secrets Manager. It handles authentication, automatic token refresh,
     and encryption/decryption of secret data.
 
+    Clients are fork safe: when the process forks, the child drops the connections
+    inherited from the parent and opens its own on its next request, while keeping
+    the bearer token and decrypted organization key so it does not authenticate
+    again. A client can therefore be created before a prefork server or
+    multiprocessing forks its workers.
+
     Attributes:
         region (Region): The BWS region configuration
         auth (Auth): Authentication handler
-        session (requests.Session): HTTP session for API requests
+        session (Transport): HTTP transport for API requests, a requests.Session by default
+        hooks (SDKHooks | None): Instrumentation hooks, if configured
+        circuit_breaker (CircuitBreaker | None): Circuit breaker guarding requests, if configured
+        serve_stale (bool): Whether get_by_id falls back to the last known good secret
+        hedge (HedgePolicy | None): Policy for hedging slow get_by_id requests, if configured
+        request_timeout (float | None): Seconds to wait for the server on every request
     """
 
+    hooks: SDKHooks | None = None
+    circuit_breaker: "CircuitBreaker | None" = None
+
     def __init__(
-        self, region: Region, access_token: str, state_file: str | None = None
+        self,
+        region: Region,
+        access_token: str,
+        state_file: str | None = None,
+        hooks: SDKHooks | None = None,
+        tracer: "Tracer | None" = None,
+        circuit_breaker: "CircuitBreaker | None" = None,
+        serve_stale: bool = False,
+        hedge: "HedgePolicy | None" = None,
+        decrypt_cache_size: int = 4096,
+        transport: "Transport | None" = None,
+        json_loads: Callable[[bytes], Any] | str | None = None,
+        request_timeout: float | None = 30.0,
+        stale_cache_size: int = 1024,
     ):
         """
         Initialize the BWSecretClient.
@@ -61,6 +147,34 @@ class BWSecretClient:
             region (Region): The BWS region configuration
             access_token (str): The BWS access token for authentication
             state_file (str | None): Optional path to state file for token persistence
+            hooks (SDKHooks | None): Optional instrumentation hooks for requests,
+                authentication, decryption and caches
+            tracer (Tracer | None): Optional OpenTelemetry-compatible tracer; when given,
+                spans are opened around operations, requests and decryption
+            circuit_breaker (CircuitBreaker | None): Optional circuit breaker consulted
+                before every request to the API
+            serve_stale (bool): When a get_by_id request fails because the API is
+                unavailable, return the last successfully fetched copy of the secret
+                marked as stale instead of raising
+            hedge (HedgePolicy | None): Optional policy for hedging slow get_by_id
+                requests with a duplicate request
+            decrypt_cache_size (int): Maximum number of decrypted values memoized by
+                their encrypted string, so unchanged secrets are not decrypted again
+                on every sync. 0 disables the cache.
+            transport (Transport | None): Optional transport used for all requests of
+                the client and its authentication, e.g. an `HTTP2Transport`; a new
+                `requests.Session` is used by default
+            json_loads (Callable[[bytes], Any] | str | None): Optional JSON decoder for
+                response bodies, either a function parsing bytes or the name of a
+                module providing one as `loads`, e.g. "orjson". When the module is not
+                installed, or by default, the stdlib decoder is used.
+            request_timeout (float | None): Seconds to wait for the server to accept the
+                connection and for each read of the response, for every request of the
+                client and its authentication. A hung request fails with
+                SendRequestError, which a circuit breaker records as a failure. None
+                waits forever, or as long as a custom transport's own timeout.
+            stale_cache_size (int): Maximum number of last known good secrets kept for
+                `serve_stale`; the least recently fetched are dropped first
 
         Raises:
             ValueError: If any of the input parameters are of incorrect type
@@ -76,35 +190,429 @@ class BWSecretClient:
             raise ValueError("Access token must be a string")
         if state_file is not None and not isinstance(state_file, str):
             raise ValueError("State file must be a string or None")
+        if hooks is not None and not isinstance(hooks, SDKHooks):
+            raise ValueError("Hooks must be an instance of SDKHooks or None")
+        if circuit_breaker is not None:
+            from .breaker import CircuitBreaker
+
+            if not isinstance(circuit_breaker, CircuitBreaker):
+                raise ValueError(
+                    "Circuit breaker must be an instance of CircuitBreaker or None"
+                )
+        if hedge is not None:
+            from .hedging import HedgePolicy
+
+            if not isinstance(hedge, HedgePolicy):
+                raise ValueError("Hedge must be an instance of HedgePolicy or None")
+        if decrypt_cache_size < 0:
+            raise ValueError("Decrypt cache size must not be negative")
+        if request_timeout is not None and request_timeout <= 0:
+            raise ValueError("Request timeout must be positive or None")
+        if stale_cache_size < 1:
+            raise ValueError("Stale cache size must be at least 1")
+        if transport is not None and not all(
+            callable(getattr(transport, method, None))
+            for method in ("get", "post", "put", "delete")
+        ):
+            raise ValueError("Transport must provide get, post, put and delete")
+        if json_loads is not None and not (
+            callable(json_loads) or isinstance(json_loads, str)
+        ):
+            raise ValueError("JSON loads must be callable, a module name or None")
 
         self.region = region
-        self.auth = Auth.from_token(access_token, region, state_file)
-        self.session = requests.Session()
+        self.hooks = hooks
+        self._tracing: Tracing | None = None
+        if tracer is not None:
+            from . import tracing
+
+            self._tracing = tracing.Tracing(tracer)
+        self.auth = Auth.from_token(
+            access_token,
+            region,
+            state_file,
+            hooks=hooks,
+            tracer=tracer,
+            transport=transport,
+            request_timeout=request_timeout,
+        )
+        self._inflight: dict[str, Future[BitwardenSecretRT | None]] = {}
+        self._inflight_lock = threading.Lock()
+        self.circuit_breaker = circuit_breaker
+        self.serve_stale = serve_stale
+        self.stale_cache_size = stale_cache_size
+        self._last_good: OrderedDict[str, BitwardenSecretRT] = OrderedDict()
+        self._last_good_lock = threading.Lock()
+        self.request_timeout = request_timeout
+        self.hedge = hedge
+        self._hedge_pool: ThreadPoolExecutor | None = None
+        self._hedge_slots: threading.BoundedSemaphore | None = None
+        self.decrypt_cache_size = decrypt_cache_size
+        self._decrypted: OrderedDict[str, str] = OrderedDict()
+        self._decrypted_lock = threading.Lock()
+        self._endpoints: EndpointSelector | None = None
+        if region.mirrors:
+            from . import endpoints
+
+            self._endpoints = endpoints.EndpointSelector(region.api_urls)
+        self.session: Transport = (
+            transport if transport is not None else requests.Session()
+        )
         self.session.headers.update(
             {
-                "Authorization": f"Bearer {self.auth.bearer_token}",
                 "User-Agent": "Bitwarden Python-SDK",
                 "Device-Type": "21",
+                "Accept-Encoding": _accept_encoding(),
             }
         )
+        self._json_loads = self._resolve_json_loads(json_loads)
+        _CLIENTS.add(self)
 
-    def _reload_auth(self) -> None:
+    @staticmethod
+    def _resolve_json_loads(
+        json_loads: Callable[[bytes], Any] | str | None,
+    ) -> Callable[[bytes], Any] | None:
         """
-        Reload the authentication headers for the current session.
+        Resolve the configured JSON decoder.
 
-        Updates the session headers with the current bearer token from the auth object.
-        This method is typically called when the authentication token has been refreshed
-        or updated and needs to be applied to subsequent HTTP requests.
+        Args:
+            json_loads (Callable[[bytes], Any] | str | None): A decoder, the name of a
+                module providing one as `loads`, or None
 
         Returns:
-            None
+            Callable[[bytes], Any] | None: The decoder, or None to use the stdlib one
         """
-        self.session.headers.update(
-            {
-                "Authorization": f"Bearer {self.auth.bearer_token}",
-            }
+        if not isinstance(json_loads, str):
+            return json_loads
+        try:
+            module = importlib.import_module(json_loads)
+        except ImportError:
+            return None
+        return getattr(module, "loads", None)
+
+    def _reset_after_fork(self) -> None:
+        """
+        Reset the state a forked child must not share with its parent.
+
+        Called in the child process after a fork. Pooled connections inherited
+        from the parent are dropped, so the child opens its own. Closing them only
+        releases the child's file descriptors and leaves the parent's connections
+        intact. Request coalescing and hedging state belonging to threads of the
+        parent is discarded. The authentication state and decrypted values are
+        kept.
+        """
+        reset = getattr(self.session, "reset_after_fork", None)
+        if reset is not None:
+            reset()
+        else:
+            for adapter in set(getattr(self.session, "adapters", {}).values()):
+                adapter.close()
+        self._inflight = {}
+        self._inflight_lock = threading.Lock()
+        self._decrypted_lock = threading.Lock()
+        self._last_good_lock = threading.Lock()
+        self._hedge_pool = None
+        self._hedge_slots = None
+
+    def _send(
+        self, operation: str, method: str, url: str, retries: int = 0, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send an authenticated request to the API through the session.
+
+        Sends the current bearer token and, when hooks are configured, reports
+        the request timing and outcome to them. When a circuit breaker is configured
+        the request is only sent if the breaker admits it, and network errors and
+        5xx responses are recorded as failures. When the region has mirrors, the
+        request is sent to the preferred endpoint and retried on the others after
+        connection errors.
+
+        Args:
+            operation (str): The SDK operation sending the request, reported to hooks
+            method (str): The lower-case HTTP method, e.g. "get"
+            url (str): The URL to request
+            retries (int): Number of earlier attempts of this operation, reported to hooks
+            **kwargs: Additional arguments passed to the session method
+
+        Returns:
+            requests.Response: The HTTP response
+
+        Raises:
+            requests.RequestException: If the request fails
+            CircuitOpenError: If the circuit breaker rejects the request
+        """
+        breaker = self.circuit_breaker
+        if breaker is None:
+            return self._dispatch(operation, method, url, retries, **kwargs)
+
+        breaker.before_request()
+        try:
+            response = self._dispatch(operation, method, url, retries, **kwargs)
+        except Exception:
+            breaker.record_failure()
+            raise
+        if response.status_code >= 500:
+            breaker.record_failure()
+        else:
+            breaker.record_success()
+        return response
+
+    def _dispatch(
+        self, operation: str, method: str, url: str, retries: int = 0, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a request to the region's endpoints in order of preference.
+
+        The URL must start with the region's primary API URL; the primary API URL
+        is replaced by the URL of the endpoint the request is sent to. Every
+        failover attempt is reported to hooks with one more retry.
+
+        Args:
+            operation (str): The SDK operation sending the request, reported to hooks
+            method (str): The lower-case HTTP method, e.g. "get"
+            url (str): The URL to request on the primary endpoint
+            retries (int): Number of earlier attempts of this operation, reported to hooks
+            **kwargs: Additional arguments passed to the session method
+
+        Returns:
+            requests.Response: The HTTP response
+
+        Raises:
+            requests.RequestException: If the request fails on every endpoint
+        """
+        endpoints = self._endpoints
+        if endpoints is None or not url.startswith(self.region.api_url):
+            return self._transmit(operation, method, url, retries, **kwargs)
+
+        path = url[len(self.region.api_url) :]
+        order = endpoints.order()
+        if operation in _NO_FAILOVER:
+            order = order[:1]
+        for attempt, base in enumerate(order[:-1]):
+            try:
+                return self._transmit_to(
+                    endpoints,
+                    base,
+                    operation,
+                    method,
+                    path,
+                    retries + attempt,
+                    **kwargs,
+                )
+            except requests.ConnectionError:
+                continue
+        return self._transmit_to(
+            endpoints,
+            order[-1],
+            operation,
+            method,
+            path,
+            retries + len(order) - 1,
+            **kwargs,
         )
 
+    def _transmit_to(
+        self,
+        endpoints: "EndpointSelector",
+        base: str,
+        operation: str,
+        method: str,
+        path: str,
+        retries: int = 0,
+        **kwargs: Any,
+    ) -> requests.Response:
+        """
+        Send a request to one endpoint and record its latency or connection failure.
+
+        Args:
+            endpoints (EndpointSelector): The selector the outcome is recorded in
+            base (str): The base URL of the endpoint
+            operation (str): The SDK operation sending the request, reported to hooks
+            method (str): The lower-case HTTP method, e.g. "get"
+            path (str): The path of the request relative to the base URL
+            retries (int): Number of earlier attempts of this operation, reported to hooks
+            **kwargs: Additional arguments passed to the session method
+
+        Returns:
+            requests.Response: The HTTP response
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        start = perf_counter()
+        try:
+            response = self._transmit(operation, method, base + path, retries, **kwargs)
+        except requests.ConnectionError:
+            endpoints.record_failure(base)
+            raise
+        # Time to the response headers, so that a large body is not taken for latency
+        elapsed = getattr(response, "elapsed", None)
+        if isinstance(elapsed, timedelta) and elapsed:
+            endpoints.record_success(base, elapsed.total_seconds())
+        else:
+            endpoints.record_success(base, perf_counter() - start)
+        return response
+
+    def _transmit(
+        self, operation: str, method: str, url: str, retries: int = 0, **kwargs: Any
+    ) -> requests.Response:
+        """
+        Send a request through the session, reporting it to hooks and tracing.
+
+        Args:
+            operation (str): The SDK operation sending the request, reported to hooks
+            method (str): The lower-case HTTP method, e.g. "get"
+            url (str): The URL to request
+            retries (int): Number of earlier attempts of this operation, reported to hooks
+            **kwargs: Additional arguments passed to the session method
+
+        Returns:
+            requests.Response: The HTTP response
+
+        Raises:
+            requests.RequestException: If the request fails
+        """
+        # The bearer token is sent per request, never stored on the transport,
+        # which may be shared with clients of other access tokens
+        kwargs["headers"] = {
+            "Authorization": f"Bearer {self.auth.bearer_token}",
+            **(kwargs.get("headers") or {}),
+        }
+        send = getattr(self.session, method)
+        kwargs.setdefault("timeout", self.request_timeout)
+        hooks = self.hooks
+        tracing = self._tracing
+        if hooks is None and tracing is None:
+            return send(url, **kwargs)
+
+        with self._span(
+            f"bws.http {method.upper()}",
+            {"http.request.method": method.upper(), "url.full": url},
+        ) as span:
+            start = perf_counter()
+            response = None
+            try:
+                response = send(url, **kwargs)
+                return response
+            finally:
+                content_bytes, wire_bytes = self._response_bytes(response)
+                if span is not None and tracing is not None and response is not None:
+                    tracing.record_response(span, response, wire_bytes)
+                if hooks is not None:
+                    hooks.on_request(
+                        RequestMetrics(
+                            operation=operation,
+                            method=method.upper(),
+                            url=url,
+                            status_code=response.status_code
+                            if response is not None
+                            else None,
+                            elapsed=perf_counter() - start,
+                            retries=retries,
+                            ratelimit_remaining=self._ratelimit_remaining(response),
+                            content_bytes=content_bytes,
+                            wire_bytes=wire_bytes,
+                        )
+                    )
+
+    def _span(
+        self, name: str, attributes: dict[str, Any] | None = None
+    ) -> "AbstractContextManager[Span | None]":
+        """
+        Open a tracing span if a tracer is configured.
+
+        Args:
+            name (str): The span name
+            attributes (dict[str, Any] | None): Attributes set when the span starts
+
+        Returns:
+            AbstractContextManager[Span | None]: A context manager yielding the span,
+                or None when tracing is disabled
+        """
+        if self._tracing is None:
+            return _NO_SPAN
+        return self._tracing.span(name, attributes or {})
+
+    @staticmethod
+    def _response_bytes(
+        response: requests.Response | None,
+    ) -> tuple[int | None, int | None]:
+        """
+        Measure the size of a response body before and after decompression.
+
+        Args:
+            response (requests.Response | None): The HTTP response, with its body read
+
+        Returns:
+            tuple[int | None, int | None]: The size of the decoded body and the number
+                of body bytes received, each None if unknown
+        """
+        if response is None:
+            return None, None
+        content = response.content
+        content_bytes = len(content) if isinstance(content, bytes) else None
+        tell = getattr(response.raw, "tell", None)
+        wire_bytes = tell() if callable(tell) else None
+        return content_bytes, wire_bytes if isinstance(wire_bytes, int) else None
+
+    @staticmethod
+    def _ratelimit_remaining(response: requests.Response | None) -> int | None:
+        """
+        Read the remaining rate limit quota from a response, if reported.
+
+        Args:
+            response (requests.Response | None): The HTTP response
+
+        Returns:
+            int | None: The number of remaining requests, or None if not reported
+        """
+        if response is None:
+            return None
+        remaining = response.headers.get("x-rate-limit-remaining")
+        if remaining is None:
+            return None
+        try:
+            return int(remaining)
+        except (TypeError, ValueError):
+            return None
+
+    @staticmethod
+    def _ratelimit_info(response: requests.Response) -> RatelimitInfo:
+        """
+        Build the rate limit information from the response headers.
+
+        Args:
+            response (requests.Response): The HTTP response
+
+        Returns:
+            RatelimitInfo: The rate limit information, with defaults for missing headers
+        """
+        return RatelimitInfo(
+            limit=response.headers.get("x-rate-limit-limit", "1m"),
+            remaining=int(response.headers.get("x-rate-limit-remaining", 0)),
+            reset=datetime.fromisoformat(
+                response.headers.get("x-rate-limit-reset", "1970-01-01T00:00:00Z")
+            ),
+        )
+
+    def _read_json(self, response: requests.Response) -> tuple[Any, float]:
+        """
+        Parse the JSON body of a response.
+
+        Args:
+            response (requests.Response): The HTTP response
+
+        Returns:
+            tuple[Any, float]: The parsed body and the seconds spent parsing it,
+                which is only measured when hooks are configured
+        """
+        loads = self._json_loads
+        if self.hooks is None:
+            return response.json() if loads is None else loads(response.content), 0.0
+        start = perf_counter()
+        data = response.json() if loads is None else loads(response.content)
+        return data, perf_counter() - start
+
     def _decrypt_secret(self, secret: BitwardenSecret) -> BitwardenSecret:
         """
         Decrypt an encrypted BitwardenSecret.
@@ -125,18 +633,58 @@ class BWSecretClient:
             return BitwardenSecret(
                 id=secret.id,
                 organizationId=secret.organizationId,
-                key=EncryptedValue.from_str(secret.key)
-                .decrypt(self.auth.org_enc_key)
-                .decode("utf-8"),
-                value=EncryptedValue.from_str(secret.value)
-                .decrypt(self.auth.org_enc_key)
-                .decode("utf-8"),
+                key=self._decrypt_str(secret.key),
+                value=self._decrypt_str(secret.value),
                 creationDate=secret.creationDate,
                 revisionDate=secret.revisionDate,
+                projects=secret.projects,
             )
         except (UnicodeDecodeError, CryptographyError) as e:
             raise SecretParseError("Failed to decode secret value or key") from e
 
+    def _decrypt_str(self, encrypted: str) -> str:
+        """
+        Decrypt and decode an encrypted string through a reused per-thread buffer.
+
+        Results are memoized by the complete encrypted string, which only changes
+        when the secret does. Keying by the whole string rather than its MAC means
+        a tampered value can never be served from the cache without verification.
+
+        Args:
+            encrypted (str): The encrypted string in Bitwarden format
+
+        Returns:
+            str: The decrypted text
+
+        Raises:
+            UnicodeDecodeError: If the decrypted data is not valid UTF-8
+            CryptographyError: If the value cannot be parsed or authenticated
+        """
+        if self.decrypt_cache_size:
+            with self._decrypted_lock:
+                text = self._decrypted.get(encrypted)
+                if text is not None:
+                    self._decrypted.move_to_end(encrypted)
+            if self.hooks is not None:
+                self.hooks.on_cache("decrypt", text is not None)
+            if text is not None:
+                return text
+
+        value = EncryptedValue.from_str(encrypted)
+        size = EncryptedValue.buffer_size(len(value.data))
+        buffer = getattr(_decrypt_buffers, "buffer", None)
+        if buffer is None or len(buffer) < size:
+            buffer = _decrypt_buffers.buffer = bytearray(max(size, 4096))
+        with value.decrypt_into(self.auth.org_enc_key, buffer) as plaintext:
+            text = str(plaintext, "utf-8")
+
+        if self.decrypt_cache_size:
+            with self._decrypted_lock:
+                self._decrypted[encrypted] = text
+                while len(self._decrypted) > self.decrypt_cache_size:
+                    self._decrypted.popitem(last=False)
+        return text
+
     def _encrypt_secret(self, secret: BitwardenSecretCreate) -> BitwardenSecretCreate:
         """
         Encrypt a BitwardenSecretCreate.
@@ -150,28 +698,50 @@ class BWSecretClient:
         Returns:
             BitwardenSecretCreate: A new BitwardenSecretCreate with encrypted key and value
 
+        Raises:
+            SecretParseError: If the encryption process fails
+        """
+        return self._encrypt_secrets([secret])[0]
+
+    def _encrypt_secrets(
+        self, secrets: list[BitwardenSecretCreate]
+    ) -> list[BitwardenSecretCreate]:
+        """
+        Encrypt several BitwardenSecretCreate objects in one pass.
+
+        The keys, values and notes of all secrets are encrypted together with
+        `EncryptedValue.from_data_many`, sharing IV generation and key setup.
+
+        Args:
+            secrets (list[BitwardenSecretCreate]): The plaintext secrets to encrypt
+
+        Returns:
+            list[BitwardenSecretCreate]: The encrypted secrets, in order
+
         Raises:
             SecretParseError: If the encryption process fails
         """
         try:
-            encrypted_key = EncryptedValue.from_data(
-                self.auth.org_enc_key, secret.key
-            ).to_str()
-            encrypted_value = EncryptedValue.from_data(
-                self.auth.org_enc_key, secret.value
-            ).to_str()
-            encrypted_note = EncryptedValue.from_data(
-                self.auth.org_enc_key, secret.note
-            ).to_str()
-            return BitwardenSecretCreate(
-                key=encrypted_key,
-                value=encrypted_value,
-                note=encrypted_note,
-                accessPoliciesRequests=secret.accessPoliciesRequests,
-                projectIds=secret.projectIds,
+            encrypted = EncryptedValue.from_data_many(
+                self.auth.org_enc_key,
+                [
+                    field
+                    for secret in secrets
+                    for field in (secret.key, secret.value, secret.note)
+                ],
             )
         except CryptographyError as e:
             raise SecretParseError("Failed to encrypt secret value or key") from e
+        return [
+            BitwardenSecretCreate(
+                key=encrypted[3 * i].to_str(),
+                value=encrypted[3 * i + 1].to_str(),
+                note=encrypted[3 * i + 2].to_str(),
+                accessPoliciesRequests=secret.accessPoliciesRequests,
+                projectIds=secret.projectIds,
+            )
+            for i, secret in enumerate(secrets)
+        ]
 
     def _parse_secret(self, data: dict[str, Any]) -> BitwardenSecret:
         """
@@ -192,6 +762,90 @@ class BWSecretClient:
         undec_secret = BitwardenSecret.model_validate(data)
         return self._decrypt_secret(undec_secret)
 
+    def _parse_secrets(
+        self, operation: str, items: list[dict[str, Any]], json_seconds: float = 0.0
+    ) -> list[BitwardenSecret]:
+        """
+        Parse and decrypt a batch of secrets from API response data.
+
+        When hooks are configured, the time spent validating and decrypting the
+        batch is reported to them.
+
+        Args:
+            operation (str): The SDK operation the secrets are decoded for
+            items (list[dict[str, Any]]): Raw secret data from the API response
+            json_seconds (float): Seconds spent parsing the response body
+
+        Returns:
+            list[BitwardenSecret]: The parsed and decrypted secrets, in order
+
+        Raises:
+            SecretParseError: If any secret cannot be decrypted or decoded
+        """
+        hooks = self.hooks
+        if hooks is None and self._tracing is None:
+            return [self._parse_secret(item) for item in items]
+
+        with self._span(
+            "bws.decrypt", {"bws.operation": operation, "bws.secret.count": len(items)}
+        ):
+            start = perf_counter()
+            undec_secrets = [BitwardenSecret.model_validate(item) for item in items]
+            validated = perf_counter()
+            secrets = [self._decrypt_secret(secret) for secret in undec_secrets]
+        if hooks is not None:
+            hooks.on_decrypt(
+                DecryptMetrics(
+                    operation=operation,
+                    count=len(secrets),
+                    json_seconds=json_seconds,
+                    validate_seconds=validated - start,
+                    decrypt_seconds=perf_counter() - validated,
+                )
+            )
+        return secrets
+
+    @staticmethod
+    def _in_projects(data: dict[str, Any], project_ids: Collection[str]) -> bool:
+        """
+        Check whether raw secret data belongs to any of the given projects.
+
+        Args:
+            data (dict[str, Any]): Raw secret data from the API response
+            project_ids (Collection[str]): The project ids to match against
+
+        Returns:
+            bool: True if the secret is associated with at least one of the projects
+        """
+        return any(
+            project.get("id") in project_ids for project in data.get("projects") or []
+        )
+
+    @staticmethod
+    def _is_unchanged(data: dict[str, Any], revisions: Mapping[str, datetime]) -> bool:
+        """
+        Check whether raw secret data has the revision the caller already holds.
+
+        Args:
+            data (dict[str, Any]): Raw secret data from the API response
+            revisions (Mapping[str, datetime]): Held revision dates by secret id
+
+        Returns:
+            bool: True if the secret is held with the same revisionDate. Data that
+                cannot be compared is reported as changed so it is fully validated.
+        """
+        sid = data.get("id")
+        if not isinstance(sid, str):
+            return False
+        held = revisions.get(sid)
+        revision = data.get("revisionDate")
+        if held is None or not isinstance(revision, str):
+            return False
+        try:
+            return datetime.fromisoformat(revision) == held
+        except ValueError:
+            return False
+
     def get_by_id(self, secret_id: str) -> BitwardenSecretRT | None:
         """
         Retrieve a secret by its unique identifier.
@@ -200,6 +854,10 @@ class BWSecretClient:
         by its UUID. The returned secret will have its key and value automatically
         decrypted.
 
+        Concurrent calls for the same id are coalesced: while a request for an id is
+        in flight, other callers wait for it and share its result (or its exception)
+        instead of sending their own request.
+
         Args:
             secret_id (str): The unique identifier (UUID) of the secret to retrieve
 
@@ -226,19 +884,200 @@ class BWSecretClient:
         if not isinstance(secret_id, str):
             raise ValueError("Secret ID must be a string")
 
-        self._reload_auth()
-        response = self.session.get(f"{self.region.api_url}/secrets/{secret_id}")
+        with self._inflight_lock:
+            flight = self._inflight.get(secret_id)
+            leader = flight is None
+            if flight is None:
+                flight = self._inflight[secret_id] = Future()
+        if self.hooks is not None:
+            self.hooks.on_cache("inflight", not leader)
+        if not leader:
+            return flight.result()
+
+        try:
+            with self._span("bws.get_by_id", {"bws.secret.id": secret_id}) as span:
+                if self.serve_stale:
+                    result = self._get_by_id_or_stale(secret_id)
+                else:
+                    result = self._fetch_by_id(secret_id)
+                if span is not None:
+                    span.set_attribute("bws.secret.count", int(result is not None))
+        except BaseException as e:
+            flight.set_exception(e)
+            raise
+        else:
+            flight.set_result(result)
+            return result
+        finally:
+            with self._inflight_lock:
+                del self._inflight[secret_id]
+
+    def _get_by_id_or_stale(self, secret_id: str) -> BitwardenSecretRT | None:
+        """
+        Fetch a secret, falling back to its last known good copy if the API is unavailable.
+
+        Successful results are remembered, up to `stale_cache_size` of the most
+        recently fetched secrets. Network errors, open circuit breakers,
+        rate limiting and server errors are answered with the remembered copy marked
+        as stale; authorization errors and undecryptable secrets are always raised.
+
+        Args:
+            secret_id (str): The unique identifier (UUID) of the secret to retrieve
+
+        Returns:
+            BitwardenSecretRT | None: The retrieved secret, its stale copy, or None if not found
+        """
+        try:
+            result = self._fetch_by_id(secret_id)
+        except (UnauthorisedError, SecretNotFoundError, SecretParseError):
+            raise
+        except ApiError:
+            with self._last_good_lock:
+                stale = self._last_good.get(secret_id)
+            if self.hooks is not None:
+                self.hooks.on_cache("stale", stale is not None)
+            if stale is None:
+                raise
+            return stale
+        with self._last_good_lock:
+            if result is None:
+                self._last_good.pop(secret_id, None)
+            else:
+                self._last_good[secret_id] = result.model_copy(update={"stale": True})
+                self._last_good.move_to_end(secret_id)
+                while len(self._last_good) > self.stale_cache_size:
+                    self._last_good.popitem(last=False)
+        return result
+
+    def _fetch_by_id(self, secret_id: str) -> BitwardenSecretRT | None:
+        """
+        Fetch a secret, hedging the request if a hedge policy is configured.
+
+        Args:
+            secret_id (str): The unique identifier (UUID) of the secret to retrieve
+
+        Returns:
+            BitwardenSecretRT | None: The retrieved and decrypted secret, or None if not found
+        """
+        if self.hedge is None:
+            return self._get_by_id(secret_id)
+        return self._get_by_id_hedged(secret_id, self.hedge)
+
+    def _get_by_id_hedged(
+        self, secret_id: str, hedge: "HedgePolicy"
+    ) -> BitwardenSecretRT | None:
+        """
+        Fetch a secret, sending a duplicate request if the first one is slow.
+
+        The request is sent from a worker thread. If it has not answered within the
+        policy's hedge delay and the hedge rate cap allows it, a second request is
+        sent and the first successful answer is returned. A request that has already
+        been sent cannot be aborted, so the slower answer is discarded. While the
+        policy is warming up, or when all of its workers are busy, the request is
+        sent from the calling thread without a hedge.
+
+        Args:
+            secret_id (str): The unique identifier (UUID) of the secret to retrieve
+            hedge (HedgePolicy): The hedge policy
+
+        Returns:
+            BitwardenSecretRT | None: The retrieved and decrypted secret, or None if not found
+        """
+        hedge.start_request()
+        delay = hedge.delay()
+        primary = None
+        if delay is not None:
+            primary = self._submit_get_by_id(hedge, secret_id, "get_by_id")
+        if delay is None or primary is None:
+            start = perf_counter()
+            result = self._get_by_id(secret_id)
+            hedge.record(perf_counter() - start)
+            return result
+
+        done, _ = wait([primary], timeout=delay)
+        if done or not hedge.try_hedge():
+            return primary.result()
+        secondary = self._submit_get_by_id(hedge, secret_id, "get_by_id_hedge", 1)
+        if secondary is None:
+            return primary.result()
+        for future in as_completed([primary, secondary]):
+            if future.exception() is None:
+                primary.cancel()
+                secondary.cancel()
+                return future.result()
+        # Both requests failed
+        return primary.result()
+
+    def _submit_get_by_id(
+        self, hedge: "HedgePolicy", secret_id: str, operation: str, retries: int = 0
+    ) -> "Future[BitwardenSecretRT | None] | None":
+        """
+        Run a get_by_id request on an idle hedging worker and record its latency.
+
+        Requests are only submitted while a worker is free, so they never wait in
+        the pool's queue and the recorded latency is that of the request alone.
+
+        Args:
+            hedge (HedgePolicy): The hedge policy the latency is recorded in
+            secret_id (str): The unique identifier (UUID) of the secret to retrieve
+            operation (str): The operation name reported to hooks
+            retries (int): Number of earlier attempts, 1 for the hedge, reported to hooks
+
+        Returns:
+            Future[BitwardenSecretRT | None] | None: The pending request, or None if
+                all workers are busy
+        """
+        with self._inflight_lock:
+            if self._hedge_pool is None or self._hedge_slots is None:
+                self._hedge_pool = ThreadPoolExecutor(
+                    max_workers=hedge.max_workers, thread_name_prefix="bws-sdk-hedge"
+                )
+                self._hedge_slots = threading.BoundedSemaphore(hedge.max_workers)
+            pool, slots = self._hedge_pool, self._hedge_slots
+        if not slots.acquire(blocking=False):
+            return None
+
+        # Each request runs in a copy of the caller's context so that tracing
+        # spans are parented to the caller's get_by_id span
+        context = contextvars.copy_context()
+
+        def run() -> BitwardenSecretRT | None:
+            start = perf_counter()
+            result = context.run(self._get_by_id, secret_id, operation, retries)
+            hedge.record(perf_counter() - start)
+            return result
+
+        future = pool.submit(run)
+        # Released when the request finishes or is cancelled before it started
+        future.add_done_callback(lambda _: slots.release())
+        return future
+
+    def _get_by_id(
+        self, secret_id: str, operation: str = "get_by_id", retries: int = 0
+    ) -> BitwardenSecretRT | None:
+        """
+        Fetch and decrypt a secret by its id without request coalescing.
+
+        Args:
+            secret_id (str): The unique identifier (UUID) of the secret to retrieve
+            operation (str): The operation name reported to hooks for the request
+            retries (int): Number of earlier attempts, reported to hooks for the request
+
+        Returns:
+            BitwardenSecretRT | None: The retrieved and decrypted secret, or None if not found
+        """
+        try:
+            response = self._send(
+                operation, "get", f"{self.region.api_url}/secrets/{secret_id}", retries
+            )
+        except requests.RequestException as e:
+            raise SendRequestError(f"Failed to send get request: {e}")
         if response.status_code == 404:
             return None
         self.raise_errors(response)
-        parsed_secret = self._parse_secret(response.json())
-        ratelimit_info = RatelimitInfo(
-            limit=response.headers.get("x-rate-limit-limit", "1m"),
-            remaining=int(response.headers.get("x-rate-limit-remaining", 0)),
-            reset=datetime.fromisoformat(
-                response.headers.get("x-rate-limit-reset", "1970-01-01T00:00:00Z")
-            ),
-        )
+        data, json_seconds = self._read_json(response)
+        parsed_secret = self._parse_secrets("get_by_id", [data], json_seconds)[0]
+        ratelimit_info = self._ratelimit_info(response)
         return BitwardenSecretRT(
             id=parsed_secret.id,
             organizationId=parsed_secret.organizationId,
@@ -246,6 +1085,7 @@ class BWSecretClient:
             value=parsed_secret.value,
             creationDate=parsed_secret.creationDate,
             revisionDate=parsed_secret.revisionDate,
+            projects=parsed_secret.projects,
             ratelimit=ratelimit_info,
         )
 
@@ -278,7 +1118,13 @@ class BWSecretClient:
         elif response.status_code != 200:
             raise ApiError(f"Unexpected error: {response.status_code} {response.text}")
 
-    def sync(self, last_synced_date: datetime) -> BitwardenSync:
+    def sync(
+        self,
+        last_synced_date: datetime,
+        project_ids: Iterable[str] | None = None,
+        revisions: Mapping[str, datetime] | None = None,
+        secret_ids: Iterable[str] | None = None,
+    ) -> BitwardenSync:
         """
         Synchronize secrets from the Bitwarden server since a specified date.
 
@@ -286,8 +1132,24 @@ class BWSecretClient:
         last synced date. This method is useful for keeping local secret caches
         up to date with the server state.
 
+        When `project_ids` is given, only secrets belonging to at least one of these
+        projects are decrypted and returned; the others are discarded before any
+        decryption work is done. `secret_ids` restricts the result to the given
+        secrets in the same way.
+
+        When `revisions` is given, the sync is incremental: it maps the ids of the
+        secrets the caller already holds to their `revisionDate`. Only secrets that
+        are new or whose revision differs are validated and decrypted and returned
+        in `secrets`. The ids of held secrets that are returned unchanged are listed
+        in `unchanged`, and those no longer returned in `removed`, so the cost of a
+        sync is proportional to what changed rather than to the size of the org.
+
         Args:
             last_synced_date (datetime): The datetime representing when secrets were last synced
+            project_ids (Iterable[str] | None): Optional project ids to restrict the result to
+            revisions (Mapping[str, datetime] | None): Optional revision dates of the
+                secrets held from the previous sync, by id
+            secret_ids (Iterable[str] | None): Optional secret ids to restrict the result to
 
         Returns:
             list[BitwardenSecret]: List of secrets created or modified since the last sync date
@@ -311,36 +1173,131 @@ class BWSecretClient:
 
         if not isinstance(last_synced_date, datetime):
             raise ValueError("Last synced date must be a datetime object")
+        if project_ids is not None:
+            project_ids = frozenset(project_ids)
+            if not all(isinstance(pid, str) for pid in project_ids):
+                raise ValueError("Each project ID must be a string")
+        if secret_ids is not None:
+            secret_ids = frozenset(secret_ids)
+            if not all(isinstance(sid, str) for sid in secret_ids):
+                raise ValueError("Each secret ID must be a string")
 
         lsd: str = last_synced_date.isoformat()
-        try:
-            self._reload_auth()
-
-            response = self.session.get(
-                f"{self.region.api_url}/organizations/{self.auth.org_id}/secrets/sync",
-                params={"lastSyncedDate": lsd},
+        with self._span("bws.sync", {"bws.last_synced_date": lsd}) as span:
+            try:
+                response = self._send(
+                    "sync",
+                    "get",
+                    f"{self.region.api_url}/organizations/{self.auth.org_id}/secrets/sync",
+                    params={"lastSyncedDate": lsd},
+                )
+            except requests.RequestException as e:
+                raise SendRequestError(f"Failed to send sync request: {e}")
+            self.raise_errors(response)
+
+            response_data, json_seconds = self._read_json(response)
+            unc_secrets = response_data.get("secrets", {})
+            ratelimit_info = self._ratelimit_info(response)
+            if response_data.get("hasChanges", False) is False:
+                if span is not None:
+                    span.set_attribute("bws.sync.has_changes", False)
+                return BitwardenSync(secrets=None, ratelimit=ratelimit_info)
+
+            items = unc_secrets.get("data", []) if unc_secrets else []
+            if project_ids is not None:
+                items = [item for item in items if self._in_projects(item, project_ids)]
+            if secret_ids is not None:
+                items = [item for item in items if item.get("id") in secret_ids]
+            unchanged: list[str] = []
+            removed: list[str] = []
+            if revisions is not None:
+                changed = []
+                for item in items:
+                    if self._is_unchanged(item, revisions):
+                        unchanged.append(item["id"])
+                    else:
+                        changed.append(item)
+                returned = {item.get("id") for item in items}
+                removed = [sid for sid in revisions if sid not in returned]
+                items = changed
+            decrypted_secrets = self._parse_secrets("sync", items, json_seconds)
+            if span is not None:
+                span.set_attribute("bws.sync.has_changes", True)
+                span.set_attribute("bws.secret.count", len(decrypted_secrets))
+                if revisions is not None:
+                    span.set_attribute("bws.sync.unchanged", len(unchanged))
+                    span.set_attribute("bws.sync.removed", len(removed))
+            return BitwardenSync(
+                secrets=decrypted_secrets,
+                ratelimit=ratelimit_info,
+                unchanged=unchanged,
+                removed=removed,
             )
-        except requests.RequestException as e:
-            raise SendRequestError(f"Failed to send sync request: {e}")
-        self.raise_errors(response)
 
-        response_data = response.json()
-        unc_secrets = response_data.get("secrets", {})
-        ratelimit_info = RatelimitInfo(
-            limit=response.headers.get("x-rate-limit-limit", "1m"),
-            remaining=int(response.headers.get("x-rate-limit-remaining", 0)),
-            reset=datetime.fromisoformat(
-                response.headers.get("x-rate-limit-reset", "1970-01-01T00:00:00Z")
-            ),
-        )
-        if response_data.get("hasChanges", False) is False:
-            return BitwardenSync(secrets=None, ratelimit=ratelimit_info)
+    def list_by_project(self, project_id: str) -> list[BitwardenSecret]:
+        """
+        Retrieve all secrets belonging to a project.
 
-        decrypted_secrets = []
-        if unc_secrets:
-            for secret in unc_secrets.get("data", []):
-                decrypted_secrets.append(self._parse_secret(secret))
-        return BitwardenSync(secrets=decrypted_secrets, ratelimit=ratelimit_info)
+        Lists the identifiers of the project's secrets and then fetches them in a
+        single bulk request, so only the project's secrets are transferred and
+        decrypted instead of the whole organization.
+
+        Args:
+            project_id (str): The unique identifier (UUID) of the project
+
+        Returns:
+            list[BitwardenSecret]: The decrypted secrets of the project
+
+        Raises:
+            ValueError: If the provided project_id is not a string
+            SendRequestError: If the network request fails
+            UnauthorisedError: If the request is unauthorized (HTTP 401)
+            SecretNotFoundError: If the project does not exist (HTTP 404)
+            ApiError: If the API returns a non-200 status code
+            SecretParseError: If any secret cannot be parsed or decrypted
+
+        Example:
+            ```python
+            for secret in client.list_by_project("project-id"):
+                print(f"{secret.key} = {secret.value}")
+            ```
+        """
+        if not isinstance(project_id, str):
+            raise ValueError("Project ID must be a string")
+
+        with self._span("bws.list_by_project", {"bws.project.id": project_id}) as span:
+            try:
+                response = self._send(
+                    "list_by_project",
+                    "get",
+                    f"{self.region.api_url}/projects/{project_id}/secrets",
+                )
+            except requests.RequestException as e:
+                raise SendRequestError(f"Failed to send project secrets request: {e}")
+            self.raise_errors(response)
+
+            listing, listing_seconds = self._read_json(response)
+            secret_ids = [secret["id"] for secret in listing.get("secrets") or []]
+            if span is not None:
+                span.set_attribute("bws.secret.count", len(secret_ids))
+            if not secret_ids:
+                return []
+
+            try:
+                response = self._send(
+                    "list_by_project",
+                    "post",
+                    f"{self.region.api_url}/secrets/get-by-ids",
+                    json={"ids": secret_ids},
+                )
+            except requests.RequestException as e:
+                raise SendRequestError(f"Failed to send get-by-ids request: {e}")
+            self.raise_errors(response)
+
+            data, json_seconds = self._read_json(response)
+            return self._parse_secrets(
+                "list_by_project", data.get("data", []), listing_seconds + json_seconds
+            )
 
     def create(
         self, key: str, value: str, note: str, project_ids: list[str]
@@ -378,6 +1335,30 @@ class BWSecretClient:
             print(f"Created secret with ID: {created_secret.id}")
             ```
         """
+        secret = self._build_secret(key, value, note, project_ids)
+        # Encrypt the secret before sending to API
+        encrypted_secret = self._encrypt_secret(secret)
+        return self._post_secret(encrypted_secret)
+
+    @staticmethod
+    def _build_secret(
+        key: str, value: str, note: str, project_ids: list[str]
+    ) -> BitwardenSecretCreate:
+        """
+        Validate plaintext secret fields and build a BitwardenSecretCreate.
+
+        Args:
+            key (str): The key for the secret
+            value (str): The value for the secret
+            note (str): A note for the secret
+            project_ids (list[str]): A list of project IDs the secret is associated with
+
+        Returns:
+            BitwardenSecretCreate: The plaintext secret
+
+        Raises:
+            ValueError: If any of the fields has an invalid type or project_ids is empty
+        """
         if not isinstance(key, str):
             raise ValueError("Key must be a string")
         if not isinstance(value, str):
@@ -390,26 +1371,278 @@ class BWSecretClient:
             raise ValueError("Each project ID must be a string")
         if len(project_ids) == 0:
             raise ValueError("Project IDs list cannot be empty")
-        # Encrypt the secret before sending to API
-        secret = BitwardenSecretCreate(
+        return BitwardenSecretCreate(
             key=key,
             value=value,
             note=note,
             projectIds=project_ids,
         )
-        encrypted_secret = self._encrypt_secret(secret)
 
-        try:
-            self._reload_auth()
+    def _validate_secret(self, secret: BitwardenSecretCreate) -> BitwardenSecretCreate:
+        """
+        Validate a caller supplied BitwardenSecretCreate.
 
-            # Prepare the request payload
+        Args:
+            secret (BitwardenSecretCreate): The plaintext secret to validate
 
-            response = self.session.post(
-                f"{self.region.api_url}/organizations/{self.auth.org_id}/secrets",
-                json=encrypted_secret.model_dump(exclude_none=True),
-            )
-        except requests.RequestException as e:
-            raise SendRequestError(f"Failed to send create request: {e}")
+        Returns:
+            BitwardenSecretCreate: The validated plaintext secret
 
-        self.raise_errors(response)
-        return self._parse_secret(response.json())
+        Raises:
+            ValueError: If the secret is not a BitwardenSecretCreate or has invalid fields
+        """
+        if not isinstance(secret, BitwardenSecretCreate):
+            raise ValueError("Secret must be an instance of BitwardenSecretCreate")
+        return self._build_secret(
+            secret.key, secret.value, secret.note, secret.projectIds or []
+        )
+
+    def _post_secret(self, encrypted_secret: BitwardenSecretCreate) -> BitwardenSecret:
+        """
+        Send an encrypted secret to the create endpoint.
+
+        Args:
+            encrypted_secret (BitwardenSecretCreate): The encrypted secret to create
+
+        Returns:
+            BitwardenSecret: The created secret with decrypted key and value
+        """
+        with self._span("bws.create"):
+            try:
+                response = self._send(
+                    "create",
+                    "post",
+                    f"{self.region.api_url}/organizations/{self.auth.org_id}/secrets",
+                    json=encrypted_secret.model_dump(exclude_none=True),
+                )
+            except requests.RequestException as e:
+                raise SendRequestError(f"Failed to send create request: {e}")
+
+            self.raise_errors(response)
+            data, json_seconds = self._read_json(response)
+            return self._parse_secrets("create", [data], json_seconds)[0]
+
+    def _put_secret(
+        self, secret_id: str, encrypted_secret: BitwardenSecretCreate
+    ) -> BitwardenSecret:
+        """
+        Send an encrypted secret to the update endpoint.
+
+        Args:
+            secret_id (str): The unique identifier of the secret to update
+            encrypted_secret (BitwardenSecretCreate): The encrypted new contents
+
+        Returns:
+            BitwardenSecret: The updated secret with decrypted key and value
+        """
+        with self._span("bws.update", {"bws.secret.id": secret_id}):
+            try:
+                response = self._send(
+                    "update",
+                    "put",
+                    f"{self.region.api_url}/secrets/{secret_id}",
+                    json=encrypted_secret.model_dump(exclude_none=True),
+                )
+            except requests.RequestException as e:
+                raise SendRequestError(f"Failed to send update request: {e}")
+
+            self.raise_errors(response)
+            data, json_seconds = self._read_json(response)
+            return self._parse_secrets("update", [data], json_seconds)[0]
+
+    def create_many(
+        self, secrets: list[BitwardenSecretCreate]
+    ) -> list[BitwardenSecret]:
+        """
+        Create several secrets on the Bitwarden server.
+
+        All secrets are encrypted in a single pass before any request is sent, so a
+        secret with invalid fields fails the whole batch before anything is created.
+        Secrets are then created one request at a time and the batch stops at the
+        first failure, raising a BatchError with the secrets already created. If
+        the failing secret was created but its response could not be parsed, the
+        BatchError's `written` is True.
+
+        Args:
+            secrets (list[BitwardenSecretCreate]): The plaintext secrets to create
+
+        Returns:
+            list[BitwardenSecret]: The created secrets with decrypted key and value, in order
+
+        Raises:
+            ValueError: If any secret is not a BitwardenSecretCreate or has invalid fields
+            UnauthorisedError: If the request is unauthorized (HTTP 401)
+            ApiError: If the API returns a non-200 status code
+            SecretParseError: If a secret cannot be encrypted before sending
+            BatchError: If creating a secret fails, with the secrets created before it
+
+        Example:
+            ```python
+            from bws_sdk.bws_types import BitwardenSecretCreate
+
+            created = client.create_many([
+                BitwardenSecretCreate(key="db_user", value="app", note="", projectIds=[pid]),
+                BitwardenSecretCreate(key="db_pass", value="s3cret", note="", projectIds=[pid]),
+            ])
+            ```
+        """
+        plain = [self._validate_secret(secret) for secret in secrets]
+        return self._write_many(
+            "create",
+            [(secret,) for secret in self._encrypt_secrets(plain)],
+            self._post_secret,
+        )
+
+    def update(
+        self,
+        secret_id: str,
+        key: str,
+        value: str,
+        note: str,
+        project_ids: list[str],
+    ) -> BitwardenSecret:
+        """
+        Update an existing secret on the Bitwarden server.
+
+        Args:
+            secret_id (str): The unique identifier of the secret to update
+            key (str): The new key for the secret
+            value (str): The new value for the secret
+            note (str): The new note for the secret
+            project_ids (list[str]): The project IDs the secret is associated with
+
+        Returns:
+            BitwardenSecret: The updated secret with decrypted key and value
+
+        Raises:
+            ValueError: If any of the input parameters are of incorrect type
+            UnauthorisedError: If the request is unauthorized (HTTP 401)
+            SecretNotFoundError: If the secret does not exist (HTTP 404)
+            ApiError: If the API returns a non-200 status code
+            SecretParseError: If the secret cannot be encrypted or the response cannot be parsed
+            SendRequestError: If the network request fails
+        """
+        if not isinstance(secret_id, str):
+            raise ValueError("Secret ID must be a string")
+        secret = self._build_secret(key, value, note, project_ids)
+        return self._put_secret(secret_id, self._encrypt_secret(secret))
+
+    def update_many(
+        self, secrets: Mapping[str, BitwardenSecretCreate]
+    ) -> list[BitwardenSecret]:
+        """
+        Update several secrets on the Bitwarden server.
+
+        The new contents of all secrets are encrypted in a single pass before any
+        request is sent. Secrets are then updated one request at a time and the
+        batch stops at the first failure, raising a BatchError with the secrets
+        already updated. If the failing secret was updated but its response could
+        not be parsed, the BatchError's `written` is True.
+
+        Args:
+            secrets (Mapping[str, BitwardenSecretCreate]): New plaintext contents keyed by secret id
+
+        Returns:
+            list[BitwardenSecret]: The updated secrets with decrypted key and value, in order
+
+        Raises:
+            ValueError: If any id is not a string or any secret has invalid fields
+            SecretParseError: If a secret cannot be encrypted before sending
+            BatchError: If updating a secret fails, with the secrets updated before it
+        """
+        if not all(isinstance(secret_id, str) for secret_id in secrets):
+            raise ValueError("Secret ID must be a string")
+        plain = [self._validate_secret(secret) for secret in secrets.values()]
+        return self._write_many(
+            "update",
+            list(zip(secrets, self._encrypt_secrets(plain))),
+            self._put_secret,
+        )
+
+    @staticmethod
+    def _write_many(
+        action: str,
+        batch: list[tuple[Any, ...]],
+        write: Callable[..., BitwardenSecret],
+    ) -> list[BitwardenSecret]:
+        """
+        Write a batch of secrets in order, stopping at the first failure.
+
+        Args:
+            action (str): The verb reported in the error message, e.g. "create"
+            batch (list[tuple]): The arguments of every write
+            write (Callable[..., BitwardenSecret]): Sends one secret
+
+        Returns:
+            list[BitwardenSecret]: The written secrets, in order
+
+        Raises:
+            BatchError: If a write fails, with the secrets written before it
+        """
+        completed: list[BitwardenSecret] = []
+        for args in batch:
+            try:
+                completed.append(write(*args))
+            except SecretParseError as e:
+                # Only raised for a response the server sent after storing the secret
+                raise BatchError(
+                    f"Secret {len(completed) + 1} of {len(batch)} was {action}d but "
+                    f"its response could not be parsed: {e}",
+                    completed,
+                    e,
+                ) from e
+            except ApiError as e:
+                raise BatchError(
+                    f"Failed to {action} secret {len(completed) + 1} of "
+                    f"{len(batch)}: {e}",
+                    completed,
+                    e,
+                ) from e
+        return completed
+
+    def delete_many(self, secret_ids: list[str]) -> dict[str, str | None]:
+        """
+        Delete several secrets with a single bulk request.
+
+        Args:
+            secret_ids (list[str]): The unique identifiers of the secrets to delete
+
+        Returns:
+            dict[str, str | None]: The per-secret result keyed by id; None when the
+                secret was deleted, otherwise the error reported by the server
+
+        Raises:
+            ValueError: If secret_ids is not a list of strings
+            UnauthorisedError: If the request is unauthorized (HTTP 401)
+            ApiError: If the API returns a non-200 status code
+            SendRequestError: If the network request fails
+        """
+        if not isinstance(secret_ids, list):
+            raise ValueError("Secret IDs must be a list of strings")
+        if not all(isinstance(secret_id, str) for secret_id in secret_ids):
+            raise ValueError("Secret ID must be a string")
+        if not secret_ids:
+            return {}
+
+        with self._span("bws.delete_many", {"bws.secret.count": len(secret_ids)}):
+            try:
+                response = self._send(
+                    "delete_many",
+                    "post",
+                    f"{self.region.api_url}/secrets/delete",
+                    json=secret_ids,
+                )
+            except requests.RequestException as e:
+                raise SendRequestError(f"Failed to send delete request: {e}")
+            self.raise_errors(response)
+
+            data, _ = self._read_json(response)
+            results = {
+                result["id"]: result.get("error") or None
+                for result in data.get("data", [])
+            }
+        with self._last_good_lock:
+            for secret_id, error in results.items():
+                if error is None:
+                    self._last_good.pop(secret_id, None)
+        return results
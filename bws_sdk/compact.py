@@ -0,0 +1,244 @@
+"""
+Compact columnar storage of decrypted secrets for the BWS SDK.
+
+Holding a very large organization as `BitwardenSecret` models costs well over a
+kilobyte per secret: every model carries its own `__dict__`, two `datetime`
+objects, a copy of the organization id and a list of project models. This module
+stores the same data in columns instead and only builds models when a secret is
+accessed.
+
+Classes:
+    CompactSecretTable: Immutable columnar mapping of secret ids to secrets
+"""
+
+import sys
+from array import array
+from collections.abc import Iterable, Iterator, Mapping
+from datetime import datetime, timedelta, timezone
+
+from .bws_types import BitwardenProject, BitwardenSecret
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+def _to_micros(value: datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=timezone.utc)
+    return (value - _EPOCH) // timedelta(microseconds=1)
+
+
+def _from_micros(value: int) -> datetime:
+    return _EPOCH + timedelta(microseconds=value)
+
+
+class CompactSecretTable(Mapping[str, BitwardenSecret]):
+    """
+    Immutable columnar mapping of secret ids to decrypted secrets.
+
+    Secrets are stored in columns rather than as models:
+
+    - secret, organization and project ids are interned, and organization and
+      project ids are stored once in a lookup table referenced by index
+    - creation and revision dates are stored as microseconds since the epoch in
+      integer arrays
+    - keys and values are packed as UTF-8 into one shared buffer behind an offset
+      index
+
+    Looking up a secret materializes a new `BitwardenSecret` from the columns;
+    dates are returned in UTC. Changes produce a new table through `replace`, which
+    copies the packed bytes of the kept secrets without materializing them.
+
+    Example:
+        ```python
+        table = CompactSecretTable(client.sync(since).secrets)
+        secret = table["secret-id"]
+        ```
+    """
+
+    def __init__(self, secrets: Iterable[BitwardenSecret] = ()):
+        """
+        Initialize the CompactSecretTable.
+
+        Args:
+            secrets (Iterable[BitwardenSecret]): The secrets to store. A later
+                secret replaces an earlier one with the same id.
+        """
+        self._index: dict[str, int] = {}
+        self._ids: list[str] = []
+        self._names: list[str] = []
+        self._name_refs: dict[str, int] = {}
+        self._orgs = array("I")
+        self._created = array("q")
+        self._revised = array("q")
+        self._data = bytearray()
+        # Key i spans _offsets[2i]:_offsets[2i + 1], its value up to _offsets[2i + 2]
+        self._offsets = array("Q", [0])
+        self._projects = array("I")
+        self._project_offsets = array("I", [0])
+        for secret in {secret.id: secret for secret in secrets}.values():
+            self._append_secret(secret)
+
+    def _name_ref(self, name: str) -> int:
+        ref = self._name_refs.get(name)
+        if ref is None:
+            ref = self._name_refs[name] = len(self._names)
+            self._names.append(sys.intern(name))
+        return ref
+
+    def _append(
+        self,
+        secret_id: str,
+        org_id: str,
+        created: int,
+        revised: int,
+        key: bytes | memoryview,
+        value: bytes | memoryview,
+        project_ids: Iterable[str],
+    ) -> None:
+        self._index[sys.intern(secret_id)] = len(self._ids)
+        self._ids.append(sys.intern(secret_id))
+        self._orgs.append(self._name_ref(org_id))
+        self._created.append(created)
+        self._revised.append(revised)
+        self._data += key
+        self._offsets.append(len(self._data))
+        self._data += value
+        self._offsets.append(len(self._data))
+        self._projects.extend(self._name_ref(pid) for pid in project_ids)
+        self._project_offsets.append(len(self._projects))
+
+    def _append_secret(self, secret: BitwardenSecret) -> None:
+        self._append(
+            secret.id,
+            secret.organizationId,
+            _to_micros(secret.creationDate),
+            _to_micros(secret.revisionDate),
+            secret.key.encode("utf-8"),
+            secret.value.encode("utf-8"),
+            [project.id for project in secret.projects],
+        )
+
+    def _project_ids(self, row: int) -> list[str]:
+        start, end = self._project_offsets[row], self._project_offsets[row + 1]
+        return [self._names[ref] for ref in self._projects[start:end]]
+
+    def _materialize(self, row: int) -> BitwardenSecret:
+        offsets = self._offsets
+        data = memoryview(self._data)
+        return BitwardenSecret.model_construct(
+            id=self._ids[row],
+            organizationId=self._names[self._orgs[row]],
+            key=str(data[offsets[2 * row] : offsets[2 * row + 1]], "utf-8"),
+            value=str(data[offsets[2 * row + 1] : offsets[2 * row + 2]], "utf-8"),
+            creationDate=_from_micros(self._created[row]),
+            revisionDate=_from_micros(self._revised[row]),
+            projects=[
+                BitwardenProject.model_construct(id=pid)
+                for pid in self._project_ids(row)
+            ],
+        )
+
+    def __getitem__(self, secret_id: str) -> BitwardenSecret:
+        return self._materialize(self._index[secret_id])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._ids)
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, secret_id: object) -> bool:
+        return secret_id in self._index
+
+    def key_of(self, secret_id: str) -> str:
+        """
+        Get the key name of a secret without materializing it.
+
+        Args:
+            secret_id (str): The unique identifier of the secret
+
+        Returns:
+            str: The decrypted key name
+
+        Raises:
+            KeyError: If the secret is not held
+        """
+        row = self._index[secret_id]
+        start, end = self._offsets[2 * row], self._offsets[2 * row + 1]
+        return str(memoryview(self._data)[start:end], "utf-8")
+
+    def revision(self, secret_id: str) -> datetime | None:
+        """
+        Get the revision date of a secret without materializing it.
+
+        Args:
+            secret_id (str): The unique identifier of the secret
+
+        Returns:
+            datetime | None: The revision date in UTC, or None if the secret is not held
+        """
+        row = self._index.get(secret_id)
+        return None if row is None else _from_micros(self._revised[row])
+
+    def revisions(self) -> dict[str, datetime]:
+        """
+        Get the revision dates of all secrets, e.g. for an incremental sync.
+
+        Returns:
+            dict[str, datetime]: The revision date in UTC of every secret, by id
+        """
+        return {
+            secret_id: _from_micros(revised)
+            for secret_id, revised in zip(self._ids, self._revised)
+        }
+
+    def project_index(self) -> dict[str, set[str]]:
+        """
+        Get the ids of the secrets of every project without materializing them.
+
+        Returns:
+            dict[str, set[str]]: The secret ids associated with each project id
+        """
+        index: dict[str, set[str]] = {}
+        for row, secret_id in enumerate(self._ids):
+            for pid in self._project_ids(row):
+                index.setdefault(pid, set()).add(secret_id)
+        return index
+
+    def replace(
+        self, secrets: Iterable[BitwardenSecret], keep: Iterable[str]
+    ) -> "CompactSecretTable":
+        """
+        Build a new table from some of the held secrets and new or revised ones.
+
+        The packed data of the kept secrets is copied without materializing them.
+
+        Args:
+            secrets (Iterable[BitwardenSecret]): New and revised secrets to store;
+                they replace held secrets with the same id
+            keep (Iterable[str]): Ids of held secrets to carry over, unknown ids
+                are ignored
+
+        Returns:
+            CompactSecretTable: The new table; this one is left unchanged
+        """
+        replacements = {secret.id: secret for secret in secrets}
+        table = CompactSecretTable()
+        data = memoryview(self._data)
+        offsets = self._offsets
+        for secret_id in keep:
+            row = self._index.get(secret_id)
+            if row is None or secret_id in replacements or secret_id in table:
+                continue
+            table._append(
+                secret_id,
+                self._names[self._orgs[row]],
+                self._created[row],
+                self._revised[row],
+                data[offsets[2 * row] : offsets[2 * row + 1]],
+                data[offsets[2 * row + 1] : offsets[2 * row + 2]],
+                self._project_ids(row),
+            )
+        for secret in replacements.values():
+            table._append_secret(secret)
+        return table
@@ -14,20 +14,20 @@ Classes:
 """
 
 import base64
-import hashlib
-import hmac
 import logging
 import os
+from collections.abc import Generator, Sequence
 from enum import Enum
+from typing import Any, BinaryIO
 
-from cryptography.hazmat.primitives import hashes, padding
-from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
-from cryptography.hazmat.primitives.kdf.hkdf import HKDFExpand
-
+# hmac, hashlib and the cryptography primitives are imported on first use so that
+# importing the SDK does not pay for loading OpenSSL bindings up front.
 from .errors import HmacError, InvalidEncryptedFormat, InvalidEncryptionKeyError
 
 logger = logging.getLogger(__name__)
 
+STREAM_CHUNK_SIZE = 64 * 1024
+
 
 class SymmetricCryptoKey:
     """
@@ -98,6 +98,12 @@ class SymmetricCryptoKey:
         if len(secret) != 16:
             raise ValueError("Secret must be exactly 16 bytes")
 
+        import hashlib
+        import hmac
+
+        from cryptography.hazmat.primitives import hashes
+        from cryptography.hazmat.primitives.kdf.hkdf import HKDFExpand
+
         # Create HMAC with "bitwarden-{name}" as the key
         key_material = f"bitwarden-{name}".encode("utf-8")
         hmac_obj = hmac.new(key_material, msg=secret, digestmod=hashlib.sha256)
@@ -336,13 +342,314 @@ class EncryptedValue:
         Returns:
             EncryptedValue: New EncryptedValue instance with verified components
         """
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
         iv = os.urandom(16)
-        padded_data = cls._pad(data.encode("utf-8"))
-        enc_data = cls.encrypt_aes(key.key, padded_data, iv)
+        plaintext = data.encode("utf-8")
+        buffer = bytearray(cls.buffer_size(len(plaintext)))
+        encryptor = Cipher(algorithms.AES(key.key), modes.CBC(iv)).encryptor()
+        enc_data = bytes(buffer[: cls._encrypt_into(encryptor, plaintext, buffer)])
         mac = cls.generate_mac(key.mac_key, iv, enc_data)
         algo = AlgoEnum.AES256 if len(key.key) == 32 else AlgoEnum.AES128
         return cls(algo=algo, iv=iv, data=enc_data, mac=mac)
 
+    @classmethod
+    def from_data_many(
+        cls, key: SymmetricCryptoKey, data: Sequence[str]
+    ) -> list["EncryptedValue"]:
+        """
+        Encrypt several plaintext strings in one pass.
+
+        Produces the same result as calling `from_data` for every item, but draws
+        all IVs from a single `os.urandom` call and reuses the AES algorithm and
+        HMAC key context across items.
+
+        Args:
+            key (SymmetricCryptoKey): The symmetric key used for encryption and MAC
+            data (Sequence[str]): The plaintext strings to encrypt
+
+        Returns:
+            list[EncryptedValue]: One EncryptedValue per input string, in order
+        """
+        import hashlib
+        import hmac
+
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+        ivs = os.urandom(16 * len(data))
+        aes = algorithms.AES(key.key)
+        base_mac = hmac.new(key.mac_key, digestmod=hashlib.sha256)
+        algo = AlgoEnum.AES256 if len(key.key) == 32 else AlgoEnum.AES128
+
+        values = []
+        for i, item in enumerate(data):
+            iv = ivs[16 * i : 16 * (i + 1)]
+            plaintext = item.encode("utf-8")
+            buffer = bytearray(cls.buffer_size(len(plaintext)))
+            encryptor = Cipher(aes, modes.CBC(iv)).encryptor()
+            enc_data = bytes(buffer[: cls._encrypt_into(encryptor, plaintext, buffer)])
+            mac = base_mac.copy()
+            mac.update(iv)
+            mac.update(enc_data)
+            values.append(cls(algo=algo, iv=iv, data=enc_data, mac=mac.digest()))
+        return values
+
+    @staticmethod
+    def buffer_size(length: int) -> int:
+        """
+        Get the buffer size needed to encrypt or decrypt `length` bytes in place.
+
+        Args:
+            length (int): The number of plaintext bytes to encrypt, or encrypted
+                bytes to decrypt
+
+        Returns:
+            int: The minimum length of the buffer passed to `encrypt_into` or
+                `decrypt_into`
+        """
+        # update_into needs room for one block more than the padded input, minus one
+        return length // 16 * 16 + 31
+
+    @classmethod
+    def encrypt_into(
+        cls,
+        key: bytes,
+        data: bytes | bytearray | memoryview,
+        iv: bytes,
+        buffer: bytearray,
+    ) -> int:
+        """
+        Encrypt data using AES-CBC with PKCS7 padding into a caller-supplied buffer.
+
+        Unlike `_pad` and `encrypt_aes`, no padded copy of the plaintext is made:
+        the full blocks are encrypted straight from `data` and only the last block
+        is padded separately.
+
+        Args:
+            key (bytes): The encryption key for AES
+            data (bytes | bytearray | memoryview): The plaintext to encrypt
+            iv (bytes): The initialization vector for AES
+            buffer (bytearray): The buffer the encrypted data is written to, of at
+                least `buffer_size(len(data))` bytes
+
+        Returns:
+            int: The number of encrypted bytes written to the start of the buffer
+
+        Raises:
+            ValueError: If the buffer is too small
+        """
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+        size = cls.buffer_size(len(data))
+        if len(buffer) < size:
+            raise ValueError(f"Buffer must be at least {size} bytes long")
+        encryptor = Cipher(algorithms.AES(key), modes.CBC(iv)).encryptor()
+        return cls._encrypt_into(encryptor, data, buffer)
+
+    @staticmethod
+    def _encrypt_into(
+        encryptor: Any, data: bytes | bytearray | memoryview, buffer: bytearray
+    ) -> int:
+        """
+        Pad and encrypt data with an AES-CBC encryptor into a buffer.
+
+        Args:
+            encryptor (Any): A fresh AES-CBC encryptor context
+            data (bytes | bytearray | memoryview): The plaintext to encrypt
+            buffer (bytearray): The buffer of at least `buffer_size(len(data))` bytes
+
+        Returns:
+            int: The number of encrypted bytes written to the start of the buffer
+        """
+        full = len(data) - len(data) % 16
+        pad_len = 16 - len(data) % 16
+        with memoryview(buffer) as out, memoryview(data) as source:
+            written = encryptor.update_into(source[:full], out) if full else 0
+            last_block = bytes(source[full:]) + bytes((pad_len,)) * pad_len
+            written += encryptor.update_into(last_block, out[written:])
+        encryptor.finalize()
+        return written
+
+    @staticmethod
+    def encrypt_stream(
+        key: SymmetricCryptoKey,
+        source: BinaryIO,
+        dest: BinaryIO,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> None:
+        """
+        Encrypt a binary stream into a Bitwarden encrypted string.
+
+        The plaintext is read, padded, encrypted, MACed and base64-encoded in chunks,
+        so memory use is bounded by `chunk_size` rather than the size of the input.
+        The ASCII encoded result written to `dest` is identical to
+        `EncryptedValue.from_data(...).to_str()` for the same plaintext and IV.
+
+        Args:
+            key (SymmetricCryptoKey): The symmetric key used for encryption and MAC
+            source (BinaryIO): Readable binary stream with the plaintext
+            dest (BinaryIO): Writable binary stream the encrypted string is written to
+            chunk_size (int): Number of plaintext bytes read at a time
+
+        Raises:
+            ValueError: If chunk_size is not positive
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+
+        import hashlib
+        import hmac
+
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+        iv = os.urandom(16)
+        algo = AlgoEnum.AES256 if len(key.key) == 32 else AlgoEnum.AES128
+        encryptor = Cipher(algorithms.AES(key.key), modes.CBC(iv)).encryptor()
+        padder = padding.PKCS7(128).padder()
+        mac = hmac.new(key.mac_key, iv, digestmod=hashlib.sha256)
+
+        dest.write(algo.value.encode("ascii") + b"." + base64.b64encode(iv) + b"|")
+        # base64 output only concatenates cleanly for inputs that are multiples of
+        # 3 bytes, so up to 2 bytes of ciphertext are carried over between chunks
+        pending = b""
+        final = False
+        while not final:
+            chunk = source.read(chunk_size)
+            if chunk:
+                enc_data = encryptor.update(padder.update(chunk))
+            else:
+                final = True
+                enc_data = encryptor.update(padder.finalize()) + encryptor.finalize()
+            mac.update(enc_data)
+            pending += enc_data
+            cut = len(pending) - len(pending) % 3
+            if cut:
+                dest.write(base64.b64encode(pending[:cut]))
+                pending = pending[cut:]
+        dest.write(base64.b64encode(pending) + b"|" + base64.b64encode(mac.digest()))
+
+    @classmethod
+    def decrypt_stream(
+        cls,
+        key: SymmetricCryptoKey,
+        source: BinaryIO,
+        dest: BinaryIO,
+        chunk_size: int = STREAM_CHUNK_SIZE,
+    ) -> None:
+        """
+        Decrypt a Bitwarden encrypted string from a binary stream.
+
+        The source is read twice in chunks: the first pass verifies the MAC and the
+        second decrypts, so no plaintext is written to `dest` unless the MAC is valid
+        and memory use is bounded by `chunk_size`. The source must therefore be
+        seekable; reading starts at its current position.
+
+        Args:
+            key (SymmetricCryptoKey): The symmetric key containing both
+                                     encryption and MAC components
+            source (BinaryIO): Seekable binary stream with the ASCII encrypted string
+            dest (BinaryIO): Writable binary stream the plaintext is written to
+            chunk_size (int): Number of encrypted string bytes read at a time
+
+        Raises:
+            ValueError: If chunk_size is not positive, the source is not seekable
+                or the padding is invalid
+            InvalidEncryptedFormat: If the encrypted string format is invalid
+            HmacError: If MAC verification fails (indicates tampering or wrong key)
+        """
+        if chunk_size <= 0:
+            raise ValueError("Chunk size must be positive")
+        if not source.seekable():
+            raise ValueError("Source must be seekable")
+
+        import hashlib
+        import hmac
+
+        from cryptography.hazmat.primitives import padding
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
+        start = source.tell()
+        try:
+            # "2." + 24 base64 characters of IV + "|" fit in the first 27 bytes
+            header = source.read(32)
+            end = header.find(b"|")
+            if end == -1:
+                raise ValueError("Invalid encrypted data format")
+            _, iv_b64, _, _ = cls.decode(header[:end].decode("ascii") + "||")
+            iv = base64.b64decode(iv_b64, validate=True)
+            if len(iv) != 16:
+                raise ValueError("IV must be 16 bytes long")
+            data_start = start + end + 1
+
+            mac = hmac.new(key.mac_key, iv, digestmod=hashlib.sha256)
+            source.seek(data_start)
+            chunks = cls._iter_stream_data(source, chunk_size)
+            size = 0
+            while True:
+                try:
+                    enc_data = next(chunks)
+                except StopIteration as stop:
+                    expected_mac = base64.b64decode(stop.value, validate=True)
+                    break
+                mac.update(enc_data)
+                size += len(enc_data)
+            if size == 0:
+                raise ValueError("Data cannot be empty")
+            if len(expected_mac) != 32:
+                raise ValueError("MAC must be 32 bytes long")
+        except ValueError as e:
+            raise InvalidEncryptedFormat("Invalid encrypted format") from e
+
+        if not hmac.compare_digest(mac.digest(), expected_mac):
+            raise HmacError("MAC verification failed")
+
+        decryptor = Cipher(algorithms.AES(key.key), modes.CBC(iv)).decryptor()
+        unpadder = padding.PKCS7(128).unpadder()
+        source.seek(data_start)
+        chunks = cls._iter_stream_data(source, chunk_size)
+        for enc_data in chunks:
+            dest.write(unpadder.update(decryptor.update(enc_data)))
+        dest.write(unpadder.update(decryptor.finalize()) + unpadder.finalize())
+
+    @staticmethod
+    def _iter_stream_data(
+        source: BinaryIO, chunk_size: int
+    ) -> Generator[bytes, None, bytes]:
+        """
+        Decode the base64 data section of an encrypted string stream in chunks.
+
+        Args:
+            source (BinaryIO): Binary stream positioned at the start of the data section
+            chunk_size (int): Number of bytes read at a time
+
+        Yields:
+            bytes: Consecutive chunks of the decoded encrypted data
+
+        Returns:
+            bytes: The base64 encoded MAC following the data section
+
+        Raises:
+            ValueError: If the data section is not terminated or not valid base64
+        """
+        pending = b""
+        while True:
+            chunk = source.read(chunk_size)
+            if not chunk:
+                raise ValueError("Invalid encrypted data format")
+            end = chunk.find(b"|")
+            if end != -1:
+                pending += chunk[:end]
+                if pending:
+                    yield base64.b64decode(pending, validate=True)
+                # The MAC is 44 base64 characters; read a little more to detect garbage
+                return chunk[end + 1 :] + source.read(64)
+            pending += chunk
+            cut = len(pending) - len(pending) % 4
+            if cut:
+                yield base64.b64decode(pending[:cut], validate=True)
+                pending = pending[cut:]
+
     def to_str(self) -> str:
         """
         Convert the EncryptedValue to a Bitwarden encrypted string.
@@ -375,6 +682,9 @@ class EncryptedValue:
         Note:
             The MAC is computed over the concatenation of IV + encrypted_data.
         """
+        import hashlib
+        import hmac
+
         hmac_obj = hmac.new(key, digestmod=hashlib.sha256)
         hmac_obj.update(iv)
         hmac_obj.update(encrypted_data)
@@ -396,6 +706,8 @@ class EncryptedValue:
         Raises:
             ValueError: If padding is invalid or corrupted
         """
+        from cryptography.hazmat.primitives import padding
+
         unpadder = padding.PKCS7(128).unpadder()
         unpadded_data = unpadder.update(data)
         unpadded_data += unpadder.finalize()
@@ -411,10 +723,8 @@ class EncryptedValue:
         Returns:
             bytes: Padded data suitable for AES block size
         """
-        padder = padding.PKCS7(128).padder()
-        padded_data = padder.update(data)
-        padded_data += padder.finalize()
-        return padded_data
+        pad_len = 16 - len(data) % 16
+        return data + bytes((pad_len,)) * pad_len
 
     def _decrypt_aes(self, key: bytes) -> bytes:
         """
@@ -432,6 +742,8 @@ class EncryptedValue:
         Raises:
             ValueError: If decryption fails or padding is invalid
         """
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
         cipher = Cipher(algorithms.AES(key), modes.CBC(self.iv))
         decryptor = cipher.decryptor()
         data = decryptor.update(self.data) + decryptor.finalize()
@@ -453,6 +765,8 @@ class EncryptedValue:
         Note:
             You must ensure that `padded_data` is already padded to the AES block size.
         """
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
         cipher = Cipher(algorithms.AES(key), modes.CBC(iv))
         encryptor = cipher.encryptor()
         encrypted_data = encryptor.update(padded_data) + encryptor.finalize()
@@ -481,8 +795,57 @@ class EncryptedValue:
             This method ensures authenticated encryption by verifying the MAC
             before performing decryption, preventing tampering attacks.
         """
+        with self.decrypt_into(key) as plaintext:
+            return bytes(plaintext)
+
+    def decrypt_into(
+        self, key: SymmetricCryptoKey, buffer: bytearray | None = None
+    ) -> memoryview:
+        """
+        Decrypt the encrypted value into a buffer without intermediate copies.
+
+        The MAC is verified first, the data is decrypted with `update_into` and the
+        PKCS7 padding is stripped by slicing the returned view. Passing a reused
+        buffer avoids allocating per value; the returned view is only valid until
+        the buffer is written to again.
+
+        Args:
+            key (SymmetricCryptoKey): The symmetric key containing both
+                                     encryption and MAC components
+            buffer (bytearray | None): The buffer to decrypt into, of at least
+                `buffer_size(len(self.data))` bytes. A new one is allocated if None.
+
+        Returns:
+            memoryview: A view of the plaintext in the buffer
+
+        Raises:
+            HmacError: If MAC verification fails (indicates tampering or wrong key)
+            ValueError: If the buffer is too small, decryption fails or the padding
+                is invalid
+        """
+        import hmac
+
+        from cryptography.hazmat.primitives.ciphers import Cipher, algorithms, modes
+
         mac = self.generate_mac(key.mac_key, self.iv, self.data)
         if not hmac.compare_digest(mac, self.mac):
             raise HmacError("MAC verification failed")
 
-        return self._decrypt_aes(key.key)
+        size = self.buffer_size(len(self.data))
+        if buffer is None:
+            buffer = bytearray(size)
+        elif len(buffer) < size:
+            raise ValueError(f"Buffer must be at least {size} bytes long")
+
+        decryptor = Cipher(algorithms.AES(key.key), modes.CBC(self.iv)).decryptor()
+        out = memoryview(buffer)
+        written = decryptor.update_into(self.data, out)
+        decryptor.finalize()
+        pad_len = out[written - 1]
+        if (
+            not 1 <= pad_len <= 16
+            or out[written - pad_len : written] != bytes((pad_len,)) * pad_len
+        ):
+            out.release()
+            raise ValueError("Invalid padding bytes")
+        return out[: written - pad_len]
@@ -0,0 +1,153 @@
+"""
+Endpoint selection for regions with several API endpoints.
+
+This module provides the selector `BWSecretClient` uses when a `Region` lists
+mirrors. It keeps a smoothed latency estimate and a health state per endpoint and
+orders the endpoints so that requests go to the fastest healthy one, with the
+others as failover targets.
+
+Classes:
+    EndpointSelector: Latency and health based ordering of endpoint URLs
+"""
+
+import threading
+import time
+from collections.abc import Callable
+
+
+class EndpointSelector:
+    """
+    Order endpoints by health and measured latency.
+
+    Every successful request updates the endpoint's latency estimate with an
+    exponentially weighted moving average. A connection error marks the endpoint
+    down for `cooldown` seconds; down endpoints are only tried after all healthy
+    ones. Endpoints without a latency measurement are tried before measured ones
+    so that every endpoint gets measured, in the order they were given.
+
+    Only the endpoint a request is sent to is measured, so an estimate expires
+    `max_age` seconds after its last sample. The endpoint then counts as
+    unmeasured again and the next request re-probes it, so that a single slow
+    sample cannot keep an endpoint behind the others for good.
+
+    Attributes:
+        urls (list[str]): The endpoint URLs, primary first
+        cooldown (float): Seconds an endpoint is considered down after a connection error
+        smoothing (float): Weight of the newest sample in the latency average
+        max_age (float): Seconds after its last sample that a latency estimate expires
+    """
+
+    def __init__(
+        self,
+        urls: list[str],
+        cooldown: float = 30.0,
+        smoothing: float = 0.3,
+        max_age: float = 300.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the EndpointSelector.
+
+        Args:
+            urls (list[str]): The endpoint URLs, primary first
+            cooldown (float): Seconds an endpoint is considered down after a connection error
+            smoothing (float): Weight of the newest sample in the latency average
+            max_age (float): Seconds after its last sample that a latency estimate
+                expires and the endpoint is measured again
+            clock (Callable[[], float]): Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If any of the input parameters are out of range
+        """
+        if not urls:
+            raise ValueError("At least one endpoint URL is required")
+        if cooldown < 0:
+            raise ValueError("Cooldown must not be negative")
+        if not 0 < smoothing <= 1:
+            raise ValueError("Smoothing must be between 0 and 1")
+        if max_age <= 0:
+            raise ValueError("Max age must be positive")
+
+        self.urls = list(urls)
+        self.cooldown = cooldown
+        self.smoothing = smoothing
+        self.max_age = max_age
+        self._clock = clock
+        self._latency: dict[str, float] = {}
+        self._measured_at: dict[str, float] = {}
+        self._down_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def order(self) -> list[str]:
+        """
+        Get the endpoints in the order they should be tried.
+
+        Returns:
+            list[str]: Healthy endpoints by ascending latency, then endpoints marked down
+        """
+        now = self._clock()
+        with self._lock:
+            latency = self._current(now)
+            down_until = dict(self._down_until)
+
+        def rank(item: tuple[int, str]) -> tuple[bool, bool, float, int]:
+            index, url = item
+            measured = latency.get(url)
+            return (
+                down_until.get(url, 0.0) > now,
+                measured is not None,
+                measured or 0.0,
+                index,
+            )
+
+        return [url for _, url in sorted(enumerate(self.urls), key=rank)]
+
+    def latency(self, url: str) -> float | None:
+        """
+        Get the smoothed latency of an endpoint.
+
+        Args:
+            url (str): The endpoint URL
+
+        Returns:
+            float | None: The latency estimate in seconds, None if never measured or
+                if the estimate expired
+        """
+        with self._lock:
+            return self._current(self._clock()).get(url)
+
+    def _current(self, now: float) -> dict[str, float]:
+        # Called with the lock held
+        return {
+            url: latency
+            for url, latency in self._latency.items()
+            if now - self._measured_at[url] < self.max_age
+        }
+
+    def record_success(self, url: str, latency: float) -> None:
+        """
+        Record a request that reached an endpoint.
+
+        Args:
+            url (str): The endpoint URL
+            latency (float): Seconds until the response headers arrived
+        """
+        now = self._clock()
+        with self._lock:
+            previous = self._current(now).get(url)
+            if previous is None:
+                self._latency[url] = latency
+            else:
+                self._latency[url] = previous + self.smoothing * (latency - previous)
+            self._measured_at[url] = now
+            self._down_until.pop(url, None)
+
+    def record_failure(self, url: str) -> None:
+        """
+        Mark an endpoint down after a connection error.
+
+        Args:
+            url (str): The endpoint URL
+        """
+        with self._lock:
+            self._down_until[url] = self._clock() + self.cooldown
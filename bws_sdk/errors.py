@@ -9,10 +9,13 @@ Exception Hierarchy:
     BWSSDKError (base)
     ├── ApiError
     │   ├── SendRequestError
+    │   │   └── CircuitOpenError
     │   ├── SecretParseError
     │   ├── UnauthorisedError
     │   ├── SecretNotFoundError
-    │   └── APIRateLimitError
+    │   ├── APIRateLimitError
+    │   └── BatchError
+    ├── ProjectionError
     ├── AuthError
     │   ├── InvalidTokenError
     │   ├── UnauthorisedTokenError
@@ -24,6 +27,11 @@ Exception Hierarchy:
         └── InvalidEncryptionKeyError
 """
 
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .bws_types import BitwardenSecret
+
 
 class BWSSDKError(Exception):
     """
@@ -57,6 +65,16 @@ class SendRequestError(ApiError):
     """
 
 
+class CircuitOpenError(SendRequestError):
+    """
+    Raised when a request is rejected by an open circuit breaker.
+
+    This exception indicates that recent requests to the BWS API kept
+    failing, so the request was not sent in order to fail fast until the
+    breaker's cooldown has elapsed.
+    """
+
+
 class SecretParseError(ApiError):
     """
     Raised when a secret cannot be parsed or decrypted.
@@ -96,6 +114,46 @@ class APIRateLimitError(ApiError):
     """
 
 
+class BatchError(ApiError):
+    """
+    Raised when a batch of secrets fails part way through.
+
+    Batches are written one request at a time, in order, and stop at the first
+    failure. This exception reports the secrets written before the failing one,
+    so that a retry can skip them instead of creating duplicates. The secret at
+    index `len(completed)` failed and the secrets after it were not sent.
+
+    If the server accepted the failing secret but its response could not be
+    parsed, `error` is a SecretParseError and `written` is True: the secret was
+    stored, so a retry must skip it as well.
+
+    Attributes:
+        completed (list[BitwardenSecret]): The secrets written before the failure
+        error (ApiError): The error raised for the failing secret
+        written (bool): Whether the failing secret was stored by the server
+    """
+
+    def __init__(
+        self, message: str, completed: "list[BitwardenSecret]", error: ApiError
+    ):
+        super().__init__(message)
+        self.completed = completed
+        self.error = error
+        self.written = isinstance(error, SecretParseError)
+
+
+# Projection Errors
+
+
+class ProjectionError(BWSSDKError):
+    """
+    Raised when secrets cannot be projected into environment variables or files.
+
+    This exception occurs when a projection refers to a secret that does
+    not exist, or to a secret key name that is shared by several secrets.
+    """
+
+
 # Auth Errors
 
 
@@ -0,0 +1,143 @@
+"""
+Request hedging for the BWS SDK.
+
+This module provides the policy `BWSecretClient` uses to hedge `get_by_id`
+requests. When a request has not answered within a delay taken from a percentile
+of recently observed latencies, a duplicate request is sent and whichever answers
+first is used. The share of hedged requests is capped so that hedging cannot use up
+the rate limit budget.
+
+Classes:
+    HedgePolicy: Latency tracking, hedge delay and hedge rate limiting
+"""
+
+import math
+import threading
+from collections import deque
+
+
+class HedgePolicy:
+    """
+    Decide when and how often requests are hedged.
+
+    The hedge delay is the `percentile` of the last `window` observed request
+    latencies, clamped to `min_delay` and `max_delay`. No requests are hedged
+    until `min_samples` latencies have been observed. At most `max_ratio` of the
+    last `window` requests are hedged.
+
+    Hedged requests run on up to `max_workers` worker threads per client. When all
+    of them are busy, requests are sent from the calling thread without a hedge
+    rather than queued, so no request waits for a worker.
+
+    Attributes:
+        percentile (float): Latency percentile used as the hedge delay
+        min_delay (float): Lower bound for the hedge delay in seconds
+        max_delay (float): Upper bound for the hedge delay in seconds
+        max_ratio (float): Maximum fraction of requests that may be hedged
+        window (int): Number of recent requests latencies and the hedge rate are tracked over
+        min_samples (int): Latencies required before hedging starts
+        max_workers (int): Maximum number of requests running on worker threads
+
+    Example:
+        ```python
+        client = BWSecretClient(region, access_token, hedge=HedgePolicy(percentile=95))
+        ```
+    """
+
+    def __init__(
+        self,
+        percentile: float = 95.0,
+        min_delay: float = 0.01,
+        max_delay: float = 2.0,
+        max_ratio: float = 0.05,
+        window: int = 256,
+        min_samples: int = 20,
+        max_workers: int = 32,
+    ):
+        """
+        Initialize the HedgePolicy.
+
+        Args:
+            percentile (float): Latency percentile used as the hedge delay
+            min_delay (float): Lower bound for the hedge delay in seconds
+            max_delay (float): Upper bound for the hedge delay in seconds
+            max_ratio (float): Maximum fraction of requests that may be hedged
+            window (int): Number of recent requests latencies and the hedge rate are tracked over
+            min_samples (int): Latencies required before hedging starts
+            max_workers (int): Maximum number of requests running on worker threads
+
+        Raises:
+            ValueError: If any of the input parameters are out of range
+        """
+        if not 0 < percentile < 100:
+            raise ValueError("Percentile must be between 0 and 100")
+        if min_delay < 0 or max_delay < min_delay:
+            raise ValueError("Delays must be non-negative and max >= min")
+        if not 0 <= max_ratio <= 1:
+            raise ValueError("Max ratio must be between 0 and 1")
+        if window < 1 or not 1 <= min_samples <= window:
+            raise ValueError("Window must be positive and min samples within it")
+        if max_workers < 1:
+            raise ValueError("Max workers must be at least 1")
+
+        self.percentile = percentile
+        self.min_delay = min_delay
+        self.max_delay = max_delay
+        self.max_ratio = max_ratio
+        self.window = window
+        self.min_samples = min_samples
+        self.max_workers = max_workers
+        self._latencies: deque[float] = deque(maxlen=window)
+        # One entry per request sent, True for hedged requests
+        self._sent: deque[bool] = deque(maxlen=window)
+        self._lock = threading.Lock()
+
+    def record(self, latency: float) -> None:
+        """
+        Record the latency of a completed request.
+
+        Args:
+            latency (float): Seconds the request took to answer
+        """
+        with self._lock:
+            self._latencies.append(latency)
+
+    def delay(self) -> float | None:
+        """
+        Get the delay after which a request should be hedged.
+
+        Returns:
+            float | None: The hedge delay in seconds, or None while too few
+                latencies have been observed
+        """
+        with self._lock:
+            if len(self._latencies) < self.min_samples:
+                return None
+            ordered = sorted(self._latencies)
+        index = min(
+            len(ordered) - 1, math.ceil(len(ordered) * self.percentile / 100) - 1
+        )
+        return min(max(ordered[index], self.min_delay), self.max_delay)
+
+    def start_request(self) -> None:
+        """
+        Count a request towards the window the hedge rate is capped in.
+        """
+        with self._lock:
+            self._sent.append(False)
+
+    def try_hedge(self) -> bool:
+        """
+        Reserve a hedged request if the hedge rate cap allows it.
+
+        Hedged requests count towards the window themselves, so at most
+        `max_ratio` of all requests sent are hedges.
+
+        Returns:
+            bool: True if a hedged request may be sent
+        """
+        with self._lock:
+            if sum(self._sent) + 1 > self.max_ratio * (len(self._sent) + 1):
+                return False
+            self._sent.append(True)
+            return True
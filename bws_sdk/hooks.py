@@ -0,0 +1,320 @@
+"""
+Instrumentation hooks for the BWS SDK.
+
+This module defines the hooks interface that `BWSecretClient` and `Auth` report to,
+together with the metric models passed to it and two ready-made adapters. Hooks are
+optional; when none are configured the SDK skips all timing and metric collection.
+
+Classes:
+    RequestMetrics: Timing and outcome of a single HTTP request to the API
+    AuthMetrics: Timing and outcome of an authentication
+    DecryptMetrics: Stage timings of decoding a batch of secrets from a response
+    SDKHooks: Base class for instrumentation hooks, every method is a no-op
+    LoggingHooks: Hooks that log every event
+    PrometheusHooks: Hooks that aggregate events into Prometheus text format metrics
+"""
+
+import logging
+import threading
+from collections import defaultdict
+
+from pydantic import BaseModel
+
+_Labels = tuple[tuple[str, str], ...]
+
+
+class RequestMetrics(BaseModel):
+    """
+    Model describing a single HTTP request made to the BWS API.
+
+    Attributes:
+        operation (str): The SDK operation that sent the request, e.g. "get_by_id"
+        method (str): The HTTP method
+        url (str): The requested URL
+        status_code (int | None): The response status code, None if no response was received
+        elapsed (float): Seconds spent sending the request and receiving the response
+        retries (int): Number of earlier attempts of the same operation, i.e. failed
+            attempts on other endpoints of the region, or 1 for a hedged request
+        ratelimit_remaining (int | None): Requests left in the rate limit window, if reported
+        content_bytes (int | None): Size of the response body after decompression, if known
+        wire_bytes (int | None): Size of the response body as received, if known
+    """
+
+    operation: str
+    method: str
+    url: str
+    status_code: int | None
+    elapsed: float
+    retries: int = 0
+    ratelimit_remaining: int | None = None
+    content_bytes: int | None = None
+    wire_bytes: int | None = None
+
+
+class AuthMetrics(BaseModel):
+    """
+    Model describing an authentication performed by `Auth`.
+
+    Attributes:
+        source (str): "identity_request" for a request to the identity service,
+            "state_file" when the identity was restored from the state file
+        elapsed (float): Seconds spent authenticating, including decrypting the org key
+        success (bool): Whether the authentication succeeded
+    """
+
+    source: str
+    elapsed: float
+    success: bool
+
+
+class DecryptMetrics(BaseModel):
+    """
+    Model describing the decoding of a batch of secrets from an API response.
+
+    Attributes:
+        operation (str): The SDK operation the secrets were decoded for
+        count (int): Number of secrets decoded
+        json_seconds (float): Seconds spent parsing the response body
+        validate_seconds (float): Seconds spent validating the secret models
+        decrypt_seconds (float): Seconds spent on HMAC verification and AES decryption
+    """
+
+    operation: str
+    count: int
+    json_seconds: float = 0.0
+    validate_seconds: float = 0.0
+    decrypt_seconds: float = 0.0
+
+
+class SDKHooks:
+    """
+    Base class for instrumentation hooks.
+
+    Subclass and override the methods you are interested in and pass an instance
+    to `BWSecretClient(..., hooks=...)`. Hooks are called synchronously on the thread
+    performing the operation, so implementations should be fast and must not raise.
+    """
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        """
+        Called after every HTTP request to the BWS API, successful or not.
+
+        Args:
+            metrics (RequestMetrics): Timing and outcome of the request
+        """
+
+    def on_auth(self, metrics: AuthMetrics) -> None:
+        """
+        Called after every authentication, including token refreshes. The request
+        to the identity service is additionally reported through `on_request`
+        with the operation "identity_request".
+
+        Args:
+            metrics (AuthMetrics): Timing and outcome of the authentication
+        """
+
+    def on_decrypt(self, metrics: DecryptMetrics) -> None:
+        """
+        Called after a batch of secrets has been decoded from a response.
+
+        Args:
+            metrics (DecryptMetrics): Stage timings of the batch
+        """
+
+    def on_cache(self, cache: str, hit: bool) -> None:
+        """
+        Called on every lookup in one of the SDK's caches.
+
+        Args:
+            cache (str): The name of the cache, e.g. "inflight" or "store"
+            hit (bool): Whether the lookup was served from the cache
+        """
+
+
+class LoggingHooks(SDKHooks):
+    """
+    Hooks that log every event through the standard logging module.
+
+    Attributes:
+        logger (logging.Logger): The logger events are written to
+        level (int): The level events are logged at
+    """
+
+    def __init__(
+        self, logger: logging.Logger | None = None, level: int = logging.DEBUG
+    ):
+        """
+        Initialize the LoggingHooks.
+
+        Args:
+            logger (logging.Logger | None): The logger to use, defaults to "bws_sdk.hooks"
+            level (int): The level events are logged at
+        """
+        self.logger = logger or logging.getLogger(__name__)
+        self.level = level
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        self.logger.log(
+            self.level,
+            "bws request %s %s %s -> %s in %.3fs (retries=%d, ratelimit_remaining=%s)",
+            metrics.operation,
+            metrics.method,
+            metrics.url,
+            metrics.status_code,
+            metrics.elapsed,
+            metrics.retries,
+            metrics.ratelimit_remaining,
+        )
+
+    def on_auth(self, metrics: AuthMetrics) -> None:
+        self.logger.log(
+            self.level,
+            "bws auth via %s %s in %.3fs",
+            metrics.source,
+            "succeeded" if metrics.success else "failed",
+            metrics.elapsed,
+        )
+
+    def on_decrypt(self, metrics: DecryptMetrics) -> None:
+        self.logger.log(
+            self.level,
+            "bws decoded %d secrets for %s: json=%.3fs validate=%.3fs decrypt=%.3fs",
+            metrics.count,
+            metrics.operation,
+            metrics.json_seconds,
+            metrics.validate_seconds,
+            metrics.decrypt_seconds,
+        )
+
+    def on_cache(self, cache: str, hit: bool) -> None:
+        self.logger.log(self.level, "bws cache %s %s", cache, "hit" if hit else "miss")
+
+
+class PrometheusHooks(SDKHooks):
+    """
+    Hooks that aggregate events into metrics in the Prometheus text exposition format.
+
+    The collected metrics can be exposed on an HTTP endpoint by returning the
+    output of `render` with the content type `text/plain; version=0.0.4`.
+
+    Example:
+        ```python
+        hooks = PrometheusHooks()
+        client = BWSecretClient(region, access_token, hooks=hooks)
+        ...
+        print(hooks.render())
+        ```
+    """
+
+    def __init__(self, prefix: str = "bws_sdk"):
+        """
+        Initialize the PrometheusHooks.
+
+        Args:
+            prefix (str): Prefix for all metric names
+        """
+        self.prefix = prefix
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[_Labels, float]] = defaultdict(
+            lambda: defaultdict(float)
+        )
+        self._summaries: dict[str, dict[_Labels, list[float]]] = defaultdict(
+            lambda: defaultdict(lambda: [0.0, 0])
+        )
+        self._gauges: dict[str, dict[_Labels, float]] = defaultdict(dict)
+
+    def _inc(self, name: str, value: float = 1.0, **labels: str) -> None:
+        self._counters[name][tuple(sorted(labels.items()))] += value
+
+    def _observe(self, name: str, value: float, **labels: str) -> None:
+        summary = self._summaries[name][tuple(sorted(labels.items()))]
+        summary[0] += value
+        summary[1] += 1
+
+    def on_request(self, metrics: RequestMetrics) -> None:
+        status = (
+            str(metrics.status_code) if metrics.status_code is not None else "error"
+        )
+        with self._lock:
+            self._inc("requests_total", operation=metrics.operation, status=status)
+            self._inc(
+                "request_retries_total", metrics.retries, operation=metrics.operation
+            )
+            self._observe(
+                "request_seconds", metrics.elapsed, operation=metrics.operation
+            )
+            if metrics.ratelimit_remaining is not None:
+                self._gauges["ratelimit_remaining"][()] = metrics.ratelimit_remaining
+            if metrics.content_bytes is not None:
+                self._inc(
+                    "response_bytes_total",
+                    metrics.content_bytes,
+                    operation=metrics.operation,
+                )
+            if metrics.wire_bytes is not None:
+                self._inc(
+                    "response_wire_bytes_total",
+                    metrics.wire_bytes,
+                    operation=metrics.operation,
+                )
+
+    def on_auth(self, metrics: AuthMetrics) -> None:
+        with self._lock:
+            self._inc(
+                "auth_total",
+                source=metrics.source,
+                success=str(metrics.success).lower(),
+            )
+            self._observe("auth_seconds", metrics.elapsed, source=metrics.source)
+
+    def on_decrypt(self, metrics: DecryptMetrics) -> None:
+        with self._lock:
+            self._inc(
+                "decrypted_secrets_total", metrics.count, operation=metrics.operation
+            )
+            for stage, seconds in (
+                ("json", metrics.json_seconds),
+                ("validate", metrics.validate_seconds),
+                ("decrypt", metrics.decrypt_seconds),
+            ):
+                self._observe(
+                    "stage_seconds", seconds, operation=metrics.operation, stage=stage
+                )
+
+    def on_cache(self, cache: str, hit: bool) -> None:
+        with self._lock:
+            self._inc("cache_hits_total" if hit else "cache_misses_total", cache=cache)
+
+    @staticmethod
+    def _format_labels(labels: _Labels) -> str:
+        if not labels:
+            return ""
+        return "{" + ",".join(f'{k}="{v}"' for k, v in labels) + "}"
+
+    def render(self) -> str:
+        """
+        Render the collected metrics in the Prometheus text exposition format.
+
+        Returns:
+            str: The metrics, one sample per line
+        """
+        lines: list[str] = []
+        with self._lock:
+            for name in sorted(self._counters):
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {full_name} counter")
+                for labels, value in sorted(self._counters[name].items()):
+                    lines.append(f"{full_name}{self._format_labels(labels)} {value:g}")
+            for name in sorted(self._summaries):
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {full_name} summary")
+                for labels, (total, count) in sorted(self._summaries[name].items()):
+                    label_str = self._format_labels(labels)
+                    lines.append(f"{full_name}_sum{label_str} {total:g}")
+                    lines.append(f"{full_name}_count{label_str} {count:g}")
+            for name in sorted(self._gauges):
+                full_name = f"{self.prefix}_{name}"
+                lines.append(f"# TYPE {full_name} gauge")
+                for labels, value in sorted(self._gauges[name].items()):
+                    lines.append(f"{full_name}{self._format_labels(labels)} {value:g}")
+        return "\n".join(lines) + "\n"
@@ -0,0 +1,377 @@
+"""
+Client pool for serving many machine accounts from one process.
+
+This module provides a pool that hands out one `BWSecretClient` per access token
+and region. All clients of a region share one HTTP connection pool, idle clients
+are evicted least recently used first, and bearer tokens can be refreshed for all
+pooled clients from a single background thread instead of on the request path.
+
+Classes:
+    ClientPool: Per access token client cache with shared connections and LRU eviction
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import Future
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .bws_types import Region
+from .client import BWSecretClient
+from .errors import BWSSDKError
+from .hooks import SDKHooks
+
+if TYPE_CHECKING:
+    from .tracing import Tracer
+
+logger = logging.getLogger(__name__)
+
+_PoolKey = tuple[str, str, str]
+
+
+class ClientPool:
+    """
+    Hand out one BWSecretClient per access token, sharing connections per region.
+
+    Clients are created on first use and cached under a SHA-256 fingerprint of the
+    access token, so the pool never holds raw tokens as keys. When more than
+    `max_clients` clients are cached, or a client has not been used for
+    `idle_timeout` seconds, it is dropped from the pool. Clients of the same region
+    send their requests through one shared connection pool, so evicting and
+    recreating a client does not open new TLS connections.
+
+    Attributes:
+        region (Region): The region used when `get` is called without one
+        max_clients (int): Maximum number of cached clients
+        idle_timeout (float | None): Seconds after which unused clients are evicted
+        refresh_margin (float): Seconds before expiry at which tokens are refreshed
+
+    Example:
+        ```python
+        pool = ClientPool(region, max_clients=100, idle_timeout=900)
+        pool.start()
+
+        secret = pool.get(access_token).get_by_id(secret_id)
+        ```
+    """
+
+    def __init__(
+        self,
+        region: Region,
+        max_clients: int = 64,
+        idle_timeout: float | None = None,
+        refresh_margin: float = 300.0,
+        state_dir: str | None = None,
+        pool_maxsize: int = 10,
+        hooks: SDKHooks | None = None,
+        tracer: "Tracer | None" = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Initialize the ClientPool.
+
+        Args:
+            region (Region): The region used when `get` is called without one
+            max_clients (int): Maximum number of cached clients
+            idle_timeout (float | None): Seconds after which unused clients are evicted,
+                None to only evict when the pool is full
+            refresh_margin (float): Seconds before expiry at which `refresh_tokens`
+                refreshes a bearer token
+            state_dir (str | None): Optional directory for the clients' state files
+            pool_maxsize (int): Maximum number of connections kept open per host
+            hooks (SDKHooks | None): Optional instrumentation hooks passed to every client
+            tracer (Tracer | None): Optional tracer passed to every client
+            clock (Callable[[], float]): Monotonic clock returning seconds
+
+        Raises:
+            ValueError: If any of the input parameters are of incorrect type or out of range
+        """
+        if not isinstance(region, Region):
+            raise ValueError("Region must be an instance of Region")
+        if max_clients < 1:
+            raise ValueError("Max clients must be at least 1")
+        if idle_timeout is not None and idle_timeout <= 0:
+            raise ValueError("Idle timeout must be positive or None")
+        if refresh_margin < 0:
+            raise ValueError("Refresh margin must not be negative")
+
+        self.region = region
+        self.max_clients = max_clients
+        self.idle_timeout = idle_timeout
+        self.refresh_margin = refresh_margin
+        self.state_dir = Path(state_dir) if state_dir else None
+        self.pool_maxsize = pool_maxsize
+        self.hooks = hooks
+        self.tracer = tracer
+        self._clock = clock
+        self._clients: OrderedDict[_PoolKey, BWSecretClient] = OrderedDict()
+        self._last_used: dict[_PoolKey, float] = {}
+        self._pending: dict[_PoolKey, Future[BWSecretClient]] = {}
+        self._adapters: dict[tuple[str, str], HTTPAdapter] = {}
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    @staticmethod
+    def _fingerprint(access_token: str) -> str:
+        return hashlib.sha256(access_token.encode("utf-8")).hexdigest()
+
+    def _key(self, access_token: str, region: Region) -> _PoolKey:
+        return (self._fingerprint(access_token), region.api_url, region.identity_url)
+
+    def get(self, access_token: str, region: Region | None = None) -> BWSecretClient:
+        """
+        Get the client for an access token, creating and authenticating it if needed.
+
+        Concurrent calls for a token that is not pooled yet share a single
+        authentication.
+
+        Args:
+            access_token (str): The BWS access token
+            region (Region | None): The region of the client, defaults to the pool's region
+
+        Returns:
+            BWSecretClient: The pooled client
+
+        Raises:
+            ValueError: If the access token is not a string
+            InvalidTokenError: If the access token format is invalid
+            BWSSDKError: If authentication fails
+        """
+        if not isinstance(access_token, str):
+            raise ValueError("Access token must be a string")
+        region = region or self.region
+        key = self._key(access_token, region)
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._clients.move_to_end(key)
+                self._last_used[key] = self._clock()
+        if self.hooks is not None:
+            self.hooks.on_cache("client_pool", client is not None)
+        if client is not None:
+            return client
+        return self._get_new(access_token, region, key)
+
+    def _get_new(
+        self, access_token: str, region: Region, key: _PoolKey
+    ) -> BWSecretClient:
+        """
+        Create and pool the client of a key, or wait for a concurrent call creating it.
+
+        Args:
+            access_token (str): The BWS access token
+            region (Region): The region of the client
+            key (_PoolKey): The pool key of the access token and region
+
+        Returns:
+            BWSecretClient: The pooled client
+        """
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                # Pooled by a concurrent call since it was looked up
+                return client
+            pending = self._pending.get(key)
+            leader = pending is None
+            if pending is None:
+                pending = self._pending[key] = Future()
+        if not leader:
+            return pending.result()
+
+        try:
+            client = self._create(access_token, region, key[0])
+        except BaseException as e:
+            with self._lock:
+                del self._pending[key]
+            pending.set_exception(e)
+            raise
+        with self._lock:
+            del self._pending[key]
+            self._clients[key] = client
+            self._last_used[key] = self._clock()
+            while len(self._clients) > self.max_clients:
+                self._drop(next(iter(self._clients)))
+        pending.set_result(client)
+        return client
+
+    def _create(
+        self, access_token: str, region: Region, fingerprint: str
+    ) -> BWSecretClient:
+        """
+        Create a client whose session uses the region's shared connection pool.
+
+        Args:
+            access_token (str): The BWS access token
+            region (Region): The region of the client
+            fingerprint (str): The fingerprint of the access token
+
+        Returns:
+            BWSecretClient: The new, authenticated client
+        """
+        state_file = None
+        if self.state_dir is not None:
+            state_file = str(self.state_dir / f"{fingerprint}.state")
+        adapter = self._adapter(region)
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        return BWSecretClient(
+            region,
+            access_token,
+            state_file,
+            hooks=self.hooks,
+            tracer=self.tracer,
+            transport=session,
+        )
+
+    def _adapter(self, region: Region) -> HTTPAdapter:
+        """
+        Get the shared transport adapter of a region.
+
+        Args:
+            region (Region): The region
+
+        Returns:
+            HTTPAdapter: The adapter holding the region's connection pool
+        """
+        key = (region.api_url, region.identity_url)
+        with self._lock:
+            adapter = self._adapters.get(key)
+            if adapter is None:
+                adapter = self._adapters[key] = HTTPAdapter(
+                    pool_maxsize=self.pool_maxsize
+                )
+            return adapter
+
+    def _drop(self, key: _PoolKey) -> None:
+        # The client's session is not closed: its adapter is shared by the region
+        del self._clients[key]
+        del self._last_used[key]
+
+    def evict(self, access_token: str, region: Region | None = None) -> bool:
+        """
+        Remove the client of an access token from the pool.
+
+        Args:
+            access_token (str): The BWS access token
+            region (Region | None): The region of the client, defaults to the pool's region
+
+        Returns:
+            bool: True if a client was removed
+        """
+        key = self._key(access_token, region or self.region)
+        with self._lock:
+            if key not in self._clients:
+                return False
+            self._drop(key)
+            return True
+
+    def evict_idle(self) -> int:
+        """
+        Remove clients that have not been used for `idle_timeout` seconds.
+
+        Returns:
+            int: The number of clients removed
+        """
+        if self.idle_timeout is None:
+            return 0
+        cutoff = self._clock() - self.idle_timeout
+        with self._lock:
+            idle = [key for key, used in self._last_used.items() if used <= cutoff]
+            for key in idle:
+                self._drop(key)
+        return len(idle)
+
+    def refresh_tokens(self) -> int:
+        """
+        Refresh the bearer tokens of pooled clients that expire within `refresh_margin`.
+
+        Failed refreshes are logged and retried on the next call; the client will
+        otherwise refresh its token itself on its next request.
+
+        Returns:
+            int: The number of tokens refreshed
+        """
+        deadline = datetime.now(timezone.utc) + timedelta(seconds=self.refresh_margin)
+        with self._lock:
+            clients = list(self._clients.values())
+        refreshed = 0
+        for client in clients:
+            if client.auth.expires_at > deadline:
+                continue
+            try:
+                client.auth.refresh()
+            except BWSSDKError as e:
+                logger.warning("Failed to refresh bearer token: %s", e)
+                continue
+            refreshed += 1
+        return refreshed
+
+    def _run(self, interval: float) -> None:
+        while not self._stop.wait(interval):
+            self.evict_idle()
+            self.refresh_tokens()
+
+    def start(self, interval: float = 60.0) -> None:
+        """
+        Start evicting idle clients and refreshing tokens in a background daemon thread.
+
+        Calling start on a running pool has no effect.
+
+        Args:
+            interval (float): Seconds between maintenance runs
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run,
+            args=(interval,),
+            name="bws-sdk-client-pool",
+            daemon=True,
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop the background thread and wait for it to exit.
+
+        Args:
+            timeout (float | None): Maximum number of seconds to wait for the thread
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def close(self) -> None:
+        """
+        Stop the background thread, drop all clients and close the shared connections.
+        """
+        self.stop()
+        with self._lock:
+            self._clients.clear()
+            self._last_used.clear()
+            adapters = list(self._adapters.values())
+            self._adapters.clear()
+        for adapter in adapters:
+            adapter.close()
+
+    def __contains__(self, access_token: object) -> bool:
+        if not isinstance(access_token, str):
+            return False
+        with self._lock:
+            return self._key(access_token, self.region) in self._clients
+
+    def __len__(self) -> int:
+        return len(self._clients)
@@ -0,0 +1,227 @@
+"""
+Projection of secrets into environment variables and files.
+
+This module turns a mapping from secrets to environment variable names and file
+paths into their values with a single `sync` request, and writes files atomically,
+only touching those whose contents changed. It is meant for container entrypoints
+and other places that would otherwise fetch secrets one at a time.
+
+Classes:
+    ProjectionResult: Outcome of applying a projection
+    SecretProjection: Mapping of secrets to environment variables and files
+"""
+
+import os
+import tempfile
+from collections.abc import Iterable, Mapping, MutableMapping
+from datetime import datetime, timezone
+from pathlib import Path
+
+from pydantic import BaseModel
+
+from .bws_types import BitwardenSecret
+from .client import BWSecretClient
+from .errors import ProjectionError
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+
+class ProjectionResult(BaseModel):
+    """
+    Model describing the outcome of applying a projection.
+
+    Attributes:
+        env (dict[str, str]): Environment variable names and their values
+        written (list[str]): Files whose contents changed and were rewritten
+        unchanged (list[str]): Files that already had the projected contents
+    """
+
+    env: dict[str, str] = {}
+    written: list[str] = []
+    unchanged: list[str] = []
+
+
+class SecretProjection:
+    """
+    Project secrets into environment variables and files.
+
+    Secrets are referred to either by id or by key name. All secrets are fetched
+    and decrypted with one `sync` request, regardless of how many are projected.
+
+    Attributes:
+        env (dict[str, str]): Secret id or key name to environment variable name
+        files (dict[str, Path]): Secret id or key name to file path
+        project_ids (frozenset[str] | None): Projects the secrets are looked up in
+        file_mode (int): Permissions of written files
+
+    Example:
+        ```python
+        projection = SecretProjection(
+            env={"DATABASE_URL": "DATABASE_URL"},
+            files={"tls-key": "/run/secrets/tls.key"},
+        )
+        result = projection.apply(client, os.environ)
+        ```
+    """
+
+    def __init__(
+        self,
+        env: Mapping[str, str] | None = None,
+        files: Mapping[str, str | os.PathLike[str]] | None = None,
+        project_ids: Iterable[str] | None = None,
+        file_mode: int = 0o600,
+    ):
+        """
+        Initialize the SecretProjection.
+
+        Args:
+            env (Mapping[str, str] | None): Secret id or key name to environment variable name
+            files (Mapping[str, str | PathLike] | None): Secret id or key name to file path
+            project_ids (Iterable[str] | None): Optional projects to look the secrets up in
+            file_mode (int): Permissions of written files
+
+        Raises:
+            ValueError: If any of the input parameters are of incorrect type
+        """
+        env = dict(env or {})
+        files = {source: Path(path) for source, path in (files or {}).items()}
+        for mapping in (env, files):
+            if not all(isinstance(source, str) for source in mapping):
+                raise ValueError("Secret references must be strings")
+        if not all(isinstance(name, str) and name for name in env.values()):
+            raise ValueError("Environment variable names must be non-empty strings")
+
+        self.env = env
+        self.files = files
+        self.project_ids = frozenset(project_ids) if project_ids is not None else None
+        self.file_mode = file_mode
+
+    def fetch(self, client: BWSecretClient) -> dict[str, str]:
+        """
+        Fetch the values of all referenced secrets with a single sync request.
+
+        Args:
+            client (BWSecretClient): The client used to fetch the secrets
+
+        Returns:
+            dict[str, str]: Secret reference to secret value
+
+        Raises:
+            ProjectionError: If a reference matches no secret or a key name matches several
+            SendRequestError: If the network request fails
+            ApiError: If the API returns a non-200 status code
+            SecretParseError: If any secret cannot be parsed or decrypted
+        """
+        references = {*self.env, *self.files}
+        if not references:
+            return {}
+        secrets = client.sync(_EPOCH, self.project_ids).secrets or []
+        return {
+            reference: self.resolve(reference, secrets).value
+            for reference in references
+        }
+
+    @staticmethod
+    def resolve(reference: str, secrets: list[BitwardenSecret]) -> BitwardenSecret:
+        """
+        Find the secret a reference refers to, by id first and then by key name.
+
+        Args:
+            reference (str): The secret id or key name
+            secrets (list[BitwardenSecret]): The secrets to search
+
+        Returns:
+            BitwardenSecret: The referenced secret
+
+        Raises:
+            ProjectionError: If no secret or several secrets match
+        """
+        for secret in secrets:
+            if secret.id == reference:
+                return secret
+        matches = [secret for secret in secrets if secret.key == reference]
+        if not matches:
+            raise ProjectionError(f"No secret with id or key {reference!r}")
+        if len(matches) > 1:
+            raise ProjectionError(
+                f"Key {reference!r} is used by several secrets, refer to it by id"
+            )
+        return matches[0]
+
+    def apply(
+        self,
+        client: BWSecretClient,
+        environ: MutableMapping[str, str] | None = None,
+    ) -> ProjectionResult:
+        """
+        Fetch the secrets, write the projected files and update an environment.
+
+        Args:
+            client (BWSecretClient): The client used to fetch the secrets
+            environ (MutableMapping[str, str] | None): Optional environment, e.g.
+                `os.environ`, to set the projected variables in
+
+        Returns:
+            ProjectionResult: The projected variables and the files written
+
+        Raises:
+            ProjectionError: If a reference matches no secret or a key name matches several
+            SendRequestError: If the network request fails
+            ApiError: If the API returns a non-200 status code
+            SecretParseError: If any secret cannot be parsed or decrypted
+            OSError: If a file cannot be written
+        """
+        values = self.fetch(client)
+        result = ProjectionResult(
+            env={name: values[reference] for reference, name in self.env.items()}
+        )
+        for reference, path in self.files.items():
+            if write_atomic(path, values[reference].encode("utf-8"), self.file_mode):
+                result.written.append(str(path))
+            else:
+                result.unchanged.append(str(path))
+        if environ is not None:
+            environ.update(result.env)
+        return result
+
+
+def write_atomic(
+    path: str | os.PathLike[str], content: bytes, mode: int = 0o600
+) -> bool:
+    """
+    Write a file atomically, unless it already has the given contents.
+
+    The contents are written to a temporary file in the same directory, flushed
+    to disk and renamed over the target, so readers see either the old or the new
+    contents, never a partial file.
+
+    Args:
+        path (str | PathLike): The file to write
+        content (bytes): The contents of the file
+        mode (int): Permissions of the file
+
+    Returns:
+        bool: True if the file was written, False if its contents were unchanged
+
+    Raises:
+        OSError: If the file cannot be written
+    """
+    path = Path(path)
+    try:
+        if path.read_bytes() == content:
+            return False
+    except FileNotFoundError:
+        pass
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_path = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.chmod(tmp_path, mode)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.unlink(tmp_path)
+        raise
+    return True
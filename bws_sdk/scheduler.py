@@ -0,0 +1,233 @@
+"""
+Adaptive sync polling for the BWS SDK.
+
+This module provides a scheduler that keeps a `SecretStore` up to date by polling
+`sync` at an interval that adapts to the remaining rate limit quota, the time until
+the quota resets and how recently secrets were seen to change.
+
+Classes:
+    SyncScheduler: Background poller with adaptive interval, jitter and error backoff
+"""
+
+import logging
+import random
+import threading
+from datetime import datetime, timezone
+
+from .bws_types import RatelimitInfo
+from .errors import APIRateLimitError, BWSSDKError
+from .store import SecretStore
+
+logger = logging.getLogger(__name__)
+
+
+class SyncScheduler:
+    """
+    Poll a SecretStore at an interval driven by rate limit headroom and change activity.
+
+    While secrets are changing the store is polled every `min_interval` seconds.
+    Each quiet poll stretches the interval by `growth` up to `max_interval`. The
+    interval is never shorter than what is needed to spread the remaining rate limit
+    quota until it resets, and polling is suspended until the reset when the quota
+    is exhausted. Failed polls back off exponentially. All delays are randomised by
+    `jitter` so that many processes do not poll in lockstep.
+
+    Attributes:
+        store (SecretStore): The store refreshed on every poll
+        interval (float): The delay chosen after the last successful poll
+
+    Example:
+        ```python
+        store = SecretStore(client)
+        scheduler = SyncScheduler(store, min_interval=5, max_interval=300)
+        scheduler.start()
+        ...
+        scheduler.stop()
+        ```
+    """
+
+    def __init__(
+        self,
+        store: SecretStore,
+        min_interval: float = 5.0,
+        max_interval: float = 300.0,
+        growth: float = 2.0,
+        jitter: float = 0.1,
+        error_backoff: float = 5.0,
+        max_error_backoff: float = 600.0,
+        headroom: float = 0.5,
+    ):
+        """
+        Initialize the SyncScheduler.
+
+        Args:
+            store (SecretStore): The store refreshed on every poll
+            min_interval (float): Seconds between polls while secrets are changing
+            max_interval (float): Upper bound in seconds for the interval while quiet
+            growth (float): Factor the interval is multiplied by after each quiet poll
+            jitter (float): Fraction by which every delay is randomly shortened or lengthened
+            error_backoff (float): Seconds to wait after the first failed poll
+            max_error_backoff (float): Upper bound in seconds for the error backoff
+            headroom (float): Fraction of the remaining quota the scheduler may use
+
+        Raises:
+            ValueError: If any of the input parameters are out of range
+        """
+        if not isinstance(store, SecretStore):
+            raise ValueError("Store must be an instance of SecretStore")
+        if min_interval <= 0 or max_interval < min_interval:
+            raise ValueError("Intervals must be positive and max >= min")
+        if growth < 1:
+            raise ValueError("Growth must be at least 1")
+        if not 0 <= jitter < 1:
+            raise ValueError("Jitter must be between 0 and 1")
+        if error_backoff <= 0 or max_error_backoff < error_backoff:
+            raise ValueError("Error backoff must be positive and max >= initial")
+        if not 0 < headroom <= 1:
+            raise ValueError("Headroom must be between 0 and 1")
+
+        self.store = store
+        self.min_interval = min_interval
+        self.max_interval = max_interval
+        self.growth = growth
+        self.jitter = jitter
+        self.error_backoff = error_backoff
+        self.max_error_backoff = max_error_backoff
+        self.headroom = headroom
+        self.interval = min_interval
+        self._failures = 0
+        self._random = random.Random()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def _quota_delay(self, ratelimit: RatelimitInfo | None, now: datetime) -> float:
+        """
+        Compute the minimum delay that keeps polling within the rate limit quota.
+
+        Args:
+            ratelimit (RatelimitInfo | None): Rate limit information from the last response
+            now (datetime): The current time
+
+        Returns:
+            float: The minimum number of seconds until the next poll
+        """
+        if ratelimit is None:
+            return 0.0
+        reset = ratelimit.reset
+        if reset.tzinfo is None:
+            reset = reset.replace(tzinfo=timezone.utc)
+        until_reset = (reset - now).total_seconds()
+        if until_reset <= 0:
+            # No rate limit headers were returned or the window already reset
+            return 0.0
+        usable = int(ratelimit.remaining * self.headroom)
+        if usable <= 0:
+            return until_reset
+        return until_reset / usable
+
+    def next_delay(
+        self,
+        changed: bool,
+        ratelimit: RatelimitInfo | None,
+        now: datetime | None = None,
+    ) -> float:
+        """
+        Compute the delay before the next poll after a successful sync.
+
+        Args:
+            changed (bool): Whether the last sync reported changes
+            ratelimit (RatelimitInfo | None): Rate limit information from the last sync
+            now (datetime | None): The current time, defaults to now in UTC
+
+        Returns:
+            float: The number of seconds to wait before polling again
+        """
+        now = now or datetime.now(timezone.utc)
+        self._failures = 0
+        if changed:
+            self.interval = self.min_interval
+        else:
+            self.interval = min(self.interval * self.growth, self.max_interval)
+        return self._jittered(max(self.interval, self._quota_delay(ratelimit, now)))
+
+    def error_delay(self, error: BaseException, now: datetime | None = None) -> float:
+        """
+        Compute the delay before the next poll after a failed sync.
+
+        Args:
+            error (BaseException): The exception raised by the failed poll
+            now (datetime | None): The current time, defaults to now in UTC
+
+        Returns:
+            float: The number of seconds to wait before polling again
+        """
+        now = now or datetime.now(timezone.utc)
+        delay = min(
+            self.error_backoff * self.growth**self._failures, self.max_error_backoff
+        )
+        self._failures += 1
+        if isinstance(error, APIRateLimitError):
+            delay = max(delay, self._quota_delay(self.store.ratelimit, now))
+        return self._jittered(delay)
+
+    def _jittered(self, delay: float) -> float:
+        if not self.jitter:
+            return delay
+        return delay * self._random.uniform(1 - self.jitter, 1 + self.jitter)
+
+    def run_once(self) -> float:
+        """
+        Refresh the store once and compute the delay before the next poll.
+
+        Errors are logged rather than propagated so that polling continues with
+        backoff. Unexpected errors, e.g. a malformed response body, are logged with
+        their traceback.
+
+        Returns:
+            float: The number of seconds to wait before polling again
+        """
+        try:
+            diff = self.store.refresh()
+        except BWSSDKError as e:
+            delay = self.error_delay(e)
+            logger.warning("Secret sync failed, retrying in %.1fs: %s", delay, e)
+            return delay
+        except Exception as e:
+            delay = self.error_delay(e)
+            logger.exception(
+                "Unexpected error during secret sync, retrying in %.1fs", delay
+            )
+            return delay
+        return self.next_delay(bool(diff), self.store.ratelimit)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            delay = self.run_once()
+            self._stop.wait(delay)
+
+    def start(self) -> None:
+        """
+        Start polling in a background daemon thread.
+
+        The first poll happens immediately. Calling start on a running
+        scheduler has no effect.
+        """
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="bws-sdk-sync-scheduler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float | None = None) -> None:
+        """
+        Stop polling and wait for the background thread to exit.
+
+        Args:
+            timeout (float | None): Maximum number of seconds to wait for the thread
+        """
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
@@ -0,0 +1,492 @@
+"""
+Sync-driven secret store for the BWS SDK.
+
+This module provides an in-memory view of an organization's secrets that is kept
+up to date through `BWSecretClient.sync`. Each refresh is diffed against the
+previously held state so that interested parties can be notified about exactly
+which secrets were added, modified or removed.
+
+Classes:
+    SecretStore: In-memory secret store with change notification callbacks
+"""
+
+import base64
+import json
+import logging
+import threading
+from collections.abc import Callable, Iterable
+from datetime import datetime, timezone
+from typing import Any, TypeVar
+
+from .bws_types import BitwardenSecret, BitwardenSyncDiff, RatelimitInfo
+from .client import BWSecretClient
+from .compact import CompactSecretTable
+from .errors import SecretNotFoundError, SecretParseError
+
+logger = logging.getLogger(__name__)
+
+SyncCallback = Callable[[BitwardenSyncDiff], None]
+
+_EPOCH = datetime(1970, 1, 1, tzinfo=timezone.utc)
+
+_T = TypeVar("_T")
+
+_BOOLEANS = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
+
+
+def _parse_bool(value: str) -> bool:
+    return _BOOLEANS[value.strip().lower()]
+
+
+def _parse_bytes(value: str) -> bytes:
+    return base64.b64decode(value.strip(), validate=True)
+
+
+class SecretStore:
+    """
+    In-memory store of decrypted secrets kept up to date through sync.
+
+    Every call to `refresh` performs a single incremental sync request. When the
+    server reports changes, only the secrets that are new or whose `revisionDate`
+    differs from the held copy are decrypted, and registered callbacks are invoked
+    with only the secrets that changed.
+
+    When `project_ids` is given, only secrets belonging to those projects are
+    decrypted and held. An index from project id to secret ids is maintained for
+    the held secrets.
+
+    With `compact=True` the secrets are held in a `CompactSecretTable`, which
+    needs a fraction of the memory for very large organizations; secrets are then
+    materialized into new `BitwardenSecret` instances on every access.
+
+    Attributes:
+        client (BWSecretClient): The client used to synchronise secrets
+        project_ids (frozenset[str] | None): The projects the store is restricted to
+        compact (bool): Whether secrets are held in a CompactSecretTable
+        last_synced (datetime | None): When the last successful sync was started
+        ratelimit (RatelimitInfo | None): Rate limit information from the last sync
+
+    Example:
+        ```python
+        store = SecretStore(client)
+
+        def on_db_password(diff):
+            db_pool.reconnect(password=diff.modified[0].value)
+
+        store.subscribe(on_db_password, secret_ids=["db-password-id"])
+        store.refresh()
+        ```
+    """
+
+    def __init__(
+        self,
+        client: BWSecretClient,
+        project_ids: Iterable[str] | None = None,
+        compact: bool = False,
+    ):
+        """
+        Initialize the SecretStore.
+
+        Args:
+            client (BWSecretClient): The client used to synchronise secrets
+            project_ids (Iterable[str] | None): Optional project ids to restrict the store to
+            compact (bool): Hold the secrets in a CompactSecretTable to save memory
+
+        Raises:
+            ValueError: If the client is not a BWSecretClient instance
+        """
+        if not isinstance(client, BWSecretClient):
+            raise ValueError("Client must be an instance of BWSecretClient")
+
+        self.client = client
+        self.project_ids = frozenset(project_ids) if project_ids is not None else None
+        self.last_synced: datetime | None = None
+        self.ratelimit: RatelimitInfo | None = None
+        self.compact = compact
+        self._secrets: dict[str, BitwardenSecret] | CompactSecretTable = (
+            CompactSecretTable() if compact else {}
+        )
+        self._projects: dict[str, set[str]] = {}
+        self._keys: dict[str, list[str]] | None = None
+        self._parsed: dict[str, dict[str, Any]] = {}
+        self._subscribers: list[tuple[SyncCallback, frozenset[str] | None]] = []
+        self._lock = threading.RLock()
+
+    def subscribe(
+        self, callback: SyncCallback, secret_ids: Iterable[str] | None = None
+    ) -> Callable[[], None]:
+        """
+        Register a callback to be notified about changed secrets.
+
+        Args:
+            callback (Callable[[BitwardenSyncDiff], None]): Called with the changes of a refresh
+            secret_ids (Iterable[str] | None): Optional ids to restrict notifications to.
+                The callback is only invoked when one of these secrets changed.
+
+        Returns:
+            Callable[[], None]: A function that removes the subscription when called
+
+        Raises:
+            ValueError: If the callback is not callable
+        """
+        if not callable(callback):
+            raise ValueError("Callback must be callable")
+
+        entry = (callback, frozenset(secret_ids) if secret_ids is not None else None)
+        with self._lock:
+            self._subscribers.append(entry)
+
+        def unsubscribe() -> None:
+            with self._lock:
+                if entry in self._subscribers:
+                    self._subscribers.remove(entry)
+
+        return unsubscribe
+
+    def refresh(self) -> BitwardenSyncDiff:
+        """
+        Synchronise with the server and notify subscribers about changes.
+
+        Returns:
+            BitwardenSyncDiff: The changes applied by this refresh (empty if nothing changed)
+
+        Raises:
+            SendRequestError: If the network request fails
+            UnauthorisedError: If the server returns a 401 Unauthorized response
+            ApiError: If the API returns a non-200 status code
+            SecretParseError: If any secret cannot be parsed or decrypted
+        """
+        with self._lock:
+            started = datetime.now(timezone.utc)
+            if isinstance(self._secrets, CompactSecretTable):
+                revisions = self._secrets.revisions()
+            else:
+                revisions = {
+                    sid: secret.revisionDate for sid, secret in self._secrets.items()
+                }
+            sync = self.client.sync(
+                self.last_synced or _EPOCH, self.project_ids, revisions=revisions
+            )
+            self.last_synced = started
+            self.ratelimit = sync.ratelimit
+            if sync.secrets is None:
+                return BitwardenSyncDiff()
+            diff = self._apply(sync.secrets, sync.unchanged)
+            if diff:
+                self._keys = None
+            for secret in (*diff.modified, *diff.removed):
+                self._parsed.pop(secret.id, None)
+            subscribers = list(self._subscribers)
+
+        if diff:
+            self._notify(diff, subscribers)
+        return diff
+
+    def _apply(
+        self, secrets: list[BitwardenSecret], unchanged: Iterable[str] = ()
+    ) -> BitwardenSyncDiff:
+        """
+        Replace the held state with a sync result and compute the difference.
+
+        Held secrets that are neither listed as unchanged nor returned are removed.
+
+        Args:
+            secrets (list[BitwardenSecret]): The new and revised secrets returned by sync
+            unchanged (Iterable[str]): Ids of held secrets the server returned unchanged
+
+        Returns:
+            BitwardenSyncDiff: The secrets that were added, modified or removed
+        """
+        held = self._secrets
+        if isinstance(held, CompactSecretTable):
+            return self._apply_compact(held, secrets, unchanged)
+        diff = BitwardenSyncDiff()
+        current: dict[str, BitwardenSecret] = {
+            sid: held[sid] for sid in unchanged if sid in held
+        }
+        for secret in secrets:
+            current[secret.id] = secret
+            previous = self._secrets.get(secret.id)
+            if previous is None:
+                diff.added.append(secret)
+            elif previous.revisionDate != secret.revisionDate:
+                diff.modified.append(secret)
+        for secret_id, secret in self._secrets.items():
+            if secret_id not in current:
+                diff.removed.append(secret)
+        projects: dict[str, set[str]] = {}
+        for secret in current.values():
+            for project in secret.projects:
+                projects.setdefault(project.id, set()).add(secret.id)
+        self._secrets = current
+        self._projects = projects
+        return diff
+
+    def _apply_compact(
+        self,
+        held: CompactSecretTable,
+        secrets: list[BitwardenSecret],
+        unchanged: Iterable[str],
+    ) -> BitwardenSyncDiff:
+        """
+        Apply a sync result to a compact table without materializing kept secrets.
+
+        Args:
+            held (CompactSecretTable): The currently held table
+            secrets (list[BitwardenSecret]): The new and revised secrets returned by sync
+            unchanged (Iterable[str]): Ids of held secrets the server returned unchanged
+
+        Returns:
+            BitwardenSyncDiff: The secrets that were added, modified or removed
+        """
+        diff = BitwardenSyncDiff()
+        returned = set()
+        for secret in secrets:
+            returned.add(secret.id)
+            previous = held.revision(secret.id)
+            if previous is None:
+                diff.added.append(secret)
+            elif previous != secret.revisionDate:
+                diff.modified.append(secret)
+        kept = [sid for sid in unchanged if sid in held]
+        kept_ids = set(kept)
+        for secret_id in held:
+            if secret_id not in returned and secret_id not in kept_ids:
+                diff.removed.append(held[secret_id])
+        table = held.replace(secrets, kept)
+        self._secrets = table
+        self._projects = table.project_index()
+        return diff
+
+    @staticmethod
+    def _notify(
+        diff: BitwardenSyncDiff,
+        subscribers: list[tuple[SyncCallback, frozenset[str] | None]],
+    ) -> None:
+        """
+        Invoke subscribers with the part of the diff they are interested in.
+
+        Exceptions raised by callbacks are logged and do not prevent other
+        subscribers from being notified.
+
+        Args:
+            diff (BitwardenSyncDiff): The changes applied by a refresh
+            subscribers (list): Snapshot of the registered callbacks and their id filters
+        """
+        for callback, secret_ids in subscribers:
+            scoped = diff
+            if secret_ids is not None:
+                scoped = BitwardenSyncDiff(
+                    added=[s for s in diff.added if s.id in secret_ids],
+                    modified=[s for s in diff.modified if s.id in secret_ids],
+                    removed=[s for s in diff.removed if s.id in secret_ids],
+                )
+                if not scoped:
+                    continue
+            try:
+                callback(scoped)
+            except Exception:
+                logger.exception("Secret store subscriber %r failed", callback)
+
+    def get(self, secret_id: str) -> BitwardenSecret | None:
+        """
+        Get a held secret by its id.
+
+        Args:
+            secret_id (str): The unique identifier of the secret
+
+        Returns:
+            BitwardenSecret | None: The decrypted secret, or None if it is not held
+        """
+        secret = self._secrets.get(secret_id)
+        hooks = self.client.hooks
+        if hooks is not None:
+            hooks.on_cache("store", secret is not None)
+        return secret
+
+    def _resolve(self, reference: str) -> str:
+        """
+        Find the id of the held secret a reference refers to, by id and then by key.
+
+        Args:
+            reference (str): The secret id or key name
+
+        Returns:
+            str: The id of the referenced secret
+
+        Raises:
+            SecretNotFoundError: If no held secret matches
+            ValueError: If the key name is used by several held secrets
+        """
+        secrets = self._secrets
+        if reference in secrets:
+            return reference
+        if self._keys is None:
+            keys: dict[str, list[str]] = {}
+            for secret_id in secrets:
+                if isinstance(secrets, CompactSecretTable):
+                    key = secrets.key_of(secret_id)
+                else:
+                    key = secrets[secret_id].key
+                keys.setdefault(key, []).append(secret_id)
+            self._keys = keys
+        ids = self._keys.get(reference)
+        if not ids:
+            raise SecretNotFoundError(f"No secret with id or key {reference!r}")
+        if len(ids) > 1:
+            raise ValueError(
+                f"Key {reference!r} is used by several secrets, refer to it by id"
+            )
+        return ids[0]
+
+    def _parsed_value(
+        self, reference: str, kind: str, parse: Callable[[str], _T]
+    ) -> _T:
+        """
+        Parse the value of a held secret, at most once per revision.
+
+        Args:
+            reference (str): The secret id or key name
+            kind (str): The name of the parsed type, used as cache key and in errors
+            parse (Callable[[str], T]): Converts the secret value
+
+        Returns:
+            T: The parsed value
+
+        Raises:
+            SecretNotFoundError: If no held secret matches the reference
+            ValueError: If the key name is used by several held secrets
+            SecretParseError: If the value cannot be parsed
+        """
+        with self._lock:
+            secret_id = self._resolve(reference)
+            parsed = self._parsed.setdefault(secret_id, {})
+            hit = kind in parsed
+            if not hit:
+                try:
+                    parsed[kind] = parse(self._secrets[secret_id].value)
+                except (ValueError, KeyError) as e:
+                    raise SecretParseError(
+                        f"Value of secret {secret_id} is not a valid {kind}"
+                    ) from e
+            value = parsed[kind]
+        hooks = self.client.hooks
+        if hooks is not None:
+            hooks.on_cache("parsed", hit)
+        return value
+
+    def get_json(self, reference: str) -> Any:
+        """
+        Get the value of a held secret parsed as JSON.
+
+        The value is parsed once per revision of the secret and the same object is
+        returned until a refresh delivers a newer revision, so it must not be
+        modified.
+
+        Args:
+            reference (str): The secret id or key name
+
+        Returns:
+            Any: The parsed JSON document
+
+        Raises:
+            SecretNotFoundError: If no held secret matches the reference
+            ValueError: If the key name is used by several held secrets
+            SecretParseError: If the value is not valid JSON
+        """
+        return self._parsed_value(reference, "json", json.loads)
+
+    def get_int(self, reference: str) -> int:
+        """
+        Get the value of a held secret parsed as an integer.
+
+        Args:
+            reference (str): The secret id or key name
+
+        Returns:
+            int: The parsed integer, cached until the secret is revised
+
+        Raises:
+            SecretNotFoundError: If no held secret matches the reference
+            ValueError: If the key name is used by several held secrets
+            SecretParseError: If the value is not an integer
+        """
+        return self._parsed_value(reference, "int", int)
+
+    def get_bool(self, reference: str) -> bool:
+        """
+        Get the value of a held secret parsed as a boolean.
+
+        "true", "yes", "on" and "1" are true, "false", "no", "off" and "0" are
+        false, regardless of case and surrounding whitespace.
+
+        Args:
+            reference (str): The secret id or key name
+
+        Returns:
+            bool: The parsed boolean, cached until the secret is revised
+
+        Raises:
+            SecretNotFoundError: If no held secret matches the reference
+            ValueError: If the key name is used by several held secrets
+            SecretParseError: If the value is not one of the accepted words
+        """
+        return self._parsed_value(reference, "bool", _parse_bool)
+
+    def get_bytes(self, reference: str) -> bytes:
+        """
+        Get the value of a held secret decoded from base64.
+
+        Args:
+            reference (str): The secret id or key name
+
+        Returns:
+            bytes: The decoded bytes, cached until the secret is revised
+
+        Raises:
+            SecretNotFoundError: If no held secret matches the reference
+            ValueError: If the key name is used by several held secrets
+            SecretParseError: If the value is not valid base64
+        """
+        return self._parsed_value(reference, "bytes", _parse_bytes)
+
+    def secrets(self) -> list[BitwardenSecret]:
+        """
+        Get all held secrets.
+
+        Returns:
+            list[BitwardenSecret]: The decrypted secrets from the last sync
+        """
+        return list(self._secrets.values())
+
+    def list_by_project(self, project_id: str) -> list[BitwardenSecret]:
+        """
+        Get the held secrets belonging to a project.
+
+        Args:
+            project_id (str): The unique identifier of the project
+
+        Returns:
+            list[BitwardenSecret]: The decrypted secrets associated with the project
+        """
+        secrets = self._secrets
+        return [
+            secrets[secret_id]
+            for secret_id in self._projects.get(project_id, ())
+            if secret_id in secrets
+        ]
+
+    def __contains__(self, secret_id: object) -> bool:
+        return secret_id in self._secrets
+
+    def __len__(self) -> int:
+        return len(self._secrets)
@@ -9,17 +9,26 @@ Classes:
     ClientToken: Represents a BWS client authentication token
     IdentityRequest: Model for OAuth identity requests
     Auth: Main authentication handler with token management
+
+Functions:
+    clear_key_caches: Drop the process-wide caches of token keys and org keys
 """
 
 import base64
 import binascii
 import datetime
+import functools
+import hashlib
 import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
 from pathlib import Path
+from time import perf_counter
+from typing import TYPE_CHECKING, Generic, TypeVar
 from urllib.parse import urlencode
 
-import jwt
-import requests
 from pydantic import BaseModel
 
 from .bws_types import Region
@@ -37,6 +46,79 @@ from .errors import (
     SendRequestError,
     UnauthorisedTokenError,
 )
+from .hooks import AuthMetrics, RequestMetrics, SDKHooks
+
+if TYPE_CHECKING:
+    import requests
+
+    from .tracing import Tracer, Tracing
+    from .transport import Transport
+
+_T = TypeVar("_T")
+
+
+class _KeyCache(Generic[_T]):
+    """
+    Bounded, thread-safe LRU cache of key material by SHA-256 fingerprint.
+
+    Only digests are used as keys, so raw access tokens and payloads are never
+    held by the cache.
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._entries: OrderedDict[bytes, _T] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, fingerprint: bytes) -> _T | None:
+        with self._lock:
+            value = self._entries.get(fingerprint)
+            if value is not None:
+                self._entries.move_to_end(fingerprint)
+            return value
+
+    def put(self, fingerprint: bytes, value: _T) -> None:
+        with self._lock:
+            self._entries[fingerprint] = value
+            self._entries.move_to_end(fingerprint)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def _reset_after_fork(self) -> None:
+        # The lock may have been held by a thread that does not exist in the child
+        self._lock = threading.Lock()
+
+
+# HKDF-derived token keys, by fingerprint of the encryption key part of the token
+_token_keys: _KeyCache[SymmetricCryptoKey] = _KeyCache(256)
+# Decrypted organization keys, by fingerprint of the token key and encrypted payload
+_org_keys: _KeyCache[SymmetricCryptoKey] = _KeyCache(256)
+
+
+def _reset_key_caches_after_fork() -> None:
+    _token_keys._reset_after_fork()
+    _org_keys._reset_after_fork()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_reset_key_caches_after_fork)
+
+
+def clear_key_caches() -> None:
+    """
+    Drop the process-wide caches of derived token keys and decrypted org keys.
+
+    Parsing an access token derives its key with HMAC and HKDF-Expand, and every
+    authentication decrypts the organization key. Both results are cached for the
+    life of the process, so services creating many short-lived clients pay for
+    them once per token. Call this e.g. after revoking tokens to release the keys.
+    """
+    _token_keys.clear()
+    _org_keys.clear()
 
 
 class ClientToken:
@@ -77,7 +159,10 @@ class ClientToken:
         Create a ClientToken instance from a token string.
 
         Parses a BWS token string in the format "version.access_token_id.client_secret:encryption_key"
-        and creates a ClientToken instance with the extracted components.
+        and creates a ClientToken instance with the extracted components. The
+        derived encryption key is cached process-wide under a SHA-256 fingerprint
+        of the token's key part, so the key derivation runs once per token. The
+        client secret is never cached.
 
         Args:
             token_str (str): The BWS token string to parse
@@ -99,10 +184,16 @@ class ClientToken:
             raise InvalidTokenError("Unsupported Token Version")
         if len(encryption_key) != 16:
             raise InvalidTokenError("Invalid Token")
+
+        fingerprint = hashlib.sha256(encryption_key).digest()
+        key = _token_keys.get(fingerprint)
+        if key is None:
+            key = SymmetricCryptoKey.from_encryption_key(encryption_key)
+            _token_keys.put(fingerprint, key)
         return cls(
             access_token_id=access_token_id,
             client_secret=client_secret,
-            encryption_key=SymmetricCryptoKey.from_encryption_key(encryption_key),
+            encryption_key=key,
         )
 
 
@@ -150,10 +241,20 @@ class Auth:
         client_token (ClientToken): The client authentication token
         oauth_jwt (dict): Decoded OAuth JWT token information
         org_enc_key (SymmetricCryptoKey): Organization encryption key
+        hooks (SDKHooks | None): Instrumentation hooks, if configured
+        transport (Transport | None): Transport for identity requests, if configured
+        request_timeout (float | None): Seconds to wait for the identity service
     """
 
     def __init__(
-        self, client_token: ClientToken, region: Region, state_file: str | None = None
+        self,
+        client_token: ClientToken,
+        region: Region,
+        state_file: str | None = None,
+        hooks: SDKHooks | None = None,
+        tracer: "Tracer | None" = None,
+        transport: "Transport | None" = None,
+        request_timeout: float | None = 30.0,
     ):
         """
         Initialize the Auth instance.
@@ -162,6 +263,13 @@ class Auth:
             client_token (ClientToken): The client authentication token
             region (Region): The BWS region configuration
             state_file (str | None): Optional path to state file for token persistence
+            hooks (SDKHooks | None): Optional instrumentation hooks
+            tracer (Tracer | None): Optional OpenTelemetry-compatible tracer
+            transport (Transport | None): Optional transport for identity requests,
+                `requests.post` is used by default
+            request_timeout (float | None): Seconds to wait for the identity service to
+                accept the connection and for each read of the response, None to wait
+                forever
 
         Raises:
             BWSSDKError: If authentication fails
@@ -173,8 +281,62 @@ class Auth:
         self.state_file = Path(state_file) if state_file else None
         self.region = region
         self.client_token = client_token
+        self.hooks = hooks
+        self.transport = transport
+        self.request_timeout = request_timeout
+        self._tracing: Tracing | None = None
+        if tracer is not None:
+            from . import tracing
+
+            self._tracing = tracing.Tracing(tracer)
         self._authenticate()
 
+    def _run_auth(
+        self, source: str, authenticate: "Callable[[], requests.Response | None]"
+    ) -> None:
+        """
+        Run an authentication step, reporting its timing and outcome to the hooks
+        and wrapping it in a "bws.<source>" span when tracing.
+
+        Args:
+            source (str): The name of the step reported to hooks
+            authenticate (Callable[[], requests.Response | None]): The authentication
+                step to run, returning the response it received, if any, which is
+                recorded on the span
+        """
+        hooks = self.hooks
+        tracing = self._tracing
+        if hooks is None and tracing is None:
+            authenticate()
+            return
+        if tracing is None:
+            self._report_auth(source, authenticate)
+            return
+        with tracing.span(f"bws.{source}", {}) as span:
+            response = self._report_auth(source, authenticate)
+            if response is not None:
+                tracing.record_response(span, response)
+
+    def _report_auth(
+        self, source: str, authenticate: "Callable[[], requests.Response | None]"
+    ) -> "requests.Response | None":
+        hooks = self.hooks
+        if hooks is None:
+            return authenticate()
+
+        start = perf_counter()
+        success = False
+        try:
+            response = authenticate()
+            success = True
+            return response
+        finally:
+            hooks.on_auth(
+                AuthMetrics(
+                    source=source, elapsed=perf_counter() - start, success=success
+                )
+            )
+
     def _authenticate(self) -> None:
         """
         Perform initial authentication.
@@ -192,10 +354,10 @@ class Auth:
         """
         try:
             if self.state_file and self.state_file.exists():
-                return self._identity_from_state_file()
+                return self._run_auth("state_file", self._identity_from_state_file)
         except BWSSDKError:
             pass
-        self._identity_request()
+        self._run_auth("identity_request", self._identity_request)
 
     @property
     def bearer_token(self) -> str:
@@ -214,15 +376,36 @@ class Auth:
             UnauthorisedTokenError: If the token is invalid during refresh
             ApiError: If the API returns an error during refresh
         """
-        expiry = datetime.datetime.fromtimestamp(
-            self.oauth_jwt["payload"]["exp"], tz=datetime.timezone.utc
-        )
         now = datetime.datetime.now(datetime.timezone.utc)
-        if expiry < now - datetime.timedelta(seconds=60):
-            self._identity_request()
+        if self.expires_at < now - datetime.timedelta(seconds=60):
+            self.refresh()
 
         return self._bearer_token
 
+    @property
+    def expires_at(self) -> datetime.datetime:
+        """
+        Get the expiry time of the current bearer token.
+
+        Returns:
+            datetime.datetime: When the bearer token expires, in UTC
+        """
+        return datetime.datetime.fromtimestamp(
+            self.oauth_jwt["payload"]["exp"], tz=datetime.timezone.utc
+        )
+
+    def refresh(self) -> None:
+        """
+        Request a new bearer token from the identity service.
+
+        Raises:
+            InvalidIdentityResponseError: If the identity response is invalid
+            SendRequestError: If the network request fails
+            UnauthorisedTokenError: If the token is invalid or expired
+            ApiError: If the API returns an error response
+        """
+        self._run_auth("identity_request", self._identity_request)
+
     @property
     def org_id(self) -> str:
         """
@@ -236,12 +419,16 @@ class Auth:
         """
         return self.oauth_jwt["payload"]["organization"]
 
-    def _identity_request(self) -> None:
+    def _identity_request(self) -> "requests.Response":
         """
         Perform an identity request to obtain OAuth tokens.
 
         Makes a POST request to the BWS identity service to obtain an access token
         and encrypted organization key. Saves the response to the state file if configured.
+        On connection errors the request is retried on the region's mirrors in order.
+
+        Returns:
+            requests.Response: The identity service response
 
         Raises:
             SendRequestError: If the network request fails
@@ -249,6 +436,8 @@ class Auth:
             ApiError: If the API returns a non-200 status code
             InvalidIdentityResponseError: If the response format is invalid or missing required fields
         """
+        import requests
+
         headers = {
             "Content-Type": "application/x-www-form-urlencoded",
             "Accept": "application/json",
@@ -259,14 +448,35 @@ class Auth:
             client_id=self.client_token.access_token_id,
             client_secret=self.client_token.client_secret,
         )
-        try:
-            response = requests.post(
-                f"{self.region.identity_url}/connect/token",
-                data=identity_request.to_query_string(),
-                headers=headers,
+        if self.transport is not None:
+            # The transport may carry an Authorization header, which is not sent here
+            post = functools.partial(
+                self.transport.post, headers={**headers, "Authorization": None}
             )
-        except requests.RequestException as e:
-            raise SendRequestError(f"Failed to send identity request: {e}")
+        else:
+            post = functools.partial(requests.post, headers=headers)
+        identity_urls = self.region.identity_urls
+        for attempt, identity_url in enumerate(identity_urls, 1):
+            url = f"{identity_url}/connect/token"
+            start = perf_counter()
+            try:
+                response = post(
+                    url,
+                    data=identity_request.to_query_string(),
+                    timeout=self.request_timeout,
+                )
+            except requests.RequestException as e:
+                self._report_request(url, None, start)
+                if isinstance(e, requests.ConnectionError) and attempt < len(
+                    identity_urls
+                ):
+                    # Fail over to the next identity service of the region
+                    continue
+                raise SendRequestError(f"Failed to send identity request: {e}")
+            self._report_request(url, response.status_code, start)
+            break
+        else:
+            raise SendRequestError("Failed to send identity request: no identity URL")
         if response.status_code == 401:
             raise UnauthorisedTokenError(response.text)
         if response.status_code != 200:
@@ -292,6 +502,27 @@ class Auth:
             raise InvalidIdentityResponseError(
                 "BWS API returned an invalid identity response"
             ) from e
+        return response
+
+    def _report_request(self, url: str, status_code: int | None, start: float) -> None:
+        """
+        Report an identity service request to the hooks, if configured.
+
+        Args:
+            url (str): The requested URL
+            status_code (int | None): The response status code, None if the request failed
+            start (float): The `perf_counter` value taken before sending the request
+        """
+        if self.hooks is not None:
+            self.hooks.on_request(
+                RequestMetrics(
+                    operation="identity_request",
+                    method="POST",
+                    url=url,
+                    status_code=status_code,
+                    elapsed=perf_counter() - start,
+                )
+            )
 
     def _identity_from_state_file(self) -> None:
         """
@@ -334,6 +565,8 @@ class Auth:
             InvalidEncryptionKeyError: If the encryption key cannot decrypt the data
             jwt.InvalidTokenError: If the JWT token format is invalid
         """
+        import jwt
+
         self._bearer_token = access_token
         self.org_enc_key = self._parse_enc_org_key(encrypted_data)
         self.oauth_jwt = jwt.decode_complete(
@@ -349,7 +582,9 @@ class Auth:
         Parse the encrypted organization encryption key from encrypted data.
 
         Decrypts the provided encrypted data using the client token's encryption key
-        and extracts the organization encryption key from the JSON payload.
+        and extracts the organization encryption key from the JSON payload. The
+        result is cached process-wide under a fingerprint of the token key and the
+        encrypted data, so new clients for the same token skip the decryption.
 
         Args:
             encrypted_data (str): The encrypted data containing the organization encryption key
@@ -368,6 +603,32 @@ class Auth:
         if not encrypted_data:
             raise InvalidIdentityResponseError("Encrypted data cannot be empty")
 
+        token_key = self.client_token.encryption_key
+        fingerprint = hashlib.sha256(
+            token_key.key + token_key.mac_key + encrypted_data.encode("utf-8")
+        ).digest()
+        org_key = _org_keys.get(fingerprint)
+        if self.hooks is not None:
+            self.hooks.on_cache("org_key", org_key is not None)
+        if org_key is None:
+            org_key = self._decrypt_org_key(encrypted_data)
+            _org_keys.put(fingerprint, org_key)
+        return org_key
+
+    def _decrypt_org_key(self, encrypted_data: str) -> SymmetricCryptoKey:
+        """
+        Decrypt the organization encryption key from encrypted data.
+
+        Args:
+            encrypted_data (str): The encrypted data containing the organization encryption key
+
+        Returns:
+            SymmetricCryptoKey: The decrypted organization encryption key
+
+        Raises:
+            InvalidIdentityResponseError: If the payload is invalid or decryption fails
+            InvalidEncryptionKeyError: If the encryption key is invalid
+        """
         encrypted_payload = EncryptedValue.from_str(encrypted_data).decrypt(
             self.client_token.encryption_key
         )
@@ -386,7 +647,14 @@ class Auth:
 
     @classmethod
     def from_token(
-        cls, token_str: str, region: Region, state_file_path: str | None = None
+        cls,
+        token_str: str,
+        region: Region,
+        state_file_path: str | None = None,
+        hooks: SDKHooks | None = None,
+        tracer: "Tracer | None" = None,
+        transport: "Transport | None" = None,
+        request_timeout: float | None = 30.0,
     ) -> "Auth":
         """
         Create an Auth instance from a token string.
@@ -398,6 +666,10 @@ class Auth:
             token_str (str): The BWS token string to parse
             region (Region): The BWS region configuration
             state_file_path (str | None): Optional path to state file for token persistence
+            hooks (SDKHooks | None): Optional instrumentation hooks
+            tracer (Tracer | None): Optional OpenTelemetry-compatible tracer
+            transport (Transport | None): Optional transport for identity requests
+            request_timeout (float | None): Seconds to wait for the identity service
 
         Returns:
             Auth: A new Auth instance
@@ -416,4 +688,8 @@ class Auth:
             client_token=client_token,
             region=region,
             state_file=state_file_path,
+            hooks=hooks,
+            tracer=tracer,
+            transport=transport,
+            request_timeout=request_timeout,
         )
@@ -0,0 +1,117 @@
+"""
+Optional tracing support for the BWS SDK.
+
+This module adapts an OpenTelemetry-compatible tracer to the spans opened by
+`BWSecretClient` and `Auth`. It is only imported when a tracer is passed to the
+client, so the SDK does not depend on OpenTelemetry and untraced clients pay
+nothing for tracing support.
+
+Span names:
+    bws.get_by_id, bws.sync, bws.list_by_project, bws.create, bws.update,
+    bws.delete_many: One span per SDK operation
+    bws.http <METHOD>: One span per HTTP request to the API
+    bws.decrypt: Validation and decryption of a batch of secrets
+    bws.identity_request, bws.state_file: Authentication
+
+Classes:
+    Tracer: Protocol of the tracer methods used by the SDK
+    Span: Protocol of the span methods used by the SDK
+    Tracing: Opens spans and records response attributes on them
+"""
+
+from collections.abc import Mapping
+from contextlib import AbstractContextManager
+from typing import Any, Protocol
+
+import requests
+
+AttributeValue = str | bool | int | float
+
+
+class Span(Protocol):
+    """
+    Protocol of the span methods used by the SDK.
+
+    Satisfied by `opentelemetry.trace.Span`.
+    """
+
+    def set_attribute(self, key: str, value: Any) -> None: ...
+
+
+class Tracer(Protocol):
+    """
+    Protocol of the tracer methods used by the SDK.
+
+    Satisfied by `opentelemetry.trace.Tracer`, e.g. the result of
+    `opentelemetry.trace.get_tracer("bws_sdk")`.
+    """
+
+    def start_as_current_span(
+        self, name: str, *args: Any, **kwargs: Any
+    ) -> AbstractContextManager[Any]: ...
+
+
+class Tracing:
+    """
+    Open spans on a tracer and record SDK specific attributes on them.
+
+    Attributes:
+        tracer (Tracer): The OpenTelemetry-compatible tracer spans are opened on
+    """
+
+    def __init__(self, tracer: Tracer):
+        """
+        Initialize the Tracing adapter.
+
+        Args:
+            tracer (Tracer): The OpenTelemetry-compatible tracer spans are opened on
+
+        Raises:
+            ValueError: If the tracer does not provide start_as_current_span
+        """
+        if not callable(getattr(tracer, "start_as_current_span", None)):
+            raise ValueError("Tracer must provide start_as_current_span")
+        self.tracer = tracer
+
+    def span(
+        self, name: str, attributes: Mapping[str, AttributeValue]
+    ) -> AbstractContextManager[Span]:
+        """
+        Open a span that becomes the current span while the context is active.
+
+        Exceptions raised inside the context are recorded on the span and mark it
+        as failed.
+
+        Args:
+            name (str): The span name
+            attributes (Mapping[str, AttributeValue]): Attributes set when the span starts
+
+        Returns:
+            AbstractContextManager[Span]: A context manager yielding the span
+        """
+        return self.tracer.start_as_current_span(name, attributes=dict(attributes))
+
+    @staticmethod
+    def record_response(
+        span: Span, response: requests.Response, wire_bytes: int | None = None
+    ) -> None:
+        """
+        Record the status code, payload size and rate limit headroom of a response.
+
+        Args:
+            span (Span): The span to record the attributes on
+            response (requests.Response): The HTTP response
+            wire_bytes (int | None): Size of the body as received, before decompression
+        """
+        span.set_attribute("http.response.status_code", response.status_code)
+        content = response.content
+        if isinstance(content, bytes):
+            span.set_attribute("bws.payload_bytes", len(content))
+        if wire_bytes is not None:
+            span.set_attribute("bws.wire_bytes", wire_bytes)
+        remaining = response.headers.get("x-rate-limit-remaining")
+        if remaining is not None:
+            try:
+                span.set_attribute("bws.ratelimit.remaining", int(remaining))
+            except (TypeError, ValueError):
+                pass
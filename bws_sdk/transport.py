@@ -0,0 +1,308 @@
+"""
+Pluggable HTTP transports for the BWS SDK.
+
+`BWSecretClient` and `Auth` send their requests through a transport. By default this
+is a `requests.Session`, which sends every concurrent request over its own HTTP/1.1
+connection, each paying for its own TLS handshake. `HTTP2Transport` sends requests
+over HTTP/2 instead, so concurrent requests to a host share a single connection.
+It requires the optional `httpx` dependency with HTTP/2 support, installed with
+`pip install "httpx[http2]"`, which is only imported when the transport is created.
+
+Classes:
+    Transport: Protocol of the session methods used by the SDK
+    HTTP2Transport: Transport multiplexing requests over HTTP/2 connections
+"""
+
+import asyncio
+import threading
+from collections.abc import Mapping, MutableMapping
+from datetime import timedelta
+from time import perf_counter
+from typing import Any, Protocol
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+
+class Transport(Protocol):
+    """
+    Protocol of the session methods used by the SDK.
+
+    Satisfied by `requests.Session` and `HTTP2Transport`. Every method sends a request
+    with the transport's `headers` merged with the `headers` argument, where headers
+    set to None are left out, and returns a `requests.Response`. Failures must be
+    raised as `requests.RequestException`, connection failures as
+    `requests.ConnectionError`.
+
+    A transport may provide a `reset_after_fork()` method, called in a forked child
+    to drop the connections inherited from the parent without closing them.
+    """
+
+    @property
+    def headers(self) -> MutableMapping[str, Any]:
+        """Headers sent with every request."""
+        ...
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response: ...
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response: ...
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response: ...
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response: ...
+
+
+class _ReceivedBytes:
+    """
+    Raw stream of a converted response, reporting the body bytes received.
+    """
+
+    def __init__(self, received: int):
+        self._received = received
+
+    def tell(self) -> int:
+        return self._received
+
+
+class HTTP2Transport:
+    """
+    Send requests over HTTP/2, multiplexing concurrent requests over one connection.
+
+    Requests from any number of threads to the same host share one connection, so
+    a burst of concurrent `get_by_id` calls pays for a single TLS handshake instead
+    of one per request. Servers that do not negotiate HTTP/2 are spoken to over
+    HTTP/1.1.
+
+    Requests are sent by an `httpx.AsyncClient` running on an event loop in a
+    daemon thread, started on the first request, while the calling threads wait
+    for their response. Opening streams from a single event loop keeps their ids
+    in the order HTTP/2 requires, which the thread based httpx client does not
+    guarantee when several threads share a connection.
+
+    Attributes:
+        headers (CaseInsensitiveDict): Headers sent with every request
+
+    Example:
+        ```python
+        client = BWSecretClient(region, access_token, transport=HTTP2Transport())
+        ```
+    """
+
+    def __init__(
+        self,
+        timeout: float | None = 30.0,
+        max_connections: int = 10,
+        verify: bool | str = True,
+        prior_knowledge: bool = False,
+    ):
+        """
+        Initialize the HTTP2Transport.
+
+        Args:
+            timeout (float | None): Seconds to wait for the connection and for every
+                read and write, None to wait forever
+            max_connections (int): Maximum number of connections kept open per host
+            verify (bool | str): Whether to verify TLS certificates, or the path of a
+                CA bundle to verify them with
+            prior_knowledge (bool): Speak HTTP/2 without negotiating it first, which is
+                required for unencrypted http:// URLs
+
+        Raises:
+            ValueError: If max_connections is less than 1
+            ImportError: If httpx or its HTTP/2 support is not installed
+        """
+        if max_connections < 1:
+            raise ValueError("Max connections must be at least 1")
+        try:
+            import h2  # noqa: F401
+            import httpx
+        except ImportError as e:
+            raise ImportError(
+                "HTTP2Transport requires httpx with HTTP/2 support, "
+                "install it with: pip install 'httpx[http2]'"
+            ) from e
+
+        self.headers: CaseInsensitiveDict[Any] = CaseInsensitiveDict()
+        self.timeout = timeout
+        self.max_connections = max_connections
+        self.verify = verify
+        self.prior_knowledge = prior_knowledge
+        self._httpx = httpx
+        self._lock = threading.Lock()
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._thread: threading.Thread | None = None
+        self._client: Any = None
+
+    def _new_client(self) -> Any:
+        httpx = self._httpx
+        return httpx.AsyncClient(
+            http1=not self.prior_knowledge,
+            http2=True,
+            timeout=self.timeout,
+            verify=self.verify,
+            limits=httpx.Limits(max_connections=self.max_connections),
+        )
+
+    def request(
+        self,
+        method: str,
+        url: str,
+        params: Mapping[str, Any] | None = None,
+        data: str | bytes | None = None,
+        json: Any = None,
+        headers: Mapping[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> requests.Response:
+        """
+        Send a request and read its complete response.
+
+        Args:
+            method (str): The HTTP method
+            url (str): The URL to request
+            params (Mapping[str, Any] | None): Query parameters
+            data (str | bytes | None): The raw request body
+            json (Any): A request body to send as JSON
+            headers (Mapping[str, Any] | None): Headers for this request, None values
+                remove transport headers
+            timeout (float | None): Timeout overriding the transport's for this request
+
+        Returns:
+            requests.Response: The response, with its body already read and
+                `elapsed` set to the time until its headers arrived
+
+        Raises:
+            requests.ConnectionError: If no connection could be established
+            requests.Timeout: If the request timed out
+            requests.RequestException: If the request failed otherwise
+        """
+        httpx = self._httpx
+        loop, client = self._start()
+        merged = {**self.headers, **(headers or {})}
+        request = client.build_request(
+            method.upper(),
+            url,
+            params=params,
+            content=data,
+            json=json,
+            headers={k: v for k, v in merged.items() if v is not None},
+            timeout=self.timeout if timeout is None else timeout,
+        )
+        try:
+            response, elapsed = asyncio.run_coroutine_threadsafe(
+                self._fetch(client, request), loop
+            ).result()
+        except httpx.ConnectError as e:
+            raise requests.ConnectionError(str(e)) from e
+        except httpx.TimeoutException as e:
+            raise requests.Timeout(str(e)) from e
+        except httpx.HTTPError as e:
+            raise requests.RequestException(str(e)) from e
+        result = self._to_response(response)
+        result.elapsed = timedelta(seconds=elapsed)
+        return result
+
+    @staticmethod
+    async def _fetch(client: Any, request: Any) -> tuple[Any, float]:
+        """
+        Send a request and read its body, timing the arrival of the headers.
+
+        Like `requests`, the elapsed time ends when the headers arrived, so that a
+        large body does not count as latency of the server.
+
+        Args:
+            client (httpx.AsyncClient): The client the request is sent with
+            request (httpx.Request): The request
+
+        Returns:
+            tuple[httpx.Response, float]: The response with its body read, and the
+                seconds until its headers arrived
+        """
+        start = perf_counter()
+        response = await client.send(request, stream=True)
+        elapsed = perf_counter() - start
+        try:
+            await response.aread()
+        finally:
+            await response.aclose()
+        return response, elapsed
+
+    def _start(self) -> tuple[asyncio.AbstractEventLoop, Any]:
+        """
+        Start the event loop thread and the client on first use.
+
+        Returns:
+            tuple[asyncio.AbstractEventLoop, httpx.AsyncClient]: The running loop and
+                the client requests are sent with
+        """
+        with self._lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="bws-sdk-http2", daemon=True
+                )
+                self._thread.start()
+                self._client = self._new_client()
+                self._loop = loop
+            return self._loop, self._client
+
+    @staticmethod
+    def _to_response(response: Any) -> requests.Response:
+        """
+        Convert an httpx response into a requests response.
+
+        Args:
+            response (httpx.Response): The response whose body has been read
+
+        Returns:
+            requests.Response: An equivalent response
+        """
+        result = requests.Response()
+        result.status_code = response.status_code
+        result.headers = CaseInsensitiveDict(response.headers.items())
+        result._content = response.content
+        result._content_consumed = True
+        result.raw = _ReceivedBytes(response.num_bytes_downloaded)
+        result.encoding = response.encoding
+        result.reason = response.reason_phrase
+        result.url = str(response.url)
+        return result
+
+    def get(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def post(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def put(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("PUT", url, **kwargs)
+
+    def delete(self, url: str, **kwargs: Any) -> requests.Response:
+        return self.request("DELETE", url, **kwargs)
+
+    def reset_after_fork(self) -> None:
+        """
+        Drop the connections inherited from the parent process without closing them.
+
+        Closing an HTTP/2 connection sends a GOAWAY frame, which would end the
+        parent's connection too, so the old connection pool is only abandoned. The
+        event loop thread does not exist in the child; a new one is started on the
+        next request.
+        """
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._client = None
+
+    def close(self) -> None:
+        """
+        Close all open connections and stop the event loop thread.
+        """
+        with self._lock:
+            loop, thread, client = self._loop, self._thread, self._client
+            self._loop = self._thread = self._client = None
+        if loop is None or thread is None:
+            return
+        asyncio.run_coroutine_threadsafe(client.aclose(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
@@ -0,0 +1,249 @@
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from bws_sdk.breaker import CircuitBreaker
+from bws_sdk.bws_types import Region
+from bws_sdk.client import BWSecretClient
+from bws_sdk.crypto import EncryptedValue, SymmetricCryptoKey
+from bws_sdk.errors import ApiError, CircuitOpenError, SendRequestError
+
+ORG_KEY = SymmetricCryptoKey(b"0" * 64)
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def encrypted_secret(secret_id, value="value"):
+    return {
+        "id": secret_id,
+        "organizationId": "org_id",
+        "key": EncryptedValue.from_data(ORG_KEY, f"key_{secret_id}").to_str(),
+        "value": EncryptedValue.from_data(ORG_KEY, value).to_str(),
+        "creationDate": "2023-01-01T00:00:00Z",
+        "revisionDate": "2023-01-01T00:00:00Z",
+    }
+
+
+def response(status_code, body=None):
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = body
+    mock_response.text = "error"
+    mock_response.headers = {}
+    return mock_response
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def breaker(clock):
+    return CircuitBreaker(failure_threshold=2, cooldown=10, clock=clock)
+
+
+@pytest.fixture
+def region():
+    return Region(api_url="https://api.test.com", identity_url="https://id.test.com")
+
+
+@pytest.fixture
+def client(region, breaker):
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.bearer_token = "test_token"
+        mock_auth.return_value.org_id = "org_id"
+        mock_auth.return_value.org_enc_key = ORG_KEY
+        return BWSecretClient(
+            region, "access_token", circuit_breaker=breaker, serve_stale=True
+        )
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"failure_threshold": 0}, {"cooldown": 0}, {"half_open_probes": 0}],
+)
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        CircuitBreaker(**kwargs)
+
+
+def test_invalid_breaker(region):
+    with patch("bws_sdk.client.Auth.from_token"):
+        with pytest.raises(ValueError, match="Circuit breaker must be an instance"):
+            BWSecretClient(region, "access_token", circuit_breaker=object())
+
+
+def test_opens_after_consecutive_failures(breaker):
+    breaker.before_request()
+    breaker.record_failure()
+    breaker.before_request()
+    breaker.record_success()
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.CLOSED
+
+    breaker.before_request()
+    breaker.record_failure()
+    assert breaker.state == CircuitBreaker.OPEN
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+
+
+def test_half_open_admits_limited_probes(breaker, clock):
+    for _ in range(2):
+        breaker.record_failure()
+    clock.now = 10
+    assert breaker.state == CircuitBreaker.HALF_OPEN
+
+    breaker.before_request()
+    with pytest.raises(CircuitOpenError, match="probe in progress"):
+        breaker.before_request()
+
+    breaker.record_success()
+    assert breaker.state == CircuitBreaker.CLOSED
+    breaker.before_request()
+
+
+def test_failed_probe_reopens(breaker, clock):
+    for _ in range(2):
+        breaker.record_failure()
+    clock.now = 10
+    breaker.before_request()
+    breaker.record_failure()
+
+    assert breaker.state == CircuitBreaker.OPEN
+    clock.now = 19
+    with pytest.raises(CircuitOpenError):
+        breaker.before_request()
+    clock.now = 20
+    breaker.before_request()
+
+
+def test_client_fails_fast_when_open(client, breaker):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = requests.ConnectionError("down")
+        for _ in range(2):
+            with pytest.raises(SendRequestError):
+                client.get_by_id("a")
+        with pytest.raises(CircuitOpenError):
+            client.get_by_id("a")
+
+    assert mock_get.call_count == 2
+
+
+def test_server_errors_trip_client_errors_do_not(client, breaker):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(400)
+        for _ in range(3):
+            with pytest.raises(ApiError):
+                client.get_by_id("a")
+        assert breaker.state == CircuitBreaker.CLOSED
+
+        mock_get.return_value = response(503)
+        for _ in range(2):
+            with pytest.raises(ApiError):
+                client.get_by_id("a")
+    assert breaker.state == CircuitBreaker.OPEN
+
+
+def test_serves_stale_copy_while_unavailable(client, breaker):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(200, encrypted_secret("a"))
+        fresh = client.get_by_id("a")
+        assert fresh.stale is False
+
+        mock_get.return_value = response(503)
+        for _ in range(3):
+            stale = client.get_by_id("a")
+            assert stale.stale is True
+            assert stale.value == "value"
+
+        assert breaker.state == CircuitBreaker.OPEN
+        with pytest.raises(CircuitOpenError):
+            client.get_by_id("b")
+    assert mock_get.call_count == 3
+
+
+def test_not_found_forgets_stale_copy(client):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(200, encrypted_secret("a"))
+        client.get_by_id("a")
+        mock_get.return_value = response(404)
+        assert client.get_by_id("a") is None
+        mock_get.side_effect = requests.ConnectionError("down")
+        with pytest.raises(SendRequestError):
+            client.get_by_id("a")
+
+
+def test_deleted_secret_is_not_served_stale(client):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(200, encrypted_secret("a"))
+        client.get_by_id("a")
+    with patch.object(client.session, "post") as mock_post:
+        mock_post.return_value = response(200, {"data": [{"id": "a", "error": None}]})
+        client.delete_many(["a"])
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = requests.ConnectionError("down")
+        with pytest.raises(SendRequestError):
+            client.get_by_id("a")
+
+
+def test_hung_requests_time_out_and_trip(client, breaker):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = requests.ReadTimeout("timed out")
+        for _ in range(2):
+            with pytest.raises(SendRequestError):
+                client.get_by_id("a")
+        with pytest.raises(CircuitOpenError):
+            client.get_by_id("a")
+
+    assert breaker.state == CircuitBreaker.OPEN
+    assert [c.kwargs["timeout"] for c in mock_get.call_args_list] == [30.0, 30.0]
+
+
+def test_request_timeout_is_configurable(region):
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.bearer_token = "test_token"
+        client = BWSecretClient(region, "access_token", request_timeout=2.5)
+        assert mock_auth.call_args.kwargs["request_timeout"] == 2.5
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(404)
+        client.get_by_id("a")
+    assert mock_get.call_args.kwargs["timeout"] == 2.5
+
+
+@pytest.mark.parametrize("kwargs", [{"request_timeout": 0}, {"stale_cache_size": 0}])
+def test_invalid_client_parameters(region, kwargs):
+    with patch("bws_sdk.client.Auth.from_token"):
+        with pytest.raises(ValueError):
+            BWSecretClient(region, "access_token", **kwargs)
+
+
+def test_stale_copies_are_bounded(region):
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.bearer_token = "test_token"
+        mock_auth.return_value.org_enc_key = ORG_KEY
+        client = BWSecretClient(
+            region, "access_token", serve_stale=True, stale_cache_size=2
+        )
+
+    with patch.object(client.session, "get") as mock_get:
+        for secret_id in ("a", "b", "c"):
+            mock_get.return_value = response(200, encrypted_secret(secret_id))
+            client.get_by_id(secret_id)
+
+        mock_get.return_value = response(503)
+        assert client.get_by_id("b").stale is True
+        assert client.get_by_id("c").stale is True
+        with pytest.raises(ApiError):
+            client.get_by_id("a")
+    assert list(client._last_good) == ["b", "c"]
@@ -0,0 +1,187 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from bws_sdk.bws_types import BitwardenSecret, BitwardenSync, RatelimitInfo
+from bws_sdk.cache import SecretCache
+from bws_sdk.client import BWSecretClient
+from bws_sdk.errors import SendRequestError
+
+RATELIMIT = RatelimitInfo(
+    limit="1m", remaining=100, reset=datetime(2023, 1, 1, tzinfo=timezone.utc)
+)
+
+
+def make_secret(secret_id, value="value", revision=1):
+    return BitwardenSecret(
+        id=secret_id,
+        organizationId="org_id",
+        key=f"key_{secret_id}",
+        value=value,
+        creationDate=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        revisionDate=datetime(2023, 1, revision, tzinfo=timezone.utc),
+        projects=[],
+    )
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return Clock()
+
+
+@pytest.fixture
+def client():
+    client = MagicMock(spec=BWSecretClient)
+    client.get_by_id.side_effect = lambda sid: make_secret(sid)
+    return client
+
+
+def test_cache_validates_arguments(client):
+    with pytest.raises(ValueError, match="Client must be an instance"):
+        SecretCache("not a client")
+    with pytest.raises(ValueError, match="TTL must be positive"):
+        SecretCache(client, ttl=0)
+    with pytest.raises(ValueError, match="Revalidation must be"):
+        SecretCache(client, revalidation="poll")
+    with pytest.raises(ValueError, match="Secret ID must be a string"):
+        SecretCache(client).get(1)
+
+
+def test_fetch_mode_refetches_each_expired_entry(client, clock):
+    cache = SecretCache(client, ttl=10, revalidation="fetch", clock=clock)
+    for sid in ("a", "b", "c"):
+        cache.get(sid)
+    cache.get("a")
+    assert client.get_by_id.call_count == 3
+
+    clock.now = 10
+    for sid in ("a", "b", "c"):
+        cache.get(sid)
+
+    assert client.get_by_id.call_count == 6
+    client.sync.assert_not_called()
+
+
+def test_sync_mode_revalidates_all_entries_with_one_request(client, clock):
+    cache = SecretCache(client, ttl=10, clock=clock)
+    for sid in ("a", "b", "c"):
+        cache.get(sid)
+    first_fetch = cache.last_synced
+    client.sync.return_value = BitwardenSync(
+        secrets=[make_secret("b", value="rotated", revision=2)],
+        ratelimit=RATELIMIT,
+        unchanged=["a"],
+        removed=["c"],
+    )
+
+    clock.now = 10
+    assert cache.get("b").value == "rotated"
+    assert cache.get("a").value == "value"
+
+    assert client.get_by_id.call_count == 3
+    client.sync.assert_called_once()
+    args, kwargs = client.sync.call_args
+    assert args == (first_fetch,)
+    assert set(kwargs["revisions"]) == {"a", "b", "c"}
+    assert set(kwargs["secret_ids"]) == {"a", "b", "c"}
+    assert "c" not in cache
+    assert cache.last_synced > first_fetch
+
+    # Evicted secrets are fetched again on their next lookup
+    cache.get("c")
+    assert client.get_by_id.call_count == 4
+
+
+def test_sync_mode_without_changes(client, clock):
+    cache = SecretCache(client, ttl=10, clock=clock)
+    cache.get("a")
+    client.sync.return_value = BitwardenSync(secrets=None, ratelimit=RATELIMIT)
+
+    clock.now = 10
+    diff = cache.revalidate()
+
+    assert not diff
+    assert "a" in cache
+    cache.get("a")
+    client.sync.assert_called_once()
+
+
+def test_failed_revalidation_serves_cached_secrets_until_next_interval(
+    client, clock, caplog
+):
+    cache = SecretCache(client, ttl=10, clock=clock)
+    cache.get("a")
+    client.sync.side_effect = SendRequestError("down")
+
+    clock.now = 10
+    assert cache.get("a").value == "value"
+    assert cache.get("a").value == "value"
+    clock.now = 19
+    cache.get("a")
+    assert client.sync.call_count == 1
+    assert "Secret cache revalidation failed" in caplog.text
+
+    client.sync.side_effect = None
+    client.sync.return_value = BitwardenSync(
+        secrets=[make_secret("a", value="rotated", revision=2)], ratelimit=RATELIMIT
+    )
+    clock.now = 20
+    assert cache.get("a").value == "rotated"
+    assert client.sync.call_count == 2
+    assert client.get_by_id.call_count == 1
+
+
+def test_revalidate_reports_changes(client, clock):
+    cache = SecretCache(client, ttl=10, clock=clock)
+    assert not cache.revalidate()
+    cache.get("a")
+    cache.get("b")
+    client.sync.return_value = BitwardenSync(
+        secrets=[make_secret("a", revision=2), make_secret("x")],
+        ratelimit=RATELIMIT,
+        removed=["b"],
+    )
+
+    diff = cache.revalidate()
+
+    assert [s.id for s in diff.modified] == ["a"]
+    assert [s.id for s in diff.removed] == ["b"]
+    assert "x" not in cache
+
+
+def test_missing_secrets_are_not_cached_and_hooks(client, clock):
+    client.get_by_id.side_effect = None
+    client.get_by_id.return_value = None
+    client.hooks = MagicMock()
+    cache = SecretCache(client, clock=clock)
+
+    assert cache.get("a") is None
+    assert cache.get("a") is None
+    assert client.get_by_id.call_count == 2
+    assert len(cache) == 0
+    assert [c.args for c in client.hooks.on_cache.call_args_list] == [
+        ("get_by_id", False),
+        ("get_by_id", False),
+    ]
+
+
+def test_invalidate(client, clock):
+    cache = SecretCache(client, clock=clock)
+    cache.get("a")
+    cache.get("b")
+
+    cache.invalidate("a")
+    assert "a" not in cache and "b" in cache
+
+    cache.invalidate()
+    assert len(cache) == 0
+    assert cache.last_synced is None
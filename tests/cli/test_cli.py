@@ -0,0 +1,233 @@
+import json
+from datetime import datetime
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from bws_sdk.bws_types import (
+    BitwardenProject,
+    BitwardenSecret,
+    BitwardenSync,
+    RatelimitInfo,
+)
+from bws_sdk.cli import main
+from bws_sdk.crypto import SymmetricCryptoKey
+from bws_sdk.errors import SendRequestError
+
+RATELIMIT = RatelimitInfo(limit="1m", remaining=10, reset=datetime(2024, 1, 1))
+
+
+def secret(secret_id, key, value, projects=()):
+    return BitwardenSecret(
+        id=secret_id,
+        organizationId="org",
+        key=key,
+        value=value,
+        creationDate=datetime(2024, 1, 1),
+        revisionDate=datetime(2024, 1, 1),
+        projects=[BitwardenProject(id=project) for project in projects],
+    )
+
+
+@pytest.fixture
+def mock_client(monkeypatch):
+    monkeypatch.setenv("BWS_ACCESS_TOKEN", "token")
+    monkeypatch.delenv("BWS_STATE_FILE", raising=False)
+    monkeypatch.delenv("BWS_CACHE_DIR", raising=False)
+    with patch("bws_sdk.cli.BWSecretClient") as mock:
+        mock.return_value.auth.org_enc_key = SymmetricCryptoKey(b"0" * 64)
+        mock.return_value.sync.return_value = BitwardenSync(
+            secrets=[
+                secret("id-1", "DB_PASSWORD", "it's secret", ["project-a"]),
+                secret("id-2", "TLS_KEY", "key", ["project-b"]),
+                secret("id-3", "not a name", "x"),
+            ],
+            ratelimit=RATELIMIT,
+        )
+        yield mock
+
+
+def test_project_prints_shell_exports(mock_client, capsys, tmp_path):
+    status = main(
+        [
+            "project",
+            "--env",
+            "DB_PASSWORD=PGPASSWORD",
+            "--file",
+            f"id-2={tmp_path / 'tls.key'}",
+        ]
+    )
+
+    assert status == 0
+    assert capsys.readouterr().out == "export PGPASSWORD='it'\"'\"'s secret'\n"
+    assert (tmp_path / "tls.key").read_text() == "key"
+    region, token, state_file = mock_client.call_args.args
+    assert region.api_url == "https://api.bitwarden.com"
+    assert token == "token"
+    assert state_file is None
+
+
+def test_project_mapping_file_and_env_file(mock_client, tmp_path):
+    mapping = tmp_path / "mapping.json"
+    mapping.write_text(json.dumps({"env": {"id-1": "PGPASSWORD"}}))
+    env_file = tmp_path / "app.env"
+
+    status = main(
+        [
+            "project",
+            "--mapping",
+            str(mapping),
+            "--format",
+            "dotenv",
+            "--env-file",
+            str(env_file),
+        ]
+    )
+
+    assert status == 0
+    assert env_file.read_text() == 'PGPASSWORD="it\'s secret"\n'
+
+
+def test_invalid_pair_is_usage_error(mock_client):
+    with pytest.raises(SystemExit) as e:
+        main(["project", "--env", "NOVALUE"])
+    assert e.value.code == 2
+
+
+def test_missing_token(monkeypatch, capsys):
+    monkeypatch.delenv("BWS_ACCESS_TOKEN", raising=False)
+    assert main(["project", "--env", "A=B"]) == 1
+    assert "BWS_ACCESS_TOKEN" in capsys.readouterr().err
+
+
+def test_sdk_errors_exit_with_1(mock_client, capsys):
+    mock_client.return_value.sync.side_effect = SendRequestError("down")
+    assert main(["project", "--env", "A=B"]) == 1
+    assert "bws-sdk: down" in capsys.readouterr().err
+
+
+def test_invalid_since_is_usage_error(mock_client):
+    with pytest.raises(SystemExit) as e:
+        main(["sync", "--since", "yesterday"])
+    assert e.value.code == 2
+
+
+def test_malformed_mapping_exits_with_1(mock_client, capsys, tmp_path):
+    mapping = tmp_path / "mapping.json"
+    mapping.write_text("{not json")
+
+    assert main(["project", "--mapping", str(mapping)]) == 1
+    assert capsys.readouterr().err.startswith("bws-sdk: ")
+
+
+def test_malformed_token_exits_with_1(monkeypatch, capsys):
+    monkeypatch.setenv("BWS_ACCESS_TOKEN", "x")
+    monkeypatch.delenv("BWS_STATE_FILE", raising=False)
+    monkeypatch.delenv("BWS_CACHE_DIR", raising=False)
+
+    assert main(["sync"]) == 1
+    assert "bws-sdk: Invalid access token" in capsys.readouterr().err
+
+
+def test_get_prints_value(mock_client, capsys):
+    mock_client.return_value.get_by_id.return_value = secret("id-1", "A", "value")
+
+    assert main(["get", "id-1"]) == 0
+    assert capsys.readouterr().out == "value\n"
+    mock_client.return_value.get_by_id.assert_called_once_with("id-1")
+
+
+def test_get_json_and_missing(mock_client, capsys):
+    mock_client.return_value.get_by_id.return_value = secret("id-1", "A", "value")
+    assert main(["get", "id-1", "--json"]) == 0
+    assert json.loads(capsys.readouterr().out)["key"] == "A"
+
+    mock_client.return_value.get_by_id.return_value = None
+    assert main(["get", "id-9"]) == 1
+
+
+def test_list_by_project(mock_client, capsys):
+    mock_client.return_value.list_by_project.return_value = [secret("id-1", "A", "v")]
+
+    assert main(["list", "--project-id", "p"]) == 0
+    assert [s["id"] for s in json.loads(capsys.readouterr().out)] == ["id-1"]
+
+
+def test_list_all(mock_client, capsys):
+    assert main(["list"]) == 0
+    assert len(json.loads(capsys.readouterr().out)) == 3
+
+
+def test_sync_since(mock_client, capsys):
+    assert main(["sync", "--since", "2024-05-01T00:00:00+00:00"]) == 0
+
+    output = json.loads(capsys.readouterr().out)
+    assert output["hasChanges"] is True
+    since = mock_client.return_value.sync.call_args.args[0]
+    assert since.isoformat() == "2024-05-01T00:00:00+00:00"
+
+
+def test_run_injects_all_valid_keys(mock_client, monkeypatch, capsys):
+    monkeypatch.setenv("TLS_KEY", "existing")
+    with patch("bws_sdk.cli.os.execvpe") as mock_exec:
+        main(["run", "--no-overwrite", "--", "env", "-0"])
+
+    file, argv, env = mock_exec.call_args.args
+    assert (file, argv) == ("env", ["env", "-0"])
+    assert env["DB_PASSWORD"] == "it's secret"
+    assert env["TLS_KEY"] == "existing"
+    assert "not a name" not in env
+    assert "skipping secret key 'not a name'" in capsys.readouterr().err
+
+
+def test_run_with_mapping_and_project(mock_client):
+    with patch("bws_sdk.cli.os.execvpe") as mock_exec:
+        main(["run", "--project-id", "project-b", "--env", "TLS_KEY=KEY", "--", "x"])
+
+    env = mock_exec.call_args.args[2]
+    assert env["KEY"] == "key"
+    assert "DB_PASSWORD" not in env
+
+
+def test_run_without_command(mock_client):
+    assert main(["run", "--"]) == 2
+
+
+def test_cache_requests_only_changes(mock_client, tmp_path, capsys):
+    sync = mock_client.return_value.sync
+    assert main(["--cache-dir", str(tmp_path), "list"]) == 0
+    first_since = sync.call_args.args[0]
+
+    sync.return_value = BitwardenSync(secrets=None, ratelimit=RATELIMIT)
+    capsys.readouterr()
+    assert main(["--cache-dir", str(tmp_path), "list"]) == 0
+
+    assert first_since.year == 1970
+    assert sync.call_args.args[0].year > 1970
+    assert len(json.loads(capsys.readouterr().out)) == 3
+    cache_files = sorted(p.suffix for p in tmp_path.iterdir())
+    assert cache_files == [".secrets"]
+    assert "hunter" not in next(tmp_path.iterdir()).read_text()
+    state_file = mock_client.call_args.args[2]
+    assert state_file.startswith(str(tmp_path))
+    assert "token" not in Path(state_file).name
+
+
+def test_fresh_cache_skips_request(mock_client, tmp_path, capsys):
+    main(["--cache-dir", str(tmp_path), "list"])
+    sync = mock_client.return_value.sync
+    sync.reset_mock()
+
+    assert main(["--cache-dir", str(tmp_path), "--max-age", "60", "get", "id-2"]) == 0
+    assert capsys.readouterr().out.endswith("key\n")
+    sync.assert_not_called()
+
+
+def test_unreadable_cache_is_ignored(mock_client, tmp_path):
+    main(["--cache-dir", str(tmp_path), "list"])
+    cache = next(tmp_path.iterdir())
+    cache.write_text("garbage")
+
+    assert main(["--cache-dir", str(tmp_path), "--max-age", "60", "list"]) == 0
+    assert mock_client.return_value.sync.call_args.args[0].year == 1970
@@ -1,14 +1,26 @@
-from datetime import datetime
+import gzip
+import io
+from datetime import datetime, timezone
 from unittest.mock import MagicMock, Mock, patch
 
 import pytest
+import requests
+import urllib3
+from requests.adapters import HTTPAdapter
 
 from bws_sdk.bws_types import BitwardenSecret, BitwardenSecretRT, BitwardenSync, Region
-from bws_sdk.client import BWSecretClient
+from bws_sdk.client import BWSecretClient, _accept_encoding
 from bws_sdk.crypto import SymmetricCryptoKey
-from bws_sdk.errors import ApiError, SecretParseError, UnauthorisedError
+from bws_sdk.errors import (
+    ApiError,
+    SecretParseError,
+    SendRequestError,
+    UnauthorisedError,
+)
 from bws_sdk.token import Auth
 
+AUTH_HEADERS = {"Authorization": "Bearer test_token"}
+
 
 @pytest.fixture
 def symkey():
@@ -28,6 +40,7 @@ def auth():
 def region():
     region = MagicMock(spec=Region)
     region.api_url = "https://api.test.com"
+    region.mirrors = []
     return region
 
 
@@ -45,11 +58,50 @@ def mock_secret():
 
 def test_client_initialization():
     region = MagicMock(spec=Region)
+    region.mirrors = []
     with patch("bws_sdk.client.Auth.from_token") as mock_auth:
         mock_auth.return_value.bearer_token = "test_token"
         client = BWSecretClient(region, "access_token")
         assert client.region == region
-        mock_auth.assert_called_once_with("access_token", region, None)
+        mock_auth.assert_called_once_with(
+            "access_token",
+            region,
+            None,
+            hooks=None,
+            tracer=None,
+            transport=None,
+            request_timeout=30.0,
+        )
+
+
+def test_client_uses_transport():
+    region = MagicMock(spec=Region)
+    region.mirrors = []
+    region.api_url = "https://api.example.com"
+    transport = MagicMock()
+    transport.headers = {}
+    transport.get.return_value.status_code = 404
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.bearer_token = "test_token"
+        client = BWSecretClient(region, "access_token", transport=transport)
+
+    assert client.session is transport
+    assert mock_auth.call_args.kwargs["transport"] is transport
+    assert "Authorization" not in transport.headers
+    assert client.get_by_id("secret_id") is None
+    transport.get.assert_called_once()
+    assert transport.get.call_args.kwargs["headers"] == {
+        "Authorization": "Bearer test_token"
+    }
+
+    client._reset_after_fork()
+    transport.reset_after_fork.assert_called_once_with()
+
+
+def test_client_initialization_invalid_transport():
+    region = MagicMock(spec=Region)
+    with pytest.raises(ValueError, match="Transport must provide"):
+        BWSecretClient(region, "access_token", transport=object())
 
 
 def test_client_initialization_invalid_region():
@@ -102,7 +154,11 @@ def test_get_by_id_success(mock_auth, region, mock_secret):
             assert isinstance(result, BitwardenSecretRT)
             assert result.id == mock_secret.id
             assert result.ratelimit.remaining == 100
-            mock_get.assert_called_once_with(f"{region.api_url}/secrets/secret_id")
+            mock_get.assert_called_once_with(
+                f"{region.api_url}/secrets/secret_id",
+                headers=AUTH_HEADERS,
+                timeout=30.0,
+            )
 
 
 @patch("bws_sdk.client.Auth.from_token")
@@ -236,6 +292,104 @@ def test_sync_no_changes(mock_auth, region, mock_secret):
             assert result.ratelimit.remaining == 98
 
 
+@patch("bws_sdk.client.Auth.from_token")
+def test_sync_incremental(mock_auth, region, mock_secret):
+    mock_auth.return_value.org_id = "org_id"
+    client = BWSecretClient(region, "access_token")
+
+    def item(secret_id, revision):
+        return {
+            "id": secret_id,
+            "organizationId": "org_id",
+            "key": "encrypted_key",
+            "value": "encrypted_value",
+            "creationDate": "2023-01-01T00:00:00Z",
+            "revisionDate": revision,
+        }
+
+    held = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    with patch.object(client.session, "get") as mock_get:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers.get = lambda k, d=None: d
+        mock_response.json.return_value = {
+            "hasChanges": True,
+            "secrets": {
+                "data": [
+                    item("same", "2023-01-01T00:00:00Z"),
+                    item("revised", "2023-02-01T00:00:00Z"),
+                    item("new", "2023-01-01T00:00:00Z"),
+                    item("naive", "2023-01-01T00:00:00"),
+                ]
+            },
+        }
+        mock_get.return_value = mock_response
+
+        with patch.object(client, "_decrypt_secret", side_effect=lambda s: s):
+            result = client.sync(
+                datetime(2023, 1, 1),
+                revisions={
+                    "same": held,
+                    "revised": held,
+                    "naive": held,
+                    "gone": held,
+                },
+            )
+
+    assert [secret.id for secret in result.secrets] == ["revised", "new", "naive"]
+    assert result.unchanged == ["same"]
+    assert result.removed == ["gone"]
+    assert not client._is_unchanged(
+        {"id": "same", "revisionDate": "yesterday"}, {"same": held}
+    )
+    assert not client._is_unchanged(
+        {"id": ["same"], "revisionDate": "2023-01-01T00:00:00+00:00"}, {"same": held}
+    )
+
+
+@patch("bws_sdk.client.Auth.from_token")
+def test_sync_secret_ids(mock_auth, region):
+    mock_auth.return_value.org_id = "org_id"
+    client = BWSecretClient(region, "access_token")
+    items = [
+        {
+            "id": secret_id,
+            "organizationId": "org_id",
+            "key": "encrypted_key",
+            "value": "encrypted_value",
+            "creationDate": "2023-01-01T00:00:00Z",
+            "revisionDate": "2023-02-01T00:00:00Z",
+        }
+        for secret_id in ("a", "b", "c")
+    ]
+    held = datetime(2023, 1, 1, tzinfo=timezone.utc)
+    with patch.object(client.session, "get") as mock_get:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers.get = lambda k, d=None: d
+        mock_response.json.return_value = {
+            "hasChanges": True,
+            "secrets": {"data": items},
+        }
+        mock_get.return_value = mock_response
+
+        with patch.object(
+            client, "_decrypt_secret", side_effect=lambda s: s
+        ) as mock_decrypt:
+            result = client.sync(
+                datetime(2023, 1, 1),
+                revisions={"b": held, "gone": held},
+                secret_ids=["b", "gone"],
+            )
+
+        with pytest.raises(ValueError, match="Each secret ID must be a string"):
+            client.sync(datetime(2023, 1, 1), secret_ids=[1])
+
+    assert [secret.id for secret in result.secrets] == ["b"]
+    assert mock_decrypt.call_count == 1
+    assert result.removed == ["gone"]
+
+
 def test_sync_invalid_date(region):
     with patch("bws_sdk.client.Auth.from_token"):
         client = BWSecretClient(region, "access_token")
@@ -291,9 +445,9 @@ def test_decrypt_secret_success(mock_encrypted_value, mock_auth, region, mock_se
     mock_auth.return_value.org_enc_key = MagicMock()
     client = BWSecretClient(region, "access_token")
 
-    mock_decrypt = MagicMock()
-    mock_decrypt.decode.return_value = "decrypted_value"
-    mock_encrypted_value.from_str.return_value.decrypt.return_value = mock_decrypt
+    mock_encrypted_value.buffer_size.return_value = 32
+    decrypt_into = mock_encrypted_value.from_str.return_value.decrypt_into
+    decrypt_into.side_effect = lambda *_: memoryview(b"decrypted_value")
 
     result = client._decrypt_secret(mock_secret)
     assert result.key == "decrypted_value"
@@ -308,9 +462,9 @@ def test_decrypt_secret_unicode_error(
     mock_auth.return_value.org_enc_key = MagicMock()
     client = BWSecretClient(region, "access_token")
 
-    mock_encrypted_value.from_str.return_value.decrypt.return_value.decode.side_effect = UnicodeDecodeError(
-        "utf-8", b"", 0, 1, "error"
-    )
+    mock_encrypted_value.buffer_size.return_value = 32
+    decrypt_into = mock_encrypted_value.from_str.return_value.decrypt_into
+    decrypt_into.return_value = memoryview(b"\xff")
 
     with pytest.raises(SecretParseError, match="Failed to decode secret value or key"):
         client._decrypt_secret(mock_secret)
@@ -361,6 +515,8 @@ def test_create_success(mock_auth, region, mock_secret):
                         "note": "encrypted",
                         "projectIds": ["weh"],
                     },
+                    headers=AUTH_HEADERS,
+                    timeout=30.0,
                 )
 
 
@@ -550,11 +706,12 @@ def test_create_encrypt_secret_called_correctly(mock_auth, region):
 
 
 @patch("bws_sdk.client.Auth.from_token")
-def test_create_reload_auth_called(mock_auth, region):
-    """Test that _reload_auth is called before making the request"""
+def test_create_sends_current_bearer_token(mock_auth, region):
+    """Test that the current bearer token is sent with the request"""
     mock_auth.return_value.bearer_token = "test_token"
     mock_auth.return_value.org_id = "org_id"
     client = BWSecretClient(region, "access_token")
+    mock_auth.return_value.bearer_token = "refreshed_token"
 
     with patch.object(client.session, "post") as mock_post:
         mock_response = Mock()
@@ -567,7 +724,510 @@ def test_create_reload_auth_called(mock_auth, region):
 
             with patch.object(client, "_parse_secret") as mock_parse:
                 mock_parse.return_value = Mock()
+                client.create("test_key", "test_value", "test_note", ["project1"])
+
+    assert mock_post.call_args.kwargs["headers"] == {
+        "Authorization": "Bearer refreshed_token"
+    }
+
+
+def test_clients_sharing_a_transport_send_their_own_token():
+    region = Region(api_url="https://api.example.com", identity_url="https://id")
+    transport = MagicMock()
+    transport.headers = {}
+    transport.get.return_value.status_code = 404
+    clients = []
+    for token in ("token_a", "token_b"):
+        with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+            mock_auth.return_value.bearer_token = token
+            clients.append(BWSecretClient(region, token, transport=transport))
+
+    for client in (*clients, clients[0]):
+        client.get_by_id("secret_id")
+
+    assert [c.kwargs["headers"] for c in transport.get.call_args_list] == [
+        {"Authorization": "Bearer token_a"},
+        {"Authorization": "Bearer token_b"},
+        {"Authorization": "Bearer token_a"},
+    ]
+    assert "Authorization" not in transport.headers
+
 
-                with patch.object(client, "_reload_auth") as mock_reload:
-                    client.create("test_key", "test_value", "test_note", ["project1"])
-                    mock_reload.assert_called_once()
+@patch("bws_sdk.client.Auth.from_token")
+def test_get_by_id_coalesces_concurrent_requests(mock_auth, region, mock_secret):
+    import threading
+    import time
+
+    mock_auth.return_value.bearer_token = "test_token"
+    client = BWSecretClient(region, "access_token")
+
+    started = threading.Event()
+
+    def slow_get(url, **kwargs):
+        started.set()
+        time.sleep(0.2)
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers.get = lambda k, d=None: d
+        mock_response.json.return_value = {}
+        return mock_response
+
+    results = []
+    with (
+        patch.object(client.session, "get", side_effect=slow_get) as mock_get,
+        patch.object(client, "_parse_secret", return_value=mock_secret),
+    ):
+        leader = threading.Thread(
+            target=lambda: results.append(client.get_by_id("secret_id"))
+        )
+        leader.start()
+        started.wait()
+        followers = [
+            threading.Thread(
+                target=lambda: results.append(client.get_by_id("secret_id"))
+            )
+            for _ in range(5)
+        ]
+        for thread in followers:
+            thread.start()
+        for thread in [leader, *followers]:
+            thread.join()
+
+        assert mock_get.call_count == 1
+        assert len(results) == 6
+        assert all(result is results[0] for result in results)
+
+        client.get_by_id("secret_id")
+        assert mock_get.call_count == 2
+
+
+@patch("bws_sdk.client.Auth.from_token")
+def test_get_by_id_coalesced_error_is_shared(mock_auth, region):
+    mock_auth.return_value.bearer_token = "test_token"
+    client = BWSecretClient(region, "access_token")
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_response = Mock()
+        mock_response.status_code = 500
+        mock_response.text = "Internal Server Error"
+        mock_get.return_value = mock_response
+
+        with pytest.raises(ApiError):
+            client.get_by_id("secret_id")
+        assert client._inflight == {}
+
+
+def raw_secret(secret_id, project_ids):
+    return {
+        "id": secret_id,
+        "organizationId": "org_id",
+        "key": "encrypted_key",
+        "value": "encrypted_value",
+        "creationDate": "2023-01-01T00:00:00Z",
+        "revisionDate": "2023-01-01T00:00:00Z",
+        "projects": [{"id": pid, "name": "encrypted_name"} for pid in project_ids],
+    }
+
+
+@patch("bws_sdk.client.Auth.from_token")
+def test_sync_project_filter_skips_other_projects(mock_auth, region, mock_secret):
+    mock_auth.return_value.bearer_token = "test_token"
+    mock_auth.return_value.org_id = "org_id"
+    client = BWSecretClient(region, "access_token")
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.headers.get = lambda k, d=None: d
+        mock_response.json.return_value = {
+            "hasChanges": True,
+            "secrets": {
+                "data": [
+                    raw_secret("a", ["p1"]),
+                    raw_secret("b", ["p2"]),
+                    raw_secret("c", []),
+                    raw_secret("d", ["p2", "p1"]),
+                ]
+            },
+        }
+        mock_get.return_value = mock_response
+
+        with patch.object(client, "_parse_secret") as mock_parse:
+            mock_parse.return_value = mock_secret
+            result = client.sync(datetime(2023, 1, 1), project_ids=["p1"])
+
+            assert len(result.secrets) == 2
+            assert [c.args[0]["id"] for c in mock_parse.call_args_list] == ["a", "d"]
+
+
+@patch("bws_sdk.client.Auth.from_token")
+def test_list_by_project(mock_auth, region, mock_secret):
+    mock_auth.return_value.bearer_token = "test_token"
+    client = BWSecretClient(region, "access_token")
+
+    with (
+        patch.object(client.session, "get") as mock_get,
+        patch.object(client.session, "post") as mock_post,
+        patch.object(client, "_parse_secret") as mock_parse,
+    ):
+        list_response = Mock()
+        list_response.status_code = 200
+        list_response.json.return_value = {
+            "secrets": [{"id": "a"}, {"id": "b"}],
+            "projects": [],
+        }
+        mock_get.return_value = list_response
+        bulk_response = Mock()
+        bulk_response.status_code = 200
+        bulk_response.json.return_value = {
+            "data": [raw_secret("a", ["p1"]), raw_secret("b", ["p1"])]
+        }
+        mock_post.return_value = bulk_response
+        mock_parse.return_value = mock_secret
+
+        result = client.list_by_project("p1")
+
+        assert result == [mock_secret, mock_secret]
+        mock_get.assert_called_once_with(
+            f"{region.api_url}/projects/p1/secrets", headers=AUTH_HEADERS, timeout=30.0
+        )
+        mock_post.assert_called_once_with(
+            f"{region.api_url}/secrets/get-by-ids",
+            json={"ids": ["a", "b"]},
+            headers=AUTH_HEADERS,
+            timeout=30.0,
+        )
+
+
+@patch("bws_sdk.client.Auth.from_token")
+def test_list_by_project_empty(mock_auth, region):
+    mock_auth.return_value.bearer_token = "test_token"
+    client = BWSecretClient(region, "access_token")
+
+    with (
+        patch.object(client.session, "get") as mock_get,
+        patch.object(client.session, "post") as mock_post,
+    ):
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.json.return_value = {"secrets": [], "projects": []}
+        mock_get.return_value = mock_response
+
+        assert client.list_by_project("p1") == []
+        mock_post.assert_not_called()
+
+
+def test_list_by_project_invalid_id(region):
+    with patch("bws_sdk.client.Auth.from_token"):
+        client = BWSecretClient(region, "access_token")
+        with pytest.raises(ValueError, match="Project ID must be a string"):
+            client.list_by_project(123)
+
+
+@pytest.fixture
+def real_key_client(region):
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.bearer_token = "test_token"
+        mock_auth.return_value.org_id = "org_id"
+        mock_auth.return_value.org_enc_key = SymmetricCryptoKey(b"0" * 64)
+        yield BWSecretClient(region, "access_token")
+
+
+def test_encrypt_secrets_batch(real_key_client):
+    from bws_sdk.bws_types import BitwardenSecretCreate
+    from bws_sdk.crypto import EncryptedValue
+
+    secrets = [
+        BitwardenSecretCreate(
+            key=f"k{i}", value=f"v{i}", note=f"n{i}", projectIds=["p"]
+        )
+        for i in range(3)
+    ]
+    with patch.object(
+        EncryptedValue, "from_data_many", wraps=EncryptedValue.from_data_many
+    ) as batch:
+        encrypted = real_key_client._encrypt_secrets(secrets)
+        batch.assert_called_once()
+
+    key = real_key_client.auth.org_enc_key
+    for i, secret in enumerate(encrypted):
+        assert EncryptedValue.from_str(secret.key).decrypt(key) == f"k{i}".encode()
+        assert EncryptedValue.from_str(secret.value).decrypt(key) == f"v{i}".encode()
+        assert EncryptedValue.from_str(secret.note).decrypt(key) == f"n{i}".encode()
+        assert secret.projectIds == ["p"]
+
+
+def test_null_projects_are_parsed_as_empty(real_key_client):
+    from bws_sdk.crypto import EncryptedValue
+
+    key = real_key_client.auth.org_enc_key
+    data = {
+        **raw_secret("a", []),
+        "key": EncryptedValue.from_data(key, "k").to_str(),
+        "value": EncryptedValue.from_data(key, "v").to_str(),
+        "projects": None,
+    }
+    response = MagicMock(status_code=200, headers={})
+    response.json.return_value = {"hasChanges": True, "secrets": {"data": [data]}}
+
+    with patch.object(real_key_client.session, "get", return_value=response):
+        (synced,) = real_key_client.sync(datetime(2023, 1, 1)).secrets
+        response.json.return_value = data
+        fetched = real_key_client.get_by_id("a")
+
+    assert synced.projects == []
+    assert fetched.projects == []
+
+
+def test_create_many(real_key_client, mock_secret):
+    from bws_sdk.bws_types import BitwardenSecretCreate
+
+    secrets = [
+        BitwardenSecretCreate(key=f"k{i}", value="v", note="", projectIds=["p"])
+        for i in range(3)
+    ]
+    with (
+        patch.object(real_key_client.session, "post") as mock_post,
+        patch.object(real_key_client, "_parse_secret", return_value=mock_secret),
+    ):
+        mock_post.return_value.status_code = 200
+        result = real_key_client.create_many(secrets)
+
+        assert result == [mock_secret] * 3
+        assert mock_post.call_count == 3
+        for call in mock_post.call_args_list:
+            assert call.args[0] == "https://api.test.com/organizations/org_id/secrets"
+
+
+def test_create_many_validates_before_sending(real_key_client):
+    from bws_sdk.bws_types import BitwardenSecretCreate
+
+    secrets = [
+        BitwardenSecretCreate(key="k", value="v", note="", projectIds=["p"]),
+        BitwardenSecretCreate(key="k", value="v", note="", projectIds=[]),
+    ]
+    with patch.object(real_key_client.session, "post") as mock_post:
+        with pytest.raises(ValueError, match="Project IDs list cannot be empty"):
+            real_key_client.create_many(secrets)
+        mock_post.assert_not_called()
+
+
+def test_create_many_reports_created_secrets_on_failure(real_key_client, mock_secret):
+    from bws_sdk.bws_types import BitwardenSecretCreate
+    from bws_sdk.errors import BatchError
+
+    secrets = [
+        BitwardenSecretCreate(key=f"k{i}", value="v", note="", projectIds=["p"])
+        for i in range(3)
+    ]
+    ok = MagicMock(status_code=200)
+    failed = MagicMock(status_code=500, text="boom")
+    with (
+        patch.object(real_key_client.session, "post", side_effect=[ok, failed, ok]),
+        patch.object(real_key_client, "_parse_secret", return_value=mock_secret),
+    ):
+        with pytest.raises(BatchError, match="create secret 2 of 3") as exc:
+            real_key_client.create_many(secrets)
+
+    assert exc.value.completed == [mock_secret]
+    assert isinstance(exc.value.error, ApiError)
+    assert exc.value.__cause__ is exc.value.error
+    assert exc.value.written is False
+
+
+def test_create_many_reports_written_secret_with_unparsable_response(
+    real_key_client, mock_secret
+):
+    from bws_sdk.bws_types import BitwardenSecretCreate
+    from bws_sdk.errors import BatchError
+
+    secrets = [
+        BitwardenSecretCreate(key=f"k{i}", value="v", note="", projectIds=["p"])
+        for i in range(3)
+    ]
+    with (
+        patch.object(real_key_client.session, "post") as mock_post,
+        patch.object(
+            real_key_client,
+            "_parse_secret",
+            side_effect=[mock_secret, SecretParseError("bad response")],
+        ),
+    ):
+        mock_post.return_value.status_code = 200
+        with pytest.raises(BatchError, match="Secret 2 of 3 was created") as exc:
+            real_key_client.create_many(secrets)
+
+    assert mock_post.call_count == 2
+    assert exc.value.completed == [mock_secret]
+    assert isinstance(exc.value.error, SecretParseError)
+    assert exc.value.written is True
+
+
+def test_update(real_key_client, mock_secret):
+    with (
+        patch.object(real_key_client.session, "put") as mock_put,
+        patch.object(real_key_client, "_parse_secret", return_value=mock_secret),
+    ):
+        mock_put.return_value.status_code = 200
+        result = real_key_client.update("secret_id", "k", "v", "n", ["p"])
+
+        assert result == mock_secret
+        assert mock_put.call_args.args[0] == "https://api.test.com/secrets/secret_id"
+        assert mock_put.call_args.kwargs["json"]["projectIds"] == ["p"]
+
+
+def test_update_many(real_key_client, mock_secret):
+    from bws_sdk.bws_types import BitwardenSecretCreate
+
+    with (
+        patch.object(real_key_client.session, "put") as mock_put,
+        patch.object(real_key_client, "_parse_secret", return_value=mock_secret),
+    ):
+        mock_put.return_value.status_code = 200
+        result = real_key_client.update_many(
+            {
+                "a": BitwardenSecretCreate(
+                    key="k", value="v", note="", projectIds=["p"]
+                ),
+                "b": BitwardenSecretCreate(
+                    key="k", value="v", note="", projectIds=["p"]
+                ),
+            }
+        )
+
+        assert len(result) == 2
+        assert [c.args[0] for c in mock_put.call_args_list] == [
+            "https://api.test.com/secrets/a",
+            "https://api.test.com/secrets/b",
+        ]
+
+
+def test_update_many_reports_updated_secrets_on_failure(real_key_client, mock_secret):
+    from bws_sdk.bws_types import BitwardenSecretCreate
+    from bws_sdk.errors import BatchError
+
+    secret = BitwardenSecretCreate(key="k", value="v", note="", projectIds=["p"])
+    ok = MagicMock(status_code=200)
+    with (
+        patch.object(
+            real_key_client.session,
+            "put",
+            side_effect=[ok, ok, requests.ConnectionError("reset")],
+        ) as mock_put,
+        patch.object(real_key_client, "_parse_secret", return_value=mock_secret),
+    ):
+        with pytest.raises(BatchError, match="update secret 3 of 3") as exc:
+            real_key_client.update_many({"a": secret, "b": secret, "c": secret})
+
+    assert exc.value.completed == [mock_secret, mock_secret]
+    assert isinstance(exc.value.error, SendRequestError)
+    assert mock_put.call_count == 3
+
+
+def test_delete_many(real_key_client):
+    with patch.object(real_key_client.session, "post") as mock_post:
+        mock_post.return_value.status_code = 200
+        mock_post.return_value.json.return_value = {
+            "data": [{"id": "a", "error": ""}, {"id": "b", "error": "access denied"}]
+        }
+
+        result = real_key_client.delete_many(["a", "b"])
+
+        assert result == {"a": None, "b": "access denied"}
+        mock_post.assert_called_once_with(
+            "https://api.test.com/secrets/delete",
+            json=["a", "b"],
+            headers=AUTH_HEADERS,
+            timeout=30.0,
+        )
+
+
+def test_delete_many_invalid_ids(real_key_client):
+    with pytest.raises(ValueError, match="Secret IDs must be a list"):
+        real_key_client.delete_many("a")
+    assert real_key_client.delete_many([]) == {}
+
+
+def test_accept_encoding_depends_on_brotli():
+    _accept_encoding.cache_clear()
+    try:
+        with patch("importlib.util.find_spec", return_value=None):
+            assert _accept_encoding() == "gzip"
+        _accept_encoding.cache_clear()
+        with patch("importlib.util.find_spec", return_value=object()):
+            assert _accept_encoding() == "br, gzip"
+    finally:
+        _accept_encoding.cache_clear()
+
+
+@patch("bws_sdk.client.Auth.from_token")
+def test_client_requests_compressed_responses(mock_auth, region):
+    client = BWSecretClient(region, "access_token")
+    assert "gzip" in client.session.headers["Accept-Encoding"]
+
+
+def test_response_bytes_measures_compression():
+    body = b'{"data": "' + b"A" * 4000 + b'"}'
+    compressed = gzip.compress(body)
+    raw = urllib3.HTTPResponse(
+        body=io.BytesIO(compressed),
+        headers={"Content-Encoding": "gzip"},
+        status=200,
+        preload_content=False,
+    )
+    response = HTTPAdapter().build_response(
+        requests.Request("GET", "https://api.test.com").prepare(), raw
+    )
+
+    assert response.json() == {"data": "A" * 4000}
+    assert BWSecretClient._response_bytes(response) == (len(body), len(compressed))
+    assert BWSecretClient._response_bytes(None) == (None, None)
+
+
+@patch("bws_sdk.client.Auth.from_token")
+def test_json_loads(mock_auth, region):
+    response = Mock()
+    response.content = b'{"a": 1}'
+
+    loads = Mock(return_value={"a": 2})
+    client = BWSecretClient(region, "access_token", json_loads=loads)
+    assert client._read_json(response) == ({"a": 2}, 0.0)
+    loads.assert_called_once_with(b'{"a": 1}')
+    response.json.assert_not_called()
+
+    client = BWSecretClient(region, "access_token", json_loads="json")
+    assert client._read_json(response) == ({"a": 1}, 0.0)
+
+    # Uninstalled decoders fall back to response.json()
+    response.json.return_value = {"a": 3}
+    client = BWSecretClient(region, "access_token", json_loads="no_such_json_module")
+    assert client._json_loads is None
+    assert client._read_json(response) == ({"a": 3}, 0.0)
+    # So do modules without a loads function
+    assert BWSecretClient(region, "access_token", json_loads="os")._json_loads is None
+
+    with pytest.raises(ValueError, match="JSON loads must be callable"):
+        BWSecretClient(region, "access_token", json_loads=1)
+
+
+@patch("bws_sdk.client.Auth.from_token")
+def test_json_loads_decodes_bulk_responses(mock_auth, region, mock_secret):
+    import json
+
+    loads = Mock(side_effect=json.loads)
+    client = BWSecretClient(region, "access_token", json_loads=loads)
+    listing = Mock(status_code=200, content=b'{"secrets": [{"id": "a"}]}')
+    secrets = Mock(status_code=200, content=b'{"data": [{"id": "a"}]}')
+    deleted = Mock(status_code=200, content=b'{"data": [{"id": "a"}]}')
+
+    with (
+        patch.object(client.session, "get", return_value=listing),
+        patch.object(client.session, "post", side_effect=[secrets, deleted]),
+        patch.object(client, "_parse_secret", return_value=mock_secret),
+    ):
+        assert client.list_by_project("p1") == [mock_secret]
+        assert client.delete_many(["a"]) == {"a": None}
+
+    assert loads.call_count == 3
+    for response in (listing, secrets, deleted):
+        response.json.assert_not_called()
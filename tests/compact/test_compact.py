@@ -0,0 +1,110 @@
+import sys
+from datetime import datetime, timezone
+from unittest.mock import patch
+
+import pytest
+
+from bws_sdk.bws_types import BitwardenProject, BitwardenSecret
+from bws_sdk.compact import CompactSecretTable
+
+
+def make_secret(secret_id, value="value", revision=1, projects=(), org="org_id"):
+    return BitwardenSecret(
+        id=secret_id,
+        organizationId=org,
+        key=f"key_{secret_id}",
+        value=value,
+        creationDate=datetime(2023, 1, 1, 12, 30, 15, 123456, tzinfo=timezone.utc),
+        revisionDate=datetime(2023, 1, revision, tzinfo=timezone.utc),
+        projects=[BitwardenProject(id=pid) for pid in projects],
+    )
+
+
+def test_secrets_round_trip():
+    secrets = [
+        make_secret("a", projects=["p1", "p2"]),
+        make_secret("b", value="ünïcödé ✓", revision=2, org="other"),
+        make_secret("c", value=""),
+    ]
+
+    table = CompactSecretTable(secrets)
+
+    assert len(table) == 3
+    assert list(table) == ["a", "b", "c"]
+    assert "a" in table and "d" not in table
+    assert table.get("d") is None
+    for secret in secrets:
+        assert table[secret.id] == secret
+    assert table["a"] is not table["a"]
+
+
+def test_later_secret_replaces_earlier_one():
+    table = CompactSecretTable([make_secret("a"), make_secret("a", value="new")])
+
+    assert len(table) == 1
+    assert table["a"].value == "new"
+
+
+def test_ids_and_names_are_shared():
+    table = CompactSecretTable(
+        [make_secret(str(i), projects=["project"]) for i in range(100)]
+    )
+
+    assert table._names == ["org_id", "project"]
+    assert table["5"].id is sys.intern("5")
+    assert table["5"].organizationId is table["6"].organizationId
+
+
+def test_naive_dates_are_stored_as_utc():
+    secret = make_secret("a").model_copy(update={"revisionDate": datetime(2024, 5, 1)})
+
+    table = CompactSecretTable([secret])
+
+    assert table.revision("a") == datetime(2024, 5, 1, tzinfo=timezone.utc)
+    assert table.revision("missing") is None
+
+
+def test_revisions_and_project_index_do_not_materialize():
+    table = CompactSecretTable(
+        [
+            make_secret("a", projects=["p1"]),
+            make_secret("b", revision=2, projects=["p1", "p2"]),
+        ]
+    )
+
+    with patch.object(CompactSecretTable, "_materialize") as mock_materialize:
+        revisions = table.revisions()
+        index = table.project_index()
+
+    mock_materialize.assert_not_called()
+    assert revisions == {
+        "a": datetime(2023, 1, 1, tzinfo=timezone.utc),
+        "b": datetime(2023, 1, 2, tzinfo=timezone.utc),
+    }
+    assert index == {"p1": {"a", "b"}, "p2": {"b"}}
+
+
+def test_replace_copies_kept_secrets():
+    table = CompactSecretTable(
+        [make_secret("a", projects=["p1"]), make_secret("b"), make_secret("c")]
+    )
+
+    with patch.object(CompactSecretTable, "_materialize") as mock_materialize:
+        replaced = table.replace(
+            [make_secret("b", value="rotated", revision=3), make_secret("d")],
+            keep=["a", "b", "unknown"],
+        )
+    mock_materialize.assert_not_called()
+
+    assert list(replaced) == ["a", "b", "d"]
+    assert replaced["a"] == table["a"]
+    assert replaced["b"].value == "rotated"
+    assert replaced.project_index() == {"p1": {"a"}}
+    assert list(table) == ["a", "b", "c"]
+
+
+@pytest.mark.parametrize("count", [0, 1, 1000])
+def test_values_materialize_every_secret(count):
+    secrets = [make_secret(str(i), value=str(i) * 3) for i in range(count)]
+
+    assert list(CompactSecretTable(secrets).values()) == secrets
@@ -5,7 +5,9 @@ These tests validate that newly created encrypted values can be properly
 decrypted, ensuring the integrity of the encryption/decryption process.
 """
 
+import io
 import os
+from unittest.mock import MagicMock, patch
 
 import pytest
 
@@ -14,7 +16,7 @@ from bws_sdk.crypto import (
     EncryptedValue,
     SymmetricCryptoKey,
 )
-from bws_sdk.errors import HmacError
+from bws_sdk.errors import HmacError, InvalidEncryptedFormat
 
 
 class TestRoundTripEncryption:
@@ -228,3 +230,164 @@ class TestRoundTripEncryption:
         decrypted_data = encrypted_value.decrypt(aes256_key)
 
         assert decrypted_data == original_data.encode("utf-8")
+
+
+class TestBatchEncryption:
+    """Test suite for encrypting several values in one pass."""
+
+    @pytest.mark.parametrize("key_bytes", [b"0" * 32, b"1" * 64])
+    def test_from_data_many_round_trip(self, key_bytes):
+        key = SymmetricCryptoKey(key_bytes)
+        data = ["", "a", "x" * 16, "unicode ✓", "y" * 1000]
+
+        values = EncryptedValue.from_data_many(key, data)
+
+        assert len(values) == len(data)
+        for value, original in zip(values, data):
+            restored = EncryptedValue.from_str(value.to_str())
+            assert restored.decrypt(key) == original.encode("utf-8")
+            assert value.algo == EncryptedValue.from_data(key, original).algo
+            assert type(value.data) is bytes
+
+    def test_from_data_many_uses_unique_ivs(self):
+        key = SymmetricCryptoKey(os.urandom(64))
+        values = EncryptedValue.from_data_many(key, ["same"] * 10)
+        assert len({value.iv for value in values}) == 10
+
+    def test_from_data_many_empty(self):
+        assert EncryptedValue.from_data_many(SymmetricCryptoKey(b"0" * 64), []) == []
+
+
+class TestStreamEncryption:
+    """Streaming encryption must produce the same cipher strings as from_data."""
+
+    @pytest.fixture
+    def aes256_key(self):
+        return SymmetricCryptoKey(b"1" * 64)
+
+    @pytest.mark.parametrize("chunk_size", [1, 7, 16, 1000, 64 * 1024])
+    @pytest.mark.parametrize("size", [0, 1, 15, 16, 17, 300_000])
+    def test_encrypt_stream_matches_to_str(self, aes256_key, chunk_size, size):
+        if chunk_size == 1 and size > 1000:
+            pytest.skip("too slow")
+        data = ("certificate ✓ " * (size // 10 + 1))[:size]
+        iv = os.urandom(16)
+
+        dest = io.BytesIO()
+        with patch("bws_sdk.crypto.os.urandom", return_value=iv):
+            EncryptedValue.encrypt_stream(
+                aes256_key, io.BytesIO(data.encode("utf-8")), dest, chunk_size
+            )
+            expected = EncryptedValue.from_data(aes256_key, data).to_str()
+
+        assert dest.getvalue().decode("ascii") == expected
+
+    @pytest.mark.parametrize("chunk_size", [1, 5, 4096])
+    @pytest.mark.parametrize("key_bytes", [b"0" * 32, b"1" * 64])
+    def test_decrypt_stream_round_trip(self, key_bytes, chunk_size):
+        key = SymmetricCryptoKey(key_bytes)
+        data = os.urandom(5000)
+        encrypted = io.BytesIO()
+        EncryptedValue.encrypt_stream(key, io.BytesIO(data), encrypted)
+
+        dest = io.BytesIO()
+        encrypted.seek(0)
+        EncryptedValue.decrypt_stream(key, encrypted, dest, chunk_size)
+
+        assert dest.getvalue() == data
+        restored = EncryptedValue.from_str(encrypted.getvalue().decode("ascii"))
+        assert restored.decrypt(key) == data
+
+    def test_decrypt_stream_without_algorithm_prefix(self, aes256_key):
+        value = EncryptedValue.from_data(aes256_key, "legacy")
+        encrypted = value.to_str().split(".", 1)[1]
+
+        dest = io.BytesIO()
+        EncryptedValue.decrypt_stream(
+            aes256_key, io.BytesIO(encrypted.encode("ascii")), dest
+        )
+
+        assert dest.getvalue() == b"legacy"
+
+    def test_decrypt_stream_wrong_key_writes_nothing(self, aes256_key):
+        encrypted = EncryptedValue.from_data(aes256_key, "x" * 100).to_str()
+
+        dest = io.BytesIO()
+        with pytest.raises(HmacError):
+            EncryptedValue.decrypt_stream(
+                SymmetricCryptoKey(b"2" * 64),
+                io.BytesIO(encrypted.encode("ascii")),
+                dest,
+            )
+        assert dest.getvalue() == b""
+
+    @pytest.mark.parametrize(
+        "encrypted",
+        [
+            b"",
+            b"2.abc",
+            b"2.AAAAAAAAAAAAAAAAAAAAAA==|",
+            b"2.AAAAAAAAAAAAAAAAAAAAAA==|!!|x",
+        ],
+    )
+    def test_decrypt_stream_invalid_format(self, aes256_key, encrypted):
+        with pytest.raises(InvalidEncryptedFormat):
+            EncryptedValue.decrypt_stream(
+                aes256_key, io.BytesIO(encrypted), io.BytesIO()
+            )
+
+    def test_decrypt_stream_requires_seekable_source(self, aes256_key):
+        source = MagicMock()
+        source.seekable.return_value = False
+        with pytest.raises(ValueError):
+            EncryptedValue.decrypt_stream(aes256_key, source, io.BytesIO())
+
+
+class TestBufferEncryption:
+    """encrypt_into and decrypt_into must match the copying implementations."""
+
+    @pytest.fixture
+    def key(self):
+        return SymmetricCryptoKey(b"1" * 64)
+
+    @pytest.mark.parametrize("size", [0, 1, 15, 16, 17, 4096])
+    def test_encrypt_into_matches_encrypt_aes(self, key, size):
+        data = os.urandom(size)
+        iv = os.urandom(16)
+        buffer = bytearray(EncryptedValue.buffer_size(size))
+
+        written = EncryptedValue.encrypt_into(key.key, data, iv, buffer)
+
+        expected = EncryptedValue.encrypt_aes(key.key, EncryptedValue._pad(data), iv)
+        assert bytes(buffer[:written]) == expected
+
+    def test_encrypt_into_buffer_too_small(self, key):
+        with pytest.raises(ValueError, match="Buffer must be at least 31 bytes"):
+            EncryptedValue.encrypt_into(key.key, b"x", os.urandom(16), bytearray(30))
+
+    def test_decrypt_into_reuses_buffer(self, key):
+        buffer = bytearray(4096)
+        for text in ["first value", "2nd", "x" * 1000]:
+            value = EncryptedValue.from_data(key, text)
+            with value.decrypt_into(key, buffer) as plaintext:
+                assert plaintext.obj is buffer
+                assert str(plaintext, "utf-8") == text
+
+    def test_decrypt_into_buffer_too_small(self, key):
+        value = EncryptedValue.from_data(key, "x" * 100)
+        with pytest.raises(ValueError, match="Buffer must be at least"):
+            value.decrypt_into(key, bytearray(16))
+
+    def test_decrypt_into_invalid_padding(self, key):
+        iv = os.urandom(16)
+        data = EncryptedValue.encrypt_aes(key.key, b"x" * 15 + b"\x00", iv)
+        mac = EncryptedValue.generate_mac(key.mac_key, iv, data)
+        value = EncryptedValue(AlgoEnum.AES256, iv, data, mac)
+
+        with pytest.raises(ValueError, match="Invalid padding"):
+            value.decrypt_into(key)
+
+    def test_decrypt_into_wrong_key(self, key):
+        value = EncryptedValue.from_data(key, "secret")
+        with pytest.raises(HmacError):
+            value.decrypt_into(SymmetricCryptoKey(b"2" * 64), bytearray(64))
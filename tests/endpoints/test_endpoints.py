@@ -0,0 +1,231 @@
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+import requests
+
+from bws_sdk.bws_types import Region, RegionMirror
+from bws_sdk.client import BWSecretClient
+from bws_sdk.crypto import EncryptedValue, SymmetricCryptoKey
+from bws_sdk.endpoints import EndpointSelector
+from bws_sdk.errors import ApiError, SendRequestError
+from bws_sdk.hooks import SDKHooks
+from bws_sdk.token import Auth, ClientToken
+
+ORG_KEY = SymmetricCryptoKey(b"0" * 64)
+PRIMARY = "https://api.primary.com"
+REPLICA = "https://api.replica.com"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def encrypted_secret(secret_id):
+    return {
+        "id": secret_id,
+        "organizationId": "org_id",
+        "key": EncryptedValue.from_data(ORG_KEY, f"key_{secret_id}").to_str(),
+        "value": EncryptedValue.from_data(ORG_KEY, "value").to_str(),
+        "creationDate": "2023-01-01T00:00:00Z",
+        "revisionDate": "2023-01-01T00:00:00Z",
+    }
+
+
+def response(body, status_code=200):
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = body
+    mock_response.headers = {}
+    return mock_response
+
+
+@pytest.fixture
+def region():
+    return Region(
+        api_url=PRIMARY,
+        identity_url="https://id.primary.com",
+        mirrors=[RegionMirror(api_url=REPLICA, identity_url="https://id.replica.com")],
+    )
+
+
+@pytest.fixture
+def client(region):
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.bearer_token = "test_token"
+        mock_auth.return_value.org_id = "org_id"
+        mock_auth.return_value.org_enc_key = ORG_KEY
+        return BWSecretClient(region, "access_token")
+
+
+def test_region_urls(region):
+    assert region.api_urls == [PRIMARY, REPLICA]
+    assert region.identity_urls == ["https://id.primary.com", "https://id.replica.com"]
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"urls": []},
+        {"urls": ["a"], "cooldown": -1},
+        {"urls": ["a"], "smoothing": 0},
+        {"urls": ["a"], "max_age": 0},
+    ],
+)
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        EndpointSelector(**kwargs)
+
+
+def test_unmeasured_endpoints_keep_their_order():
+    selector = EndpointSelector(["a", "b", "c"])
+    assert selector.order() == ["a", "b", "c"]
+
+    selector.record_success("a", 0.1)
+    assert selector.order() == ["b", "c", "a"]
+
+
+def test_fastest_endpoint_is_preferred():
+    selector = EndpointSelector(["a", "b"], smoothing=0.5)
+    selector.record_success("a", 0.2)
+    selector.record_success("b", 0.1)
+    assert selector.order() == ["b", "a"]
+
+    selector.record_success("b", 0.5)
+    assert selector.latency("b") == pytest.approx(0.3)
+    assert selector.order() == ["a", "b"]
+
+
+def test_down_endpoint_is_tried_last_until_cooldown():
+    clock = FakeClock()
+    selector = EndpointSelector(["a", "b"], cooldown=10, clock=clock)
+    selector.record_success("a", 0.1)
+    selector.record_success("b", 0.2)
+    selector.record_failure("a")
+    assert selector.order() == ["b", "a"]
+
+    clock.now = 10
+    assert selector.order() == ["a", "b"]
+
+
+def test_expired_samples_are_measured_again():
+    clock = FakeClock()
+    selector = EndpointSelector(["a", "b"], max_age=60, clock=clock)
+    selector.record_success("a", 5.0)
+    selector.record_success("b", 0.2)
+    assert selector.order() == ["b", "a"]
+
+    # b keeps being used, while a's one slow sample expires and a is re-probed
+    clock.now = 30
+    selector.record_success("b", 0.2)
+    clock.now = 60
+    assert selector.latency("a") is None
+    assert selector.order() == ["a", "b"]
+
+    # The new sample replaces the expired one instead of being averaged with it
+    selector.record_success("a", 0.1)
+    assert selector.latency("a") == 0.1
+    assert selector.order() == ["a", "b"]
+
+
+def test_latency_is_measured_to_the_response_headers(client):
+    import datetime
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(encrypted_secret("a"))
+        mock_get.return_value.elapsed = datetime.timedelta(seconds=0.05)
+        client.get_by_id("a")
+
+    assert client._endpoints.latency(PRIMARY) == pytest.approx(0.05)
+
+
+def test_single_endpoint_region_has_no_selector():
+    with patch("bws_sdk.client.Auth.from_token"):
+        client = BWSecretClient(
+            Region(api_url=PRIMARY, identity_url="https://id.primary.com"),
+            "access_token",
+        )
+    assert client._endpoints is None
+
+
+def test_fails_over_on_connection_error(client):
+    def get(url, **kwargs):
+        if url.startswith(PRIMARY):
+            raise requests.ConnectionError("down")
+        return response(encrypted_secret("a"))
+
+    with patch.object(client.session, "get", side_effect=get) as mock_get:
+        assert client.get_by_id("a").key == "key_a"
+        assert client.get_by_id("a").key == "key_a"
+
+    assert [call.args[0] for call in mock_get.call_args_list] == [
+        f"{PRIMARY}/secrets/a",
+        f"{REPLICA}/secrets/a",
+        f"{REPLICA}/secrets/a",
+    ]
+
+
+def test_failover_attempts_are_reported_as_retries(client):
+    retries = []
+    client.hooks = Mock(spec=SDKHooks)
+    client.hooks.on_request.side_effect = lambda m: retries.append(m.retries)
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = requests.ConnectionError("down")
+        with pytest.raises(SendRequestError):
+            client.get_by_id("a")
+
+    assert retries == [0, 1]
+
+
+def test_all_endpoints_down_raises(client):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = requests.ConnectionError("down")
+        with pytest.raises(SendRequestError):
+            client.get_by_id("a")
+    assert mock_get.call_count == 2
+
+
+def test_server_error_does_not_fail_over(client):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(None, status_code=500)
+        mock_get.return_value.text = "error"
+        with pytest.raises(ApiError):
+            client.get_by_id("a")
+    assert mock_get.call_count == 1
+
+
+def test_create_is_not_repeated(client):
+    with patch.object(client.session, "post") as mock_post:
+        mock_post.side_effect = requests.ConnectionError("reset")
+        with pytest.raises(SendRequestError):
+            client.create("key", "value", "note", ["project"])
+    assert mock_post.call_count == 1
+
+
+def test_identity_request_fails_over(region):
+    client_token = MagicMock(spec=ClientToken)
+    client_token.access_token_id = "id"
+    client_token.client_secret = "secret"
+    urls = []
+
+    def post(url, **kwargs):
+        urls.append(url)
+        if url.startswith("https://id.primary.com"):
+            raise requests.ConnectionError("down")
+        return response({"access_token": "t", "encrypted_payload": "p"})
+
+    with (
+        patch("requests.post", side_effect=post),
+        patch.object(Auth, "_save_identity") as mock_save,
+    ):
+        Auth(client_token, region)
+
+    assert urls == [
+        "https://id.primary.com/connect/token",
+        "https://id.replica.com/connect/token",
+    ]
+    mock_save.assert_called_once_with("p", "t")
@@ -0,0 +1,79 @@
+import json
+import os
+from concurrent.futures import Future
+from unittest.mock import patch
+
+import pytest
+
+from bws_sdk import client as client_module
+from bws_sdk.bws_types import Region
+from bws_sdk.client import BWSecretClient
+
+API_URL = "https://api.test.com"
+
+
+@pytest.fixture
+def mock_auth():
+    with patch("bws_sdk.client.Auth.from_token") as mock:
+        mock.return_value.bearer_token = "test_token"
+        yield mock
+
+
+@pytest.fixture
+def client(mock_auth):
+    region = Region(api_url=API_URL, identity_url="https://id.test.com")
+    return BWSecretClient(region, "access_token")
+
+
+def pool_count(client):
+    return len(client.session.get_adapter(API_URL).poolmanager.pools)
+
+
+def test_reset_drops_connections_and_keeps_auth(client, mock_auth):
+    client.session.get_adapter(API_URL).poolmanager.connection_from_url(API_URL)
+    client._inflight["a"] = Future()
+    auth = client.auth
+
+    client_module._reset_clients_after_fork()
+
+    assert pool_count(client) == 0
+    assert client._inflight == {}
+    assert client.auth is auth
+    assert client.auth.bearer_token == "test_token"
+    assert mock_auth.call_count == 1
+
+
+def test_clients_are_tracked_weakly(mock_auth):
+    region = Region(api_url=API_URL, identity_url="https://id.test.com")
+    client = BWSecretClient(region, "access_token")
+    assert client in client_module._CLIENTS
+
+    del client
+    assert len([c for c in client_module._CLIENTS if c.region is region]) == 0
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires os.fork")
+def test_forked_child_gets_fresh_connections(client, mock_auth):
+    client.session.get_adapter(API_URL).poolmanager.connection_from_url(API_URL)
+    read_fd, write_fd = os.pipe()
+
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.close(read_fd)
+            state = {
+                "pools": pool_count(client),
+                "auth_calls": mock_auth.call_count,
+                "token": client.auth.bearer_token,
+            }
+            os.write(write_fd, json.dumps(state).encode())
+        finally:
+            os._exit(0)
+
+    os.close(write_fd)
+    with os.fdopen(read_fd) as reader:
+        state = json.loads(reader.read())
+    os.waitpid(pid, 0)
+
+    assert state == {"pools": 0, "auth_calls": 1, "token": "test_token"}
+    assert pool_count(client) == 1
@@ -0,0 +1,246 @@
+import threading
+import time
+from unittest.mock import Mock, patch
+
+import pytest
+import requests
+
+from bws_sdk.bws_types import Region
+from bws_sdk.client import BWSecretClient
+from bws_sdk.crypto import EncryptedValue, SymmetricCryptoKey
+from bws_sdk.errors import SendRequestError
+from bws_sdk.hedging import HedgePolicy
+from bws_sdk.hooks import SDKHooks
+
+ORG_KEY = SymmetricCryptoKey(b"0" * 64)
+
+
+def encrypted_secret(secret_id):
+    return {
+        "id": secret_id,
+        "organizationId": "org_id",
+        "key": EncryptedValue.from_data(ORG_KEY, f"key_{secret_id}").to_str(),
+        "value": EncryptedValue.from_data(ORG_KEY, "value").to_str(),
+        "creationDate": "2023-01-01T00:00:00Z",
+        "revisionDate": "2023-01-01T00:00:00Z",
+    }
+
+
+def response(body):
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = body
+    mock_response.headers = {}
+    return mock_response
+
+
+def warmed_policy(latency=0.01, **kwargs):
+    policy = HedgePolicy(min_samples=5, window=100, **kwargs)
+    for _ in range(5):
+        policy.start_request()
+        policy.record(latency)
+    return policy
+
+
+class OperationHooks(SDKHooks):
+    def __init__(self):
+        self.operations = []
+        self.retries = {}
+
+    def on_request(self, metrics):
+        self.operations.append(metrics.operation)
+        self.retries[metrics.operation] = metrics.retries
+
+
+@pytest.fixture
+def region():
+    return Region(api_url="https://api.test.com", identity_url="https://id.test.com")
+
+
+def make_client(region, hedge, hooks=None):
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.bearer_token = "test_token"
+        mock_auth.return_value.org_id = "org_id"
+        mock_auth.return_value.org_enc_key = ORG_KEY
+        return BWSecretClient(region, "access_token", hooks=hooks, hedge=hedge)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [
+        {"percentile": 0},
+        {"percentile": 100},
+        {"min_delay": 1, "max_delay": 0.5},
+        {"max_ratio": 2},
+        {"window": 10, "min_samples": 11},
+        {"max_workers": 0},
+    ],
+)
+def test_invalid_parameters(kwargs):
+    with pytest.raises(ValueError):
+        HedgePolicy(**kwargs)
+
+
+def test_invalid_hedge(region):
+    with patch("bws_sdk.client.Auth.from_token"):
+        with pytest.raises(ValueError, match="Hedge must be an instance"):
+            BWSecretClient(region, "access_token", hedge=object())
+
+
+def test_delay_is_clamped_percentile():
+    policy = HedgePolicy(percentile=90, min_delay=0.002, max_delay=1, min_samples=10)
+    for latency in range(1, 10):
+        policy.record(latency / 1000)
+    assert policy.delay() is None
+
+    policy.record(0.010)
+    assert policy.delay() == pytest.approx(0.009)
+
+
+def test_delay_bounds():
+    policy = HedgePolicy(min_delay=0.05, max_delay=0.1, min_samples=1)
+    policy.record(0.001)
+    assert policy.delay() == 0.05
+    policy.record(5)
+    policy.record(5)
+    assert policy.delay() == 0.1
+
+
+def test_hedge_rate_is_capped():
+    policy = HedgePolicy(max_ratio=0.1, window=100)
+    for _ in range(9):
+        policy.start_request()
+    assert policy.try_hedge()
+    assert not policy.try_hedge()
+    for _ in range(10):
+        policy.start_request()
+    assert policy.try_hedge()
+
+
+def test_slow_request_is_hedged(region):
+    hooks = OperationHooks()
+    client = make_client(region, warmed_policy(max_ratio=1), hooks=hooks)
+    release = threading.Event()
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        if len(calls) == 1:
+            release.wait(5)
+        return response(encrypted_secret("a"))
+
+    with patch.object(client.session, "get", side_effect=get):
+        start = time.perf_counter()
+        secret = client.get_by_id("a")
+        elapsed = time.perf_counter() - start
+        release.set()
+        client._hedge_pool.shutdown(wait=True)
+
+    assert secret.key == "key_a"
+    assert elapsed < 1
+    assert len(calls) == 2
+    assert sorted(hooks.operations) == ["get_by_id", "get_by_id_hedge"]
+    assert hooks.retries == {"get_by_id": 0, "get_by_id_hedge": 1}
+
+
+def test_fast_request_is_not_hedged(region):
+    client = make_client(region, warmed_policy(latency=1, max_ratio=1))
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(encrypted_secret("a"))
+        client.get_by_id("a")
+
+    assert mock_get.call_count == 1
+
+
+def test_hedge_not_sent_over_cap(region):
+    client = make_client(region, warmed_policy(max_ratio=0))
+
+    def get(url, **kwargs):
+        time.sleep(0.05)
+        return response(encrypted_secret("a"))
+
+    with patch.object(client.session, "get", side_effect=get) as mock_get:
+        assert client.get_by_id("a").key == "key_a"
+
+    assert mock_get.call_count == 1
+
+
+def test_failed_request_falls_back_to_hedge(region):
+    client = make_client(region, warmed_policy(max_ratio=1))
+    calls = []
+
+    def get(url, **kwargs):
+        calls.append(url)
+        if len(calls) == 1:
+            time.sleep(0.1)
+            raise requests.ConnectionError("down")
+        time.sleep(0.2)
+        return response(encrypted_secret("a"))
+
+    with patch.object(client.session, "get", side_effect=get):
+        assert client.get_by_id("a").key == "key_a"
+
+
+def test_both_failing_raises(region):
+    client = make_client(region, warmed_policy(max_ratio=1))
+
+    def get(url, **kwargs):
+        time.sleep(0.05)
+        raise requests.ConnectionError("down")
+
+    with patch.object(client.session, "get", side_effect=get):
+        with pytest.raises(SendRequestError):
+            client.get_by_id("a")
+
+
+def test_policy_warms_up_from_direct_requests(region):
+    policy = HedgePolicy(min_samples=3)
+    client = make_client(region, policy)
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(encrypted_secret("a"))
+        for _ in range(3):
+            client.get_by_id("a")
+
+    assert policy.delay() is not None
+
+
+def test_busy_workers_do_not_queue_requests(region):
+    policy = warmed_policy(latency=1, max_ratio=1, max_workers=2)
+    client = make_client(region, policy)
+    threads = []
+    lock = threading.Lock()
+
+    def get(url, **kwargs):
+        with lock:
+            threads.append(threading.current_thread().name)
+        time.sleep(0.1)
+        return response(encrypted_secret(url.rsplit("/", 1)[1]))
+
+    callers = 6
+    barrier = threading.Barrier(callers)
+    results = {}
+
+    def call(secret_id):
+        barrier.wait()
+        results[secret_id] = client.get_by_id(secret_id).key
+
+    with patch.object(client.session, "get", side_effect=get):
+        workers = [
+            threading.Thread(target=call, args=(str(i),)) for i in range(callers)
+        ]
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join(5)
+
+    assert results == {str(i): f"key_{i}" for i in range(callers)}
+    on_workers = [name for name in threads if name.startswith("bws-sdk-hedge")]
+    assert len(threads) == callers
+    assert len(on_workers) <= 2
+    # Requests sent from the callers' threads did not wait behind the workers,
+    # and queueing did not inflate the latencies the hedge delay is taken from
+    new_latencies = list(policy._latencies)[5:]
+    assert len(new_latencies) == callers
+    assert max(new_latencies) < 0.19
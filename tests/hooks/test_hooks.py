@@ -0,0 +1,307 @@
+import logging
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from bws_sdk.bws_types import Region
+from bws_sdk.client import BWSecretClient
+from bws_sdk.crypto import EncryptedValue, SymmetricCryptoKey
+from bws_sdk.errors import SendRequestError
+from bws_sdk.hooks import (
+    AuthMetrics,
+    DecryptMetrics,
+    LoggingHooks,
+    PrometheusHooks,
+    RequestMetrics,
+    SDKHooks,
+)
+from bws_sdk.token import Auth, ClientToken
+
+ORG_KEY = SymmetricCryptoKey(b"0" * 64)
+
+
+class RecordingHooks(SDKHooks):
+    def __init__(self):
+        self.events = []
+
+    def on_request(self, metrics):
+        self.events.append(metrics)
+
+    def on_auth(self, metrics):
+        self.events.append(metrics)
+
+    def on_decrypt(self, metrics):
+        self.events.append(metrics)
+
+    def on_cache(self, cache, hit):
+        self.events.append((cache, hit))
+
+
+def encrypted_secret(secret_id):
+    return {
+        "id": secret_id,
+        "organizationId": "org_id",
+        "key": EncryptedValue.from_data(ORG_KEY, f"key_{secret_id}").to_str(),
+        "value": EncryptedValue.from_data(ORG_KEY, "value").to_str(),
+        "creationDate": "2023-01-01T00:00:00Z",
+        "revisionDate": "2023-01-01T00:00:00Z",
+    }
+
+
+def response(status_code, body, remaining="42"):
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = body
+    headers = {"x-rate-limit-remaining": remaining} if remaining else {}
+    mock_response.headers.get = lambda k, d=None: headers.get(k, d)
+    return mock_response
+
+
+@pytest.fixture
+def region():
+    return Region(api_url="https://api.test.com", identity_url="https://id.test.com")
+
+
+@pytest.fixture
+def hooks():
+    return RecordingHooks()
+
+
+@pytest.fixture
+def client(region, hooks):
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.bearer_token = "test_token"
+        mock_auth.return_value.org_id = "org_id"
+        mock_auth.return_value.org_enc_key = ORG_KEY
+        client = BWSecretClient(region, "access_token", hooks=hooks)
+        mock_auth.assert_called_once_with(
+            "access_token",
+            region,
+            None,
+            hooks=hooks,
+            tracer=None,
+            transport=None,
+            request_timeout=30.0,
+        )
+        return client
+
+
+def test_invalid_hooks(region):
+    with patch("bws_sdk.client.Auth.from_token"):
+        with pytest.raises(ValueError, match="Hooks must be an instance"):
+            BWSecretClient(region, "access_token", hooks=object())
+
+
+def test_get_by_id_reports_request_and_decrypt(client, hooks):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(200, encrypted_secret("a"))
+        secret = client.get_by_id("a")
+
+    assert secret.key == "key_a"
+    cache, request, key_lookup, value_lookup, decrypt = hooks.events
+    assert cache == ("inflight", False)
+    assert key_lookup == value_lookup == ("decrypt", False)
+    assert isinstance(request, RequestMetrics)
+    assert request.operation == "get_by_id"
+    assert request.method == "GET"
+    assert request.url == "https://api.test.com/secrets/a"
+    assert request.status_code == 200
+    assert request.ratelimit_remaining == 42
+    assert request.retries == 0
+    assert request.elapsed >= 0
+    assert isinstance(decrypt, DecryptMetrics)
+    assert decrypt.count == 1
+    assert decrypt.operation == "get_by_id"
+
+
+def test_sync_reports_batch(client, hooks):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(
+            200,
+            {
+                "hasChanges": True,
+                "secrets": {"data": [encrypted_secret("a"), encrypted_secret("b")]},
+            },
+            remaining=None,
+        )
+        from datetime import datetime
+
+        client.sync(datetime(2023, 1, 1))
+
+    request, *lookups, decrypt = hooks.events
+    assert lookups == [("decrypt", False)] * 4
+    assert request.operation == "sync"
+    assert request.ratelimit_remaining is None
+    assert decrypt.count == 2
+    assert decrypt.decrypt_seconds > 0
+
+
+def sync_response(*secrets):
+    return response(
+        200, {"hasChanges": True, "secrets": {"data": list(secrets)}}, remaining=None
+    )
+
+
+def test_sync_memoizes_decrypted_values(client, hooks):
+    from datetime import datetime
+
+    unchanged, changed = encrypted_secret("a"), encrypted_secret("b")
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = sync_response(unchanged, changed)
+        client.sync(datetime(2023, 1, 1))
+        hooks.events.clear()
+
+        changed = {
+            **changed,
+            "value": EncryptedValue.from_data(ORG_KEY, "new").to_str(),
+        }
+        mock_get.return_value = sync_response(unchanged, changed)
+        with patch.object(
+            EncryptedValue, "from_str", wraps=EncryptedValue.from_str
+        ) as mock_from_str:
+            secrets = client.sync(datetime(2023, 1, 1)).secrets
+
+    assert [secret.value for secret in secrets] == ["value", "new"]
+    mock_from_str.assert_called_once_with(changed["value"])
+    lookups = [event for event in hooks.events if isinstance(event, tuple)]
+    assert lookups == [("decrypt", True)] * 3 + [("decrypt", False)]
+
+
+def test_decrypt_cache_is_bounded(region, hooks):
+    from datetime import datetime
+
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.org_enc_key = ORG_KEY
+        client = BWSecretClient(region, "token", hooks=hooks, decrypt_cache_size=1)
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = sync_response(encrypted_secret("a"))
+        client.sync(datetime(2023, 1, 1))
+        client.sync(datetime(2023, 1, 1))
+
+    lookups = [event for event in hooks.events if isinstance(event, tuple)]
+    # The key and value evict each other from a cache holding a single entry
+    assert lookups == [("decrypt", False)] * 4
+    assert len(client._decrypted) == 1
+
+
+def test_decrypt_cache_can_be_disabled(region, hooks):
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.org_enc_key = ORG_KEY
+        client = BWSecretClient(region, "token", hooks=hooks, decrypt_cache_size=0)
+        with pytest.raises(ValueError, match="Decrypt cache size"):
+            BWSecretClient(region, "token", decrypt_cache_size=-1)
+    encrypted = EncryptedValue.from_data(ORG_KEY, "text").to_str()
+
+    assert client._decrypt_str(encrypted) == "text"
+    assert client._decrypt_str(encrypted) == "text"
+    assert hooks.events == []
+    assert not client._decrypted
+
+
+def test_failed_request_is_reported(client, hooks):
+    import requests
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = requests.ConnectionError("down")
+        with pytest.raises(SendRequestError):
+            client.get_by_id("a")
+
+    request = hooks.events[-1]
+    assert request.status_code is None
+
+
+def test_auth_reports_identity_request(region):
+    hooks = RecordingHooks()
+    client_token = ClientToken("id", "secret", SymmetricCryptoKey(b"0" * 64))
+    with (
+        patch("requests.post") as mock_post,
+        patch("bws_sdk.token.Auth._save_identity"),
+    ):
+        mock_post.return_value = MagicMock(
+            status_code=200,
+            json=MagicMock(
+                return_value={"access_token": "t", "encrypted_payload": "p"}
+            ),
+        )
+        Auth(client_token, region, hooks=hooks)
+
+    request, auth = hooks.events
+    assert request.operation == "identity_request"
+    assert request.status_code == 200
+    assert isinstance(auth, AuthMetrics)
+    assert auth.source == "identity_request"
+    assert auth.success is True
+
+
+def test_auth_reports_failure(region):
+    hooks = RecordingHooks()
+    client_token = ClientToken("id", "secret", SymmetricCryptoKey(b"0" * 64))
+    with patch("requests.post") as mock_post:
+        mock_post.return_value = MagicMock(status_code=401, text="no")
+        with pytest.raises(Exception):
+            Auth(client_token, region, hooks=hooks)
+
+    request, auth = hooks.events
+    assert request.status_code == 401
+    assert auth.success is False
+
+
+def test_prometheus_render():
+    hooks = PrometheusHooks()
+    hooks.on_request(
+        RequestMetrics(
+            operation="sync",
+            method="GET",
+            url="u",
+            status_code=200,
+            elapsed=0.5,
+            ratelimit_remaining=7,
+            content_bytes=1000,
+            wire_bytes=250,
+        )
+    )
+    hooks.on_request(
+        RequestMetrics(
+            operation="sync",
+            method="GET",
+            url="u",
+            status_code=None,
+            elapsed=0.25,
+            retries=1,
+        )
+    )
+    hooks.on_auth(AuthMetrics(source="state_file", elapsed=0.1, success=True))
+    hooks.on_decrypt(DecryptMetrics(operation="sync", count=3, decrypt_seconds=0.2))
+    hooks.on_cache("store", True)
+    hooks.on_cache("store", False)
+    hooks.on_cache("store", True)
+
+    text = hooks.render()
+
+    assert "# TYPE bws_sdk_requests_total counter" in text
+    assert 'bws_sdk_requests_total{operation="sync",status="200"} 1' in text
+    assert 'bws_sdk_requests_total{operation="sync",status="error"} 1' in text
+    assert 'bws_sdk_request_seconds_sum{operation="sync"} 0.75' in text
+    assert 'bws_sdk_request_seconds_count{operation="sync"} 2' in text
+    assert 'bws_sdk_request_retries_total{operation="sync"} 1' in text
+    assert "bws_sdk_ratelimit_remaining 7" in text
+    assert 'bws_sdk_response_bytes_total{operation="sync"} 1000' in text
+    assert 'bws_sdk_response_wire_bytes_total{operation="sync"} 250' in text
+    assert 'bws_sdk_auth_total{source="state_file",success="true"} 1' in text
+    assert 'bws_sdk_decrypted_secrets_total{operation="sync"} 3' in text
+    assert 'bws_sdk_cache_hits_total{cache="store"} 2' in text
+    assert 'bws_sdk_cache_misses_total{cache="store"} 1' in text
+
+
+def test_logging_hooks(caplog):
+    hooks = LoggingHooks(level=logging.INFO)
+    with caplog.at_level(logging.INFO, logger="bws_sdk.hooks"):
+        hooks.on_request(
+            RequestMetrics(
+                operation="sync", method="GET", url="u", status_code=200, elapsed=0.5
+            )
+        )
+        hooks.on_cache("store", False)
+
+    assert "bws request sync GET u -> 200" in caplog.text
+    assert "bws cache store miss" in caplog.text
@@ -0,0 +1,52 @@
+import json
+import subprocess
+import sys
+
+import pytest
+
+HEAVY_MODULES = ["cryptography", "jwt", "pydantic", "requests"]
+
+
+def loaded_after(statement):
+    code = (
+        "import json, sys\n"
+        f"{statement}\n"
+        f"print(json.dumps([m for m in {HEAVY_MODULES!r} if m in sys.modules]))"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout)
+
+
+def test_import_package_is_lazy():
+    assert loaded_after("import bws_sdk") == []
+
+
+def test_import_errors_is_lazy():
+    assert loaded_after("from bws_sdk import BWSSDKError, ApiError") == []
+
+
+def test_accessing_client_defers_auth_dependencies():
+    loaded = loaded_after("from bws_sdk import BWSecretClient")
+    assert "jwt" not in loaded
+    assert "cryptography" not in loaded
+
+
+def test_lazy_attributes_resolve():
+    import bws_sdk
+    from bws_sdk.client import BWSecretClient
+    from bws_sdk.store import SecretStore
+
+    assert bws_sdk.BWSecretClient is BWSecretClient
+    assert bws_sdk.SecretStore is SecretStore
+    assert "Region" in dir(bws_sdk)
+    for name in bws_sdk.__all__:
+        assert getattr(bws_sdk, name) is not None
+
+
+def test_unknown_attribute_raises():
+    import bws_sdk
+
+    with pytest.raises(AttributeError, match="has no attribute 'Missing'"):
+        bws_sdk.Missing
@@ -0,0 +1,206 @@
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from bws_sdk.bws_types import Region
+from bws_sdk.client import BWSecretClient
+from bws_sdk.errors import SendRequestError
+from bws_sdk.pool import ClientPool
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def fake_auth(*args, **kwargs):
+    auth = MagicMock()
+    auth.bearer_token = "test_token"
+    auth.expires_at = datetime.now(timezone.utc) + timedelta(hours=1)
+    return auth
+
+
+@pytest.fixture
+def region():
+    return Region(api_url="https://api.test.com", identity_url="https://id.test.com")
+
+
+@pytest.fixture
+def clock():
+    return FakeClock()
+
+
+@pytest.fixture
+def mock_auth():
+    with patch("bws_sdk.client.Auth.from_token", side_effect=fake_auth) as mock:
+        yield mock
+
+
+@pytest.fixture
+def pool(region, clock, mock_auth):
+    return ClientPool(region, max_clients=2, idle_timeout=60, clock=clock)
+
+
+@pytest.mark.parametrize(
+    "kwargs",
+    [{"max_clients": 0}, {"idle_timeout": 0}, {"refresh_margin": -1}],
+)
+def test_invalid_parameters(region, kwargs):
+    with pytest.raises(ValueError):
+        ClientPool(region, **kwargs)
+
+
+def test_invalid_region():
+    with pytest.raises(ValueError, match="Region must be an instance"):
+        ClientPool("region")
+
+
+def test_same_token_returns_same_client(pool, mock_auth):
+    client = pool.get("token_a")
+
+    assert isinstance(client, BWSecretClient)
+    assert pool.get("token_a") is client
+    assert mock_auth.call_count == 1
+    assert "token_a" in pool
+    assert len(pool) == 1
+
+
+def test_tokens_are_not_held_as_keys(pool):
+    pool.get("token_a")
+
+    assert all("token_a" not in key for key in pool._clients)
+
+
+def test_clients_share_region_connections(pool):
+    client_a = pool.get("token_a")
+    client_b = pool.get("token_b")
+
+    url = "https://api.test.com/secrets/x"
+    assert client_a.session is not client_b.session
+    assert client_a.session.get_adapter(url) is client_b.session.get_adapter(url)
+
+
+def test_other_region_gets_own_connections(pool):
+    other = Region(api_url="https://api.eu.com", identity_url="https://id.eu.com")
+    client_a = pool.get("token_a")
+    client_b = pool.get("token_a", other)
+
+    assert client_a is not client_b
+    assert client_b.region == other
+    assert client_a.session.get_adapter(
+        "https://api.test.com"
+    ) is not client_b.session.get_adapter("https://api.eu.com")
+
+
+def test_least_recently_used_is_evicted(pool, clock):
+    client_a = pool.get("token_a")
+    pool.get("token_b")
+    assert pool.get("token_a") is client_a
+    pool.get("token_c")
+
+    assert "token_a" in pool
+    assert "token_b" not in pool
+    assert "token_c" in pool
+
+
+def test_idle_clients_are_evicted(pool, clock):
+    pool.get("token_a")
+    clock.now = 30
+    pool.get("token_b")
+    clock.now = 61
+
+    assert pool.evict_idle() == 1
+    assert "token_a" not in pool
+    assert "token_b" in pool
+
+
+def test_evict(pool):
+    pool.get("token_a")
+
+    assert pool.evict("token_a")
+    assert not pool.evict("token_a")
+
+
+def test_concurrent_get_authenticates_once(region):
+    started = threading.Event()
+    release = threading.Event()
+
+    def slow_auth(*args, **kwargs):
+        started.set()
+        release.wait(5)
+        return fake_auth()
+
+    with patch("bws_sdk.client.Auth.from_token", side_effect=slow_auth) as mock:
+        pool = ClientPool(region)
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(pool.get("token_a")))
+            for _ in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        started.wait(5)
+        release.set()
+        for thread in threads:
+            thread.join(5)
+
+    assert mock.call_count == 1
+    assert len(results) == 4
+    assert all(client is results[0] for client in results)
+
+
+def test_failed_creation_is_not_cached(region):
+    with patch("bws_sdk.client.Auth.from_token", side_effect=SendRequestError("x")):
+        pool = ClientPool(region)
+        with pytest.raises(SendRequestError):
+            pool.get("token_a")
+
+    assert len(pool) == 0
+    assert pool._pending == {}
+
+
+def test_state_files_are_named_by_fingerprint(region, mock_auth, tmp_path):
+    pool = ClientPool(region, state_dir=str(tmp_path))
+    pool.get("token_a")
+
+    state_file = mock_auth.call_args.args[2]
+    assert state_file.startswith(str(tmp_path))
+    assert "token_a" not in state_file
+
+
+def test_refresh_tokens_refreshes_expiring(pool):
+    client_a = pool.get("token_a")
+    client_b = pool.get("token_b")
+    client_a.auth.expires_at = datetime.now(timezone.utc) + timedelta(seconds=30)
+
+    assert pool.refresh_tokens() == 1
+    client_a.auth.refresh.assert_called_once()
+    client_b.auth.refresh.assert_not_called()
+
+
+def test_refresh_failure_is_logged(pool, caplog):
+    client = pool.get("token_a")
+    client.auth.expires_at = datetime.now(timezone.utc)
+    client.auth.refresh.side_effect = SendRequestError("down")
+
+    assert pool.refresh_tokens() == 0
+    assert "Failed to refresh bearer token" in caplog.text
+
+
+def test_start_and_stop(pool):
+    pool.start(interval=0.01)
+    pool.start(interval=0.01)
+    pool.stop(timeout=1)
+    assert pool._thread is None
+
+
+def test_close_drops_clients(pool):
+    pool.get("token_a")
+    pool.close()
+
+    assert len(pool) == 0
@@ -0,0 +1,99 @@
+import os
+from datetime import datetime
+from unittest.mock import MagicMock
+
+import pytest
+
+from bws_sdk.bws_types import BitwardenSecret, BitwardenSync, RatelimitInfo
+from bws_sdk.client import BWSecretClient
+from bws_sdk.errors import ProjectionError
+from bws_sdk.projection import SecretProjection, write_atomic
+
+
+def secret(secret_id, key, value):
+    return BitwardenSecret(
+        id=secret_id,
+        organizationId="org",
+        key=key,
+        value=value,
+        creationDate=datetime(2024, 1, 1),
+        revisionDate=datetime(2024, 1, 1),
+    )
+
+
+@pytest.fixture
+def client():
+    client = MagicMock(spec=BWSecretClient)
+    client.sync.return_value = BitwardenSync(
+        secrets=[
+            secret("id-1", "DB_PASSWORD", "hunter2"),
+            secret("id-2", "TLS_KEY", "-----BEGIN KEY-----"),
+            secret("id-3", "DUPLICATE", "a"),
+            secret("id-4", "DUPLICATE", "b"),
+        ],
+        ratelimit=RatelimitInfo(limit="1m", remaining=10, reset=datetime(2024, 1, 1)),
+    )
+    return client
+
+
+def test_invalid_env_name():
+    with pytest.raises(ValueError, match="Environment variable names"):
+        SecretProjection(env={"DB_PASSWORD": ""})
+
+
+def test_apply_uses_one_sync(client, tmp_path):
+    environ = {}
+    projection = SecretProjection(
+        env={"DB_PASSWORD": "PGPASSWORD", "id-3": "FIRST"},
+        files={"id-2": tmp_path / "tls" / "key.pem"},
+        project_ids=["project"],
+    )
+
+    result = projection.apply(client, environ)
+
+    client.sync.assert_called_once()
+    assert client.sync.call_args.args[1] == frozenset({"project"})
+    assert environ == {"PGPASSWORD": "hunter2", "FIRST": "a"}
+    assert result.env == environ
+    assert result.written == [str(tmp_path / "tls" / "key.pem")]
+    assert (tmp_path / "tls" / "key.pem").read_text() == "-----BEGIN KEY-----"
+    assert (tmp_path / "tls" / "key.pem").stat().st_mode & 0o777 == 0o600
+
+
+def test_unchanged_files_are_not_rewritten(client, tmp_path):
+    path = tmp_path / "key.pem"
+    projection = SecretProjection(files={"TLS_KEY": path})
+    projection.apply(client)
+    mtime = path.stat().st_mtime_ns
+
+    result = projection.apply(client)
+
+    assert result.written == []
+    assert result.unchanged == [str(path)]
+    assert path.stat().st_mtime_ns == mtime
+
+
+def test_missing_secret(client):
+    with pytest.raises(ProjectionError, match="No secret"):
+        SecretProjection(env={"MISSING": "VAR"}).apply(client)
+
+
+def test_ambiguous_key(client):
+    with pytest.raises(ProjectionError, match="several secrets"):
+        SecretProjection(env={"DUPLICATE": "VAR"}).apply(client)
+
+
+def test_empty_projection_sends_no_request(client):
+    assert SecretProjection().apply(client).env == {}
+    client.sync.assert_not_called()
+
+
+def test_write_atomic_replaces_and_cleans_up(tmp_path):
+    path = tmp_path / "file"
+    path.write_bytes(b"old")
+
+    assert write_atomic(path, b"new", 0o640)
+    assert path.read_bytes() == b"new"
+    assert path.stat().st_mode & 0o777 == 0o640
+    assert not write_atomic(path, b"new")
+    assert os.listdir(tmp_path) == ["file"]
@@ -0,0 +1,133 @@
+import json
+import threading
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from bws_sdk.bws_types import BitwardenSyncDiff, RatelimitInfo
+from bws_sdk.errors import APIRateLimitError, SendRequestError
+from bws_sdk.scheduler import SyncScheduler
+from bws_sdk.store import SecretStore
+
+NOW = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+
+
+def ratelimit(remaining, reset_in):
+    return RatelimitInfo(
+        limit="1m", remaining=remaining, reset=NOW + timedelta(seconds=reset_in)
+    )
+
+
+@pytest.fixture
+def store():
+    store = MagicMock(spec=SecretStore)
+    store.ratelimit = None
+    return store
+
+
+@pytest.fixture
+def scheduler(store):
+    return SyncScheduler(
+        store, min_interval=5, max_interval=60, growth=2, jitter=0, headroom=1
+    )
+
+
+def test_scheduler_requires_store():
+    with pytest.raises(ValueError, match="Store must be an instance"):
+        SyncScheduler("store")
+
+
+def test_scheduler_rejects_invalid_intervals(store):
+    with pytest.raises(ValueError, match="Intervals"):
+        SyncScheduler(store, min_interval=10, max_interval=5)
+
+
+def test_quiet_polls_grow_interval_until_max(scheduler):
+    delays = [scheduler.next_delay(False, None, NOW) for _ in range(5)]
+    assert delays == [10, 20, 40, 60, 60]
+
+
+def test_changes_reset_interval_to_min(scheduler):
+    scheduler.next_delay(False, None, NOW)
+    scheduler.next_delay(False, None, NOW)
+    assert scheduler.next_delay(True, None, NOW) == 5
+
+
+def test_low_quota_stretches_interval(scheduler):
+    # 10 requests left for the next 120 seconds -> at most one every 12 seconds
+    assert scheduler.next_delay(True, ratelimit(10, 120), NOW) == 12
+
+
+def test_exhausted_quota_waits_for_reset(scheduler):
+    assert scheduler.next_delay(True, ratelimit(0, 45), NOW) == 45
+
+
+def test_missing_ratelimit_headers_are_ignored(scheduler):
+    info = RatelimitInfo(
+        limit="1m", remaining=0, reset=datetime(1970, 1, 1, tzinfo=timezone.utc)
+    )
+    assert scheduler.next_delay(True, info, NOW) == 5
+
+
+def test_errors_back_off_exponentially(scheduler):
+    scheduler.max_error_backoff = 30
+    delays = [scheduler.error_delay(SendRequestError("down"), NOW) for _ in range(4)]
+    assert delays == [5, 10, 20, 30]
+    scheduler.next_delay(True, None, NOW)
+    assert scheduler.error_delay(SendRequestError("down"), NOW) == 5
+
+
+def test_rate_limit_error_waits_for_reset(scheduler, store):
+    store.ratelimit = ratelimit(0, 50)
+    assert scheduler.error_delay(APIRateLimitError("slow down"), NOW) == 50
+
+
+def test_jitter_stays_within_bounds(store):
+    scheduler = SyncScheduler(store, min_interval=10, jitter=0.2)
+    for _ in range(50):
+        assert 8 <= scheduler.next_delay(True, None) <= 12
+
+
+def test_run_once_refreshes_store(scheduler, store):
+    store.refresh.return_value = BitwardenSyncDiff()
+    assert scheduler.run_once() == 10
+    store.refresh.side_effect = SendRequestError("down")
+    assert scheduler.run_once() == 5
+
+
+def test_run_once_backs_off_on_unexpected_errors(scheduler, store, caplog):
+    store.refresh.side_effect = json.JSONDecodeError("Expecting value", "<html>", 0)
+    assert scheduler.run_once() == 5
+    assert scheduler.run_once() == 10
+    assert "Unexpected error during secret sync" in caplog.text
+    assert "JSONDecodeError" in caplog.text
+
+
+def test_polling_continues_after_unexpected_error(scheduler, store):
+    scheduler.error_backoff = 0.01
+    polled = threading.Event()
+    outcomes = [RuntimeError("boom"), BitwardenSyncDiff()]
+
+    def refresh():
+        result = outcomes.pop(0)
+        if not outcomes:
+            polled.set()
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    store.refresh.side_effect = refresh
+    scheduler.start()
+    try:
+        assert polled.wait(timeout=5)
+    finally:
+        scheduler.stop(timeout=5)
+    assert store.refresh.call_count == 2
+
+
+def test_start_and_stop(scheduler, store):
+    store.refresh.return_value = BitwardenSyncDiff()
+    scheduler.start()
+    scheduler.stop(timeout=5)
+    store.refresh.assert_called()
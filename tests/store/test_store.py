@@ -0,0 +1,288 @@
+from datetime import datetime, timezone
+from unittest.mock import MagicMock
+
+import pytest
+
+from bws_sdk.bws_types import (
+    BitwardenProject,
+    BitwardenSecret,
+    BitwardenSync,
+    BitwardenSyncDiff,
+    RatelimitInfo,
+)
+from bws_sdk.client import BWSecretClient
+from bws_sdk.compact import CompactSecretTable
+from bws_sdk.errors import SecretNotFoundError, SecretParseError
+from bws_sdk.store import SecretStore
+
+RATELIMIT = RatelimitInfo(
+    limit="1m", remaining=100, reset=datetime(2023, 1, 1, tzinfo=timezone.utc)
+)
+
+
+def make_secret(secret_id, value="value", revision=1, projects=()):
+    return BitwardenSecret(
+        id=secret_id,
+        organizationId="org_id",
+        key=f"key_{secret_id}",
+        value=value,
+        creationDate=datetime(2023, 1, 1, tzinfo=timezone.utc),
+        revisionDate=datetime(2023, 1, revision, tzinfo=timezone.utc),
+        projects=[BitwardenProject(id=pid) for pid in projects],
+    )
+
+
+@pytest.fixture
+def client():
+    return MagicMock(spec=BWSecretClient)
+
+
+def sync_result(*secrets):
+    return BitwardenSync(secrets=list(secrets), ratelimit=RATELIMIT)
+
+
+def test_store_requires_client():
+    with pytest.raises(ValueError, match="Client must be an instance"):
+        SecretStore("not a client")
+
+
+def test_initial_refresh_reports_everything_as_added(client):
+    client.sync.return_value = sync_result(make_secret("a"), make_secret("b"))
+    store = SecretStore(client)
+
+    diff = store.refresh()
+
+    assert [s.id for s in diff.added] == ["a", "b"]
+    assert diff.modified == [] and diff.removed == []
+    assert len(store) == 2
+    assert store.get("a").value == "value"
+    assert store.last_synced is not None
+
+
+def test_refresh_detects_modified_and_removed(client):
+    client.sync.return_value = sync_result(make_secret("a"), make_secret("b"))
+    store = SecretStore(client)
+    store.refresh()
+
+    client.sync.return_value = sync_result(
+        make_secret("a", value="rotated", revision=2), make_secret("c")
+    )
+    diff = store.refresh()
+
+    assert [s.id for s in diff.added] == ["c"]
+    assert [s.value for s in diff.modified] == ["rotated"]
+    assert [s.id for s in diff.removed] == ["b"]
+    assert "b" not in store
+
+
+def test_refresh_without_changes_keeps_state(client):
+    client.sync.return_value = sync_result(make_secret("a"))
+    store = SecretStore(client)
+    store.refresh()
+    callback = MagicMock()
+    store.subscribe(callback)
+
+    client.sync.return_value = BitwardenSync(secrets=None, ratelimit=RATELIMIT)
+    diff = store.refresh()
+
+    assert not diff
+    assert "a" in store
+    callback.assert_not_called()
+
+
+def test_subscribers_receive_only_changed_secrets(client):
+    client.sync.return_value = sync_result(make_secret("a"), make_secret("b"))
+    store = SecretStore(client)
+    store.refresh()
+
+    everything = MagicMock()
+    only_a = MagicMock()
+    only_b = MagicMock()
+    store.subscribe(everything)
+    store.subscribe(only_a, secret_ids=["a"])
+    store.subscribe(only_b, secret_ids=["b"])
+
+    client.sync.return_value = sync_result(
+        make_secret("a", revision=2), make_secret("b")
+    )
+    store.refresh()
+
+    everything.assert_called_once()
+    only_a.assert_called_once()
+    diff = only_a.call_args.args[0]
+    assert isinstance(diff, BitwardenSyncDiff)
+    assert [s.id for s in diff.modified] == ["a"]
+    only_b.assert_not_called()
+
+
+def test_unsubscribe_and_failing_callback(client):
+    client.sync.return_value = sync_result(make_secret("a"))
+    store = SecretStore(client)
+    failing = MagicMock(side_effect=RuntimeError("boom"))
+    removed = MagicMock()
+    after = MagicMock()
+    store.subscribe(failing)
+    unsubscribe = store.subscribe(removed)
+    store.subscribe(after)
+    unsubscribe()
+
+    store.refresh()
+
+    failing.assert_called_once()
+    removed.assert_not_called()
+    after.assert_called_once()
+
+
+def test_subsequent_refresh_uses_last_synced(client):
+    client.sync.return_value = sync_result(make_secret("a"))
+    store = SecretStore(client)
+    store.refresh()
+    first_synced = store.last_synced
+
+    store.refresh()
+
+    assert client.sync.call_args_list[0].args[0] == datetime(
+        1970, 1, 1, tzinfo=timezone.utc
+    )
+    assert client.sync.call_args_list[1].args[0] == first_synced
+
+
+def test_refresh_is_incremental(client):
+    client.sync.return_value = sync_result(make_secret("a"), make_secret("b"))
+    store = SecretStore(client)
+    store.refresh()
+
+    client.sync.return_value = BitwardenSync(
+        secrets=[make_secret("c")], ratelimit=RATELIMIT, unchanged=["a"], removed=["b"]
+    )
+    diff = store.refresh()
+
+    revisions = client.sync.call_args.kwargs["revisions"]
+    assert revisions == {
+        "a": make_secret("a").revisionDate,
+        "b": make_secret("b").revisionDate,
+    }
+    assert [s.id for s in diff.added] == ["c"]
+    assert [s.id for s in diff.removed] == ["b"]
+    assert diff.modified == []
+    assert sorted(s.id for s in store.secrets()) == ["a", "c"]
+
+
+def test_compact_store(client):
+    client.sync.return_value = sync_result(
+        make_secret("a", projects=["p1"]), make_secret("b"), make_secret("c")
+    )
+    store = SecretStore(client, compact=True)
+    store.refresh()
+
+    client.sync.return_value = BitwardenSync(
+        secrets=[make_secret("c", value="new", revision=2), make_secret("d")],
+        ratelimit=RATELIMIT,
+        unchanged=["a"],
+        removed=["b"],
+    )
+    diff = store.refresh()
+
+    assert client.sync.call_args.kwargs["revisions"].keys() == {"a", "b", "c"}
+    assert [s.id for s in diff.added] == ["d"]
+    assert [s.id for s in diff.modified] == ["c"]
+    assert diff.removed == [make_secret("b")]
+    assert isinstance(store._secrets, CompactSecretTable)
+    assert store.get("c").value == "new"
+    assert store.get("a") == make_secret("a", projects=["p1"])
+    assert [s.id for s in store.list_by_project("p1")] == ["a"]
+    assert len(store) == 3 and "b" not in store
+
+
+def test_project_filter_is_passed_to_sync(client):
+    client.sync.return_value = sync_result(make_secret("a", projects=["p1"]))
+    store = SecretStore(client, project_ids=["p1"])
+    store.refresh()
+
+    assert client.sync.call_args.args[1] == frozenset({"p1"})
+
+
+def test_project_index_follows_sync(client):
+    client.sync.return_value = sync_result(
+        make_secret("a", projects=["p1"]),
+        make_secret("b", projects=["p1", "p2"]),
+        make_secret("c", projects=["p2"]),
+    )
+    store = SecretStore(client)
+    store.refresh()
+
+    assert sorted(s.id for s in store.list_by_project("p1")) == ["a", "b"]
+    assert sorted(s.id for s in store.list_by_project("p2")) == ["b", "c"]
+    assert store.list_by_project("p3") == []
+
+    client.sync.return_value = sync_result(
+        make_secret("a", projects=["p2"], revision=2)
+    )
+    store.refresh()
+
+    assert store.list_by_project("p1") == []
+    assert [s.id for s in store.list_by_project("p2")] == ["a"]
+
+
+def test_typed_accessors_parse_once_per_revision(client):
+    client.sync.return_value = sync_result(
+        make_secret("a", value='{"port": 5432}'),
+        make_secret("b", value=" 42 "),
+        make_secret("c", value="Yes"),
+        make_secret("d", value="aGVsbG8="),
+    )
+    client.hooks = MagicMock()
+    store = SecretStore(client)
+    store.refresh()
+
+    config = store.get_json("a")
+    assert config == {"port": 5432}
+    assert store.get_json("key_a") is config
+    assert store.get_int("b") == 42
+    assert store.get_bool("key_c") is True
+    assert store.get_bytes("d") == b"hello"
+    assert [c.args for c in client.hooks.on_cache.call_args_list] == [
+        ("parsed", False),
+        ("parsed", True),
+        ("parsed", False),
+        ("parsed", False),
+        ("parsed", False),
+    ]
+
+    client.sync.return_value = sync_result(
+        make_secret("a", value='{"port": 6432}', revision=2)
+    )
+    store.refresh()
+
+    assert store.get_json("a") == {"port": 6432}
+
+
+def test_typed_accessors_errors(client):
+    client.sync.return_value = sync_result(
+        make_secret("a", value="not json"), make_secret("b"), make_secret("c")
+    )
+    store = SecretStore(client)
+    store.refresh()
+    store._secrets["c"] = make_secret("c").model_copy(update={"key": "key_b"})
+
+    with pytest.raises(SecretParseError, match="not a valid json"):
+        store.get_json("a")
+    with pytest.raises(SecretParseError, match="not a valid int"):
+        store.get_int("a")
+    with pytest.raises(SecretParseError, match="not a valid bool"):
+        store.get_bool("a")
+    with pytest.raises(SecretParseError, match="not a valid bytes"):
+        store.get_bytes("a")
+    with pytest.raises(SecretNotFoundError):
+        store.get_int("missing")
+    with pytest.raises(ValueError, match="refer to it by id"):
+        store.get_int("key_b")
+
+
+def test_typed_accessors_compact(client):
+    client.sync.return_value = sync_result(make_secret("a", value="[1, 2]"))
+    store = SecretStore(client, compact=True)
+    store.refresh()
+
+    assert store.get_json("key_a") == [1, 2]
+    assert store.get_json("key_a") is store.get_json("a")
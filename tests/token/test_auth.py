@@ -7,7 +7,7 @@ import pytest
 
 from bws_sdk.bws_types import Region
 from bws_sdk.crypto import SymmetricCryptoKey
-from bws_sdk.errors import InvalidIdentityResponseError
+from bws_sdk.errors import InvalidIdentityResponseError, UnauthorisedTokenError
 from bws_sdk.token import Auth, ClientToken
 
 
@@ -66,6 +66,7 @@ def test_auth_initialization(client_token, region):
                 "Accept": "application/json",
                 "Device-Type": "21",
             },
+            timeout=30.0,
         )
 
         mock_open.assert_not_called()
@@ -186,6 +187,7 @@ def test_auth_initialization_state_file_invalid(client_token, region, invalid_da
                 "Accept": "application/json",
                 "Device-Type": "21",
             },
+            timeout=30.0,
         )
 
         assert auth.state_file == Path(state_file.name)
@@ -266,4 +268,21 @@ def test_auth_initialization_invalid_identity_response(
                 "Accept": "application/json",
                 "Device-Type": "21",
             },
+            timeout=30.0,
         )
+
+
+def test_auth_identity_request_uses_transport(client_token, region):
+    transport = MagicMock()
+    transport.post.return_value.status_code = 401
+    transport.post.return_value.text = "invalid_client"
+    with (
+        patch("requests.post") as mock_post,
+        pytest.raises(UnauthorisedTokenError),
+    ):
+        Auth(client_token=client_token, region=region, transport=transport)
+
+    mock_post.assert_not_called()
+    headers = transport.post.call_args.kwargs["headers"]
+    assert headers["Authorization"] is None
+    assert headers["Device-Type"] == "21"
@@ -1,8 +1,11 @@
+import hashlib
+from unittest.mock import MagicMock, patch
+
 import pytest
 
-from bws_sdk.crypto import SymmetricCryptoKey
-from bws_sdk.errors import InvalidTokenError
-from bws_sdk.token import ClientToken
+from bws_sdk.crypto import EncryptedValue, SymmetricCryptoKey
+from bws_sdk.errors import HmacError, InvalidTokenError
+from bws_sdk.token import Auth, ClientToken, _KeyCache, _token_keys, clear_key_caches
 
 
 def test_client_token():
@@ -33,3 +36,85 @@ def test_client_token_invalid_token_format():
     token_str = "0.test_client_id.test_client_secret:b'MDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDAwMDA="
     with pytest.raises(InvalidTokenError, match="Invalid Token"):
         ClientToken.from_str(token_str)
+
+
+TOKEN = "0.test_client_id.test_client_secret:MDAwMDAwMDAwMDAwMDAwMA=="
+
+
+@pytest.fixture
+def empty_caches():
+    clear_key_caches()
+    yield
+    clear_key_caches()
+
+
+def test_from_str_caches_derived_key(empty_caches):
+    with patch.object(
+        SymmetricCryptoKey,
+        "from_encryption_key",
+        wraps=SymmetricCryptoKey.from_encryption_key,
+    ) as mock_derive:
+        first = ClientToken.from_str(TOKEN)
+        second = ClientToken.from_str(TOKEN)
+
+    assert first is not second
+    assert first.encryption_key is second.encryption_key
+    mock_derive.assert_called_once()
+
+
+def test_token_cache_holds_only_fingerprints(empty_caches):
+    ClientToken.from_str(TOKEN)
+
+    (fingerprint,) = _token_keys._entries
+    assert fingerprint == hashlib.sha256(b"0" * 16).digest()
+    assert TOKEN not in repr(_token_keys._entries.keys())
+
+
+def test_token_cache_does_not_hold_client_secret(empty_caches):
+    token = ClientToken.from_str(TOKEN)
+
+    for key in _token_keys._entries.values():
+        assert isinstance(key, SymmetricCryptoKey)
+        assert set(vars(key)) == {"key", "mac_key"}
+        assert token.client_secret.encode() not in key.key + key.mac_key
+
+
+def test_invalid_token_is_not_cached(empty_caches):
+    with pytest.raises(InvalidTokenError):
+        ClientToken.from_str("1.id.secret:MDAwMDAwMDAwMDAwMDAwMA==")
+    assert not _token_keys._entries
+
+
+def test_key_cache_is_bounded():
+    cache = _KeyCache(2)
+    for i in range(3):
+        cache.put(bytes([i]), i)
+    cache.get(bytes([1]))
+    cache.put(bytes([3]), 3)
+
+    assert list(cache._entries) == [bytes([1]), bytes([3])]
+
+
+def test_org_key_is_decrypted_once_per_payload(empty_caches):
+    hooks = MagicMock()
+    with patch.object(Auth, "_authenticate"):
+        auth = Auth(ClientToken.from_str(TOKEN), MagicMock(), hooks=hooks)
+        other = Auth(
+            ClientToken("id", "secret", SymmetricCryptoKey(b"1" * 64)), MagicMock()
+        )
+    payload = EncryptedValue.from_data(
+        auth.client_token.encryption_key, '{"encryptionKey": "' + "A" * 86 + '=="}'
+    ).to_str()
+
+    with patch.object(Auth, "_decrypt_org_key", wraps=auth._decrypt_org_key) as mock:
+        assert auth._parse_enc_org_key(payload) == SymmetricCryptoKey(bytes(64))
+        assert auth._parse_enc_org_key(payload) == SymmetricCryptoKey(bytes(64))
+        mock.assert_called_once_with(payload)
+    # A different token key never shares the cached result
+    with pytest.raises(HmacError):
+        other._parse_enc_org_key(payload)
+
+    assert [c.args for c in hooks.on_cache.call_args_list] == [
+        ("org_key", False),
+        ("org_key", True),
+    ]
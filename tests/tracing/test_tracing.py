@@ -0,0 +1,193 @@
+import subprocess
+import sys
+from datetime import datetime
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+
+from bws_sdk.bws_types import Region
+from bws_sdk.client import BWSecretClient
+from bws_sdk.crypto import EncryptedValue, SymmetricCryptoKey
+from bws_sdk.errors import SendRequestError, UnauthorisedTokenError
+from bws_sdk.token import Auth, ClientToken
+from bws_sdk.tracing import Tracing
+
+otel_sdk = pytest.importorskip("opentelemetry.sdk.trace")
+from opentelemetry.sdk.trace.export import SimpleSpanProcessor  # noqa: E402
+from opentelemetry.sdk.trace.export.in_memory_span_exporter import (  # noqa: E402
+    InMemorySpanExporter,
+)
+from opentelemetry.trace import StatusCode  # noqa: E402
+
+ORG_KEY = SymmetricCryptoKey(b"0" * 64)
+
+
+def encrypted_secret(secret_id):
+    return {
+        "id": secret_id,
+        "organizationId": "org_id",
+        "key": EncryptedValue.from_data(ORG_KEY, f"key_{secret_id}").to_str(),
+        "value": EncryptedValue.from_data(ORG_KEY, "value").to_str(),
+        "creationDate": "2023-01-01T00:00:00Z",
+        "revisionDate": "2023-01-01T00:00:00Z",
+    }
+
+
+def response(status_code, body, remaining="42"):
+    mock_response = Mock()
+    mock_response.status_code = status_code
+    mock_response.json.return_value = body
+    mock_response.content = b"x" * 10
+    mock_response.raw.tell.return_value = 4
+    headers = {"x-rate-limit-remaining": remaining} if remaining else {}
+    mock_response.headers.get = lambda k, d=None: headers.get(k, d)
+    return mock_response
+
+
+@pytest.fixture
+def region():
+    return Region(api_url="https://api.test.com", identity_url="https://id.test.com")
+
+
+@pytest.fixture
+def exporter():
+    return InMemorySpanExporter()
+
+
+@pytest.fixture
+def tracer(exporter):
+    provider = otel_sdk.TracerProvider()
+    provider.add_span_processor(SimpleSpanProcessor(exporter))
+    return provider.get_tracer("bws_sdk")
+
+
+@pytest.fixture
+def client(region, tracer):
+    with patch("bws_sdk.client.Auth.from_token") as mock_auth:
+        mock_auth.return_value.bearer_token = "test_token"
+        mock_auth.return_value.org_id = "org_id"
+        mock_auth.return_value.org_enc_key = ORG_KEY
+        client = BWSecretClient(region, "access_token", tracer=tracer)
+        mock_auth.assert_called_once_with(
+            "access_token",
+            region,
+            None,
+            hooks=None,
+            tracer=tracer,
+            transport=None,
+            request_timeout=30.0,
+        )
+        return client
+
+
+def spans_by_name(exporter):
+    return {span.name: span for span in exporter.get_finished_spans()}
+
+
+def test_invalid_tracer():
+    with pytest.raises(ValueError, match="Tracer must provide start_as_current_span"):
+        Tracing(object())
+
+
+def test_get_by_id_spans(client, exporter):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(200, encrypted_secret("a"))
+        client.get_by_id("a")
+
+    spans = spans_by_name(exporter)
+    assert set(spans) == {"bws.get_by_id", "bws.http GET", "bws.decrypt"}
+    operation = spans["bws.get_by_id"]
+    assert operation.attributes["bws.secret.id"] == "a"
+    assert operation.attributes["bws.secret.count"] == 1
+
+    http = spans["bws.http GET"]
+    assert http.parent.span_id == operation.context.span_id
+    assert http.attributes["url.full"] == "https://api.test.com/secrets/a"
+    assert http.attributes["http.response.status_code"] == 200
+    assert http.attributes["bws.payload_bytes"] == 10
+    assert http.attributes["bws.wire_bytes"] == 4
+    assert http.attributes["bws.ratelimit.remaining"] == 42
+
+    decrypt = spans["bws.decrypt"]
+    assert decrypt.parent.span_id == operation.context.span_id
+    assert decrypt.attributes["bws.operation"] == "get_by_id"
+
+
+def test_sync_span_counts_secrets(client, exporter):
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.return_value = response(
+            200,
+            {
+                "hasChanges": True,
+                "secrets": {"data": [encrypted_secret("a"), encrypted_secret("b")]},
+            },
+        )
+        client.sync(datetime(2023, 1, 1))
+
+    sync = spans_by_name(exporter)["bws.sync"]
+    assert sync.attributes["bws.sync.has_changes"] is True
+    assert sync.attributes["bws.secret.count"] == 2
+    assert sync.attributes["bws.last_synced_date"] == "2023-01-01T00:00:00"
+
+
+def test_failed_request_marks_span(client, exporter):
+    import requests
+
+    with patch.object(client.session, "get") as mock_get:
+        mock_get.side_effect = requests.ConnectionError("down")
+        with pytest.raises(SendRequestError):
+            client.get_by_id("a")
+
+    spans = spans_by_name(exporter)
+    assert spans["bws.http GET"].status.status_code == StatusCode.ERROR
+    assert spans["bws.get_by_id"].status.status_code == StatusCode.ERROR
+
+
+def test_auth_spans(region, tracer, exporter):
+    client_token = MagicMock(spec=ClientToken)
+    client_token.access_token_id = "id"
+    client_token.client_secret = "secret"
+    with (
+        patch("requests.post") as mock_post,
+        patch.object(Auth, "_save_identity") as mock_save,
+    ):
+        mock_post.return_value = response(
+            200, {"access_token": "t", "encrypted_payload": "p"}, remaining="7"
+        )
+        Auth(client_token, region, tracer=tracer)
+
+    mock_save.assert_called_once_with("p", "t")
+    (span,) = exporter.get_finished_spans()
+    assert span.name == "bws.identity_request"
+    assert span.attributes["http.response.status_code"] == 200
+    assert span.attributes["bws.payload_bytes"] == 10
+    assert span.attributes["bws.ratelimit.remaining"] == 7
+
+
+def test_failed_auth_marks_span(region, tracer, exporter):
+    client_token = MagicMock(spec=ClientToken)
+    client_token.access_token_id = "id"
+    client_token.client_secret = "secret"
+    with patch("requests.post") as mock_post:
+        mock_post.return_value = response(401, None)
+        mock_post.return_value.text = "invalid_client"
+        with pytest.raises(UnauthorisedTokenError):
+            Auth(client_token, region, tracer=tracer)
+
+    (span,) = exporter.get_finished_spans()
+    assert span.status.status_code == StatusCode.ERROR
+
+
+def test_untraced_client_does_not_import_tracing():
+    code = (
+        "import sys\n"
+        "from unittest.mock import patch\n"
+        "from bws_sdk import BWSecretClient, Region\n"
+        "with patch('bws_sdk.client.Auth.from_token'):\n"
+        "    BWSecretClient(Region(api_url='https://a', identity_url='https://i'), 't')\n"
+        "print('bws_sdk.tracing' in sys.modules)"
+    )
+    result = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert result.stdout.strip() == "False"
@@ -0,0 +1,143 @@
+import gzip
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from bws_sdk.transport import HTTP2Transport
+
+httpx = pytest.importorskip("httpx")
+pytest.importorskip("h2")
+
+
+@pytest.fixture
+def transport():
+    transport = HTTP2Transport()
+    yield transport
+    transport.close()
+
+
+def use_handler(transport, handler):
+    transport._new_client = lambda: httpx.AsyncClient(
+        transport=httpx.MockTransport(handler)
+    )
+
+
+def test_transport_requires_httpx():
+    with (
+        patch.dict(sys.modules, {"httpx": None}),
+        pytest.raises(ImportError, match="httpx\\[http2\\]"),
+    ):
+        HTTP2Transport()
+
+
+def test_transport_validates_arguments():
+    with pytest.raises(ValueError, match="Max connections must be at least 1"):
+        HTTP2Transport(max_connections=0)
+
+
+def test_transport_sends_request_and_converts_response(transport):
+    seen = {}
+
+    def handler(request):
+        seen["request"] = request
+        return httpx.Response(
+            200, json={"ok": True}, headers={"X-Rate-Limit-Remaining": "7"}
+        )
+
+    use_handler(transport, handler)
+    transport.headers.update({"Authorization": "Bearer token", "Device-Type": "21"})
+
+    response = transport.post(
+        "https://api.example.com/secrets",
+        params={"lastSyncedDate": "2024"},
+        json={"ids": ["a"]},
+        headers={"Authorization": None, "Accept": "application/json"},
+    )
+
+    request = seen["request"]
+    assert request.method == "POST"
+    assert request.url.params["lastSyncedDate"] == "2024"
+    assert request.content == b'{"ids":["a"]}'
+    assert "authorization" not in request.headers
+    assert request.headers["device-type"] == "21"
+    assert request.headers["accept"] == "application/json"
+    assert isinstance(response, requests.Response)
+    assert response.status_code == 200
+    assert response.json() == {"ok": True}
+    assert response.headers["x-rate-limit-remaining"] == "7"
+    assert response.url.startswith("https://api.example.com/secrets")
+
+
+def test_transport_reports_received_bytes(transport):
+    body = b'{"data": "' + b"A" * 4000 + b'"}'
+    compressed = gzip.compress(body)
+    use_handler(
+        transport,
+        lambda request: httpx.Response(
+            200,
+            headers={"Content-Encoding": "gzip"},
+            stream=httpx.ByteStream(compressed),
+        ),
+    )
+
+    response = transport.get("https://api.example.com/secrets")
+
+    assert response.content == body
+    assert response.raw.tell() == len(compressed)
+
+
+def test_transport_times_response_headers(transport):
+    use_handler(transport, lambda request: httpx.Response(200, content=b"{}"))
+
+    response = transport.get("https://api.example.com/secrets")
+
+    assert 0 < response.elapsed.total_seconds() < 5
+
+
+@pytest.mark.parametrize(
+    ("error", "expected"),
+    [
+        (httpx.ConnectError("refused"), requests.ConnectionError),
+        (httpx.ReadTimeout("slow"), requests.Timeout),
+        (httpx.RemoteProtocolError("bad frame"), requests.RequestException),
+    ],
+)
+def test_transport_maps_errors(transport, error, expected):
+    def handler(request):
+        raise error
+
+    use_handler(transport, handler)
+    with pytest.raises(expected):
+        transport.get("https://api.example.com/secrets")
+
+
+def test_reset_after_fork_abandons_connections(transport):
+    use_handler(transport, lambda request: httpx.Response(204))
+    assert transport.get("https://api.example.com/").status_code == 204
+    loop, client = transport._loop, transport._client
+
+    with patch.object(client, "aclose") as aclose:
+        transport.reset_after_fork()
+    aclose.assert_not_called()
+    assert transport._loop is None
+
+    # A new event loop and client are started on the next request
+    assert transport.get("https://api.example.com/").status_code == 204
+    assert transport._loop is not loop
+    assert transport._client is not client
+    loop.call_soon_threadsafe(loop.stop)
+
+
+def test_concurrent_requests_from_threads(transport):
+    use_handler(transport, lambda request: httpx.Response(200, text=request.url.path))
+    with ThreadPoolExecutor(8) as pool:
+        paths = list(
+            pool.map(
+                lambda i: transport.get(f"https://api.example.com/{i}").text,
+                range(32),
+            )
+        )
+    assert paths == [f"/{i}" for i in range(32)]